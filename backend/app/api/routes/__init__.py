@@ -5,3 +5,4 @@ from .episodes import router as episodes_router
 from .shorts import router as shorts_router
 from .media import router as media_router
 from .admin import router as admin_router
+from .metrics import router as metrics_router
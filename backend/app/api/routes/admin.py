@@ -1,27 +1,34 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Optional
-
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from sqlalchemy import and_, func, or_, select, text
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterator, Literal, Optional
+
+from botocore.exceptions import ClientError
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import require_admin
-from app.db.session import get_db
+from app.core.cache import single_flight, single_flight_caches
+from app.core.security import (
+    UserContext,
+    invalidate_principal,
+    principal_cache_stats,
+    require_admin,
+    token_cache_stats,
+)
+from app.db.admin_tables import BulkDeleteTask
+from app.db.pool import pool_stats, pool_status
+from app.db.session import async_engine, engine, get_async_db, get_db
 from app.db.tables import (
-    Credit,
     CreditLog,
     Episode,
     EpisodeMeta,
     EpisodeOutputs,
     Job,
-    OAuth,
     Order,
-    Plan,
-    StoryAsset,
-    StoryShot,
-    StoryTTSSegment,
     User,
 )
 from app.schemas.admin import (
@@ -31,78 +38,104 @@ from app.schemas.admin import (
     AdminOverviewMetrics,
     AdminUser,
     AssetItem,
+    AssetPage,
+    BulkDeleteRequest,
+    BulkDeleteStatus,
     CreditPatch,
     DailyAgg,
     EpisodeDeleteResult,
     Page,
     PlanPatch,
+    PoolStatus,
+    PresignCompleteRequest,
+    PresignedDownload,
+    PresignedPart,
+    PresignUploadRequest,
+    PresignUploadResponse,
     StatusAgg,
 )
 
 from app.core.config import settings
-from app.services.assets import delete_s3_object, list_local_assets, list_s3_objects, parse_s3_url, upload_s3
+from app.services.assets import (
+    ListedAsset,
+    complete_upload,
+    iter_s3_objects,
+    list_s3_page,
+    presigned_get_url,
+    presigned_multipart,
+    presigned_put_url,
+    sign_urls,
+)
+from app.services.asset_index import local_asset_index, local_asset_index_stats
+from app.services.bulk_delete import create_bulk_delete, is_narrowed, run_bulk_delete
+from app.services.counts import TotalMode, count_cache_stats, count_total
+from app.services.episode_cleanup import cascade_delete_episodes, delete_episode_objects
+from app.services.job_stream import job_broadcaster
+from app.services.jobs import job_summary_columns, to_job_summary
+from app.services.media import media_cache_stats
+from app.services.pagination import keyset_before, next_cursor
+from app.services.rollups import rollup_overview
+from app.services.s3_listing import s3_listing_cache
+from app.services.search import SearchMode, search_filter, search_stats
+from app.services.uploads import UploadError, UploadStorageError, stream_to_file, stream_to_s3
+from app.services.users import patch_active, patch_credit, patch_plan, to_admin_user, user_projection
 
 router = APIRouter(dependencies=[Depends(require_admin)])
 # admin-only endpoints
 
 
-def _page(items: list[Any], total: int, limit: int, offset: int) -> Page:
-    return Page(items=items, total=total, limit=limit, offset=offset)
+def _page(
+    items: list[Any],
+    total: int,
+    limit: int,
+    offset: int,
+    cursor: str | None = None,
+    total_exact: bool = True,
+) -> Page:
+    return Page(items=items, total=total, total_exact=total_exact, limit=limit, offset=offset, next_cursor=cursor)
+
+
+def _keyset(created_col: Any, id_col: Any, cursor: str):
+    try:
+        return keyset_before(created_col, id_col, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
 
 
 @router.get("/users", response_model=Page)
-def admin_list_users(
+async def admin_list_users(
     q: str | None = Query(default=None, description="search email/username"),
+    search: SearchMode = Query(default="auto", description="auto|fulltext|contains, or prefix (id/email starts with q)"),
     is_active: int | None = Query(default=None, description="1|0"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description="opaque next_cursor from a previous page (ignores offset)"),
+    total_mode: TotalMode = Query(default="exact", description="exact|cached|estimate"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     where = []
     if q:
-        like = f"%{q}%"
-        where.append(or_(User.email.like(like), User.username.like(like), User.user_id.like(like)))
+        where.append((await search_filter(db, "users", q, search))[0])
     if is_active is not None:
         where.append(User.is_active == is_active)
 
-    base = (
-        select(
-            User.user_id,
-            User.email,
-            User.username,
-            User.is_active,
-            User.created_at,
-            Plan.plan,
-            Credit.credit,
-            OAuth.oauth_provider,
-        )
-        .select_from(User)
-        .outerjoin(Plan, Plan.user_id == User.user_id)
-        .outerjoin(Credit, Credit.user_id == User.user_id)
-        .outerjoin(OAuth, OAuth.user_id == User.user_id)
-    )
+    base = user_projection(User.id)
 
     if where:
         base = base.where(and_(*where))
 
-    total = db.execute(select(func.count()).select_from(base.subquery())).scalar_one()
-    rows = db.execute(base.order_by(User.created_at.desc()).limit(limit).offset(offset)).all()
+    total, total_exact = await count_total(db, User, where, total_mode, key=("users", q, search, is_active))
 
-    items = [
-        AdminUser(
-            user_id=r.user_id,
-            email=r.email,
-            username=r.username,
-            is_active=r.is_active,
-            created_at=r.created_at,
-            plan=r.plan,
-            credit=r.credit,
-            oauth_provider=r.oauth_provider,
-        )
-        for r in rows
-    ]
+    page_q = base.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+    if cursor:
+        page_q = page_q.where(_keyset(User.created_at, User.id, cursor))
+    else:
+        page_q = page_q.offset(offset)
+    rows = (await db.execute(page_q)).all()
+
+    items = [to_admin_user(r) for r in rows]
 
-    return _page(items, total=total, limit=limit, offset=offset)
+    return _page(items, total=total, limit=limit, offset=offset, cursor=next_cursor(rows, limit), total_exact=total_exact)
 
 
 @router.patch("/users/{user_id}/credit", response_model=AdminUser)
@@ -111,54 +144,12 @@ def admin_patch_credit(
     payload: CreditPatch,
     db: Session = Depends(get_db),
 ):
-    u: User | None = db.execute(select(User).where(User.user_id == user_id)).scalar_one_or_none()
-    if not u:
-        raise HTTPException(status_code=404, detail="user not found")
-
-    c: Credit | None = db.execute(select(Credit).where(Credit.user_id == user_id)).scalar_one_or_none()
-    if not c:
-        c = Credit(user_id=user_id, credit=0)
-        db.add(c)
-        db.flush()
-
-    if payload.mode == "set":
-        c.credit = int(payload.amount)
-    elif payload.mode == "add":
-        c.credit = int(c.credit or 0) + int(payload.amount)
-    else:
+    if payload.mode not in ("set", "add"):
         raise HTTPException(status_code=400, detail="mode must be set|add")
-
-    db.commit()
-
-    # return refreshed projection
-    row = db.execute(
-        select(
-            User.user_id,
-            User.email,
-            User.username,
-            User.is_active,
-            User.created_at,
-            Plan.plan,
-            Credit.credit,
-            OAuth.oauth_provider,
-        )
-        .select_from(User)
-        .outerjoin(Plan, Plan.user_id == User.user_id)
-        .outerjoin(Credit, Credit.user_id == User.user_id)
-        .outerjoin(OAuth, OAuth.user_id == User.user_id)
-        .where(User.user_id == user_id)
-    ).one()
-
-    return AdminUser(
-        user_id=row.user_id,
-        email=row.email,
-        username=row.username,
-        is_active=row.is_active,
-        created_at=row.created_at,
-        plan=row.plan,
-        credit=row.credit,
-        oauth_provider=row.oauth_provider,
-    )
+    user = patch_credit(db, user_id, payload.mode, payload.amount)
+    if user is None:
+        raise HTTPException(status_code=404, detail="user not found")
+    return user
 
 
 @router.patch("/users/{user_id}/plan", response_model=AdminUser)
@@ -167,47 +158,10 @@ def admin_patch_plan(
     payload: PlanPatch,
     db: Session = Depends(get_db),
 ):
-    u: User | None = db.execute(select(User).where(User.user_id == user_id)).scalar_one_or_none()
-    if not u:
+    user = patch_plan(db, user_id, payload.plan)
+    if user is None:
         raise HTTPException(status_code=404, detail="user not found")
-
-    p: Plan | None = db.execute(select(Plan).where(Plan.user_id == user_id)).scalar_one_or_none()
-    if not p:
-        p = Plan(user_id=user_id, plan=payload.plan)
-        db.add(p)
-    else:
-        p.plan = payload.plan
-    db.commit()
-
-    # reuse list projection
-    row = db.execute(
-        select(
-            User.user_id,
-            User.email,
-            User.username,
-            User.is_active,
-            User.created_at,
-            Plan.plan,
-            Credit.credit,
-            OAuth.oauth_provider,
-        )
-        .select_from(User)
-        .outerjoin(Plan, Plan.user_id == User.user_id)
-        .outerjoin(Credit, Credit.user_id == User.user_id)
-        .outerjoin(OAuth, OAuth.user_id == User.user_id)
-        .where(User.user_id == user_id)
-    ).one()
-
-    return AdminUser(
-        user_id=row.user_id,
-        email=row.email,
-        username=row.username,
-        is_active=row.is_active,
-        created_at=row.created_at,
-        plan=row.plan,
-        credit=row.credit,
-        oauth_provider=row.oauth_provider,
-    )
+    return user
 
 
 @router.patch("/users/{user_id}/active", response_model=AdminUser)
@@ -216,60 +170,34 @@ def admin_patch_active(
     payload: ActivePatch,
     db: Session = Depends(get_db),
 ):
-    u: User | None = db.execute(select(User).where(User.user_id == user_id)).scalar_one_or_none()
-    if not u:
+    user = patch_active(db, user_id, payload.is_active)
+    if user is None:
         raise HTTPException(status_code=404, detail="user not found")
-
-    u.is_active = int(payload.is_active)
-    db.commit()
-
-    row = db.execute(
-        select(
-            User.user_id,
-            User.email,
-            User.username,
-            User.is_active,
-            User.created_at,
-            Plan.plan,
-            Credit.credit,
-            OAuth.oauth_provider,
-        )
-        .select_from(User)
-        .outerjoin(Plan, Plan.user_id == User.user_id)
-        .outerjoin(Credit, Credit.user_id == User.user_id)
-        .outerjoin(OAuth, OAuth.user_id == User.user_id)
-        .where(User.user_id == user_id)
-    ).one()
-
-    return AdminUser(
-        user_id=row.user_id,
-        email=row.email,
-        username=row.username,
-        is_active=row.is_active,
-        created_at=row.created_at,
-        plan=row.plan,
-        credit=row.credit,
-        oauth_provider=row.oauth_provider,
-    )
+    # lockouts must apply on the user's very next request
+    invalidate_principal(user_id)
+    return user
 
 
 @router.get("/episodes", response_model=Page)
-def admin_list_episodes(
+async def admin_list_episodes(
     q: str | None = Query(default=None, description="search title/episode_id/user_id"),
+    search: SearchMode = Query(default="auto", description="auto|fulltext|contains, or prefix (id/email starts with q)"),
     user_id: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description="opaque next_cursor from a previous page (ignores offset)"),
+    total_mode: TotalMode = Query(default="exact", description="exact|cached|estimate"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     where = []
     if q:
-        like = f"%{q}%"
-        where.append(or_(Episode.episode_id.like(like), Episode.title.like(like), Episode.user_id.like(like)))
+        where.append((await search_filter(db, "episodes", q, search))[0])
     if user_id:
         where.append(Episode.user_id == user_id)
 
     base = (
         select(
+            Episode.id,
             Episode.episode_id,
             Episode.user_id,
             Episode.title,
@@ -286,8 +214,14 @@ def admin_list_episodes(
     if where:
         base = base.where(and_(*where))
 
-    total = db.execute(select(func.count()).select_from(base.subquery())).scalar_one()
-    rows = db.execute(base.order_by(Episode.created_at.desc()).limit(limit).offset(offset)).all()
+    total, total_exact = await count_total(db, Episode, where, total_mode, key=("episodes", q, search, user_id))
+
+    page_q = base.order_by(Episode.created_at.desc(), Episode.id.desc()).limit(limit)
+    if cursor:
+        page_q = page_q.where(_keyset(Episode.created_at, Episode.id, cursor))
+    else:
+        page_q = page_q.offset(offset)
+    rows = (await db.execute(page_q)).all()
 
     items = [
         AdminEpisode(
@@ -302,16 +236,19 @@ def admin_list_episodes(
         )
         for r in rows
     ]
-    return _page(items, total=total, limit=limit, offset=offset)
+    return _page(items, total=total, limit=limit, offset=offset, cursor=next_cursor(rows, limit), total_exact=total_exact)
 
 
 @router.get("/jobs", response_model=Page)
-def admin_list_jobs(
+async def admin_list_jobs(
     status: str | None = Query(default=None, description="comma-separated statuses"),
     job_type: str | None = Query(default=None),
+    view: Literal["full", "summary"] = Query(default="full", description="summary: no result blob, error truncated"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description="opaque next_cursor from a previous page (ignores offset)"),
+    total_mode: TotalMode = Query(default="exact", description="exact|cached|estimate"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     where = []
     if status:
@@ -321,32 +258,51 @@ def admin_list_jobs(
     if job_type:
         where.append(Job.job_type == job_type)
 
-    base = select(Job)
+    base = select(*job_summary_columns()) if view == "summary" else select(Job)
     if where:
         base = base.where(and_(*where))
 
-    total = db.execute(select(func.count()).select_from(base.subquery())).scalar_one()
-    rows = db.execute(base.order_by(Job.created_at.desc()).limit(limit).offset(offset)).scalars().all()
-
-    items = [
-        AdminJob(
-            job_id=j.job_id,
-            job_type=j.job_type,
-            status=j.status,
-            created_at=j.created_at,
-            updated_at=j.updated_at,
-            result=j.result,
-            error=j.error,
-        )
-        for j in rows
-    ]
+    total, total_exact = await count_total(db, Job, where, total_mode, key=("jobs", status, job_type))
 
-    return _page(items, total=total, limit=limit, offset=offset)
+    page_q = base.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
+    if cursor:
+        page_q = page_q.where(_keyset(Job.created_at, Job.id, cursor))
+    else:
+        page_q = page_q.offset(offset)
+    if view == "summary":
+        rows = (await db.execute(page_q)).all()
+        items = [to_job_summary(r) for r in rows]
+    else:
+        rows = (await db.execute(page_q)).scalars().all()
+        items = [
+            AdminJob(
+                job_id=j.job_id,
+                job_type=j.job_type,
+                status=j.status,
+                created_at=j.created_at,
+                updated_at=j.updated_at,
+                result=j.result,
+                error=j.error,
+            )
+            for j in rows
+        ]
+
+    return _page(items, total=total, limit=limit, offset=offset, cursor=next_cursor(rows, limit), total_exact=total_exact)
+
+
+@router.get("/jobs/stream")
+async def admin_stream_jobs(request: Request, job_type: str | None = Query(default=None)):
+    """SSE stream of changed job rows (replaces list/detail polling)."""
+    return StreamingResponse(
+        job_broadcaster.sse(request.is_disconnected, job_type=job_type),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/jobs/{job_id}", response_model=AdminJob)
-def admin_get_job(job_id: str, db: Session = Depends(get_db)):
-    j: Job | None = db.execute(select(Job).where(Job.job_id == job_id)).scalar_one_or_none()
+async def admin_get_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    j: Job | None = (await db.execute(select(Job).where(Job.job_id == job_id))).scalar_one_or_none()
     if not j:
         raise HTTPException(status_code=404, detail="job not found")
     return AdminJob(
@@ -361,39 +317,54 @@ def admin_get_job(job_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/metrics/overview", response_model=AdminOverviewMetrics)
-def admin_metrics_overview(
+@single_flight(
+    "metrics_overview",
+    ttl=settings.metrics_cache_ttl_sec,
+    stale_ttl=settings.metrics_cache_stale_sec,
+    key=("days",),
+)
+async def admin_metrics_overview(
     days: int = Query(default=14, ge=1, le=90),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
+    if settings.metrics_rollups:
+        return await rollup_overview(db, days)
+
     # totals
-    users_total = db.execute(select(func.count()).select_from(User)).scalar_one()
-    users_active = db.execute(select(func.count()).select_from(User).where(User.is_active == 1)).scalar_one()
-    episodes_total = db.execute(select(func.count()).select_from(Episode)).scalar_one()
-    jobs_total = db.execute(select(func.count()).select_from(Job)).scalar_one()
+    users_total = (await db.execute(select(func.count()).select_from(User))).scalar_one()
+    users_active = (await db.execute(select(func.count()).select_from(User).where(User.is_active == 1))).scalar_one()
+    episodes_total = (await db.execute(select(func.count()).select_from(Episode))).scalar_one()
+    jobs_total = (await db.execute(select(func.count()).select_from(Job))).scalar_one()
 
     # grouped counts
-    jobs_by_status_rows = db.execute(select(Job.status, func.count()).group_by(Job.status)).all()
+    jobs_by_status_rows = (await db.execute(select(Job.status, func.count()).group_by(Job.status))).all()
     jobs_by_status = [StatusAgg(status=r[0], count=int(r[1]), amount_sum=None) for r in jobs_by_status_rows]
 
-    orders_by_status_rows = db.execute(
-        select(Order.status, func.count(), func.coalesce(func.sum(Order.amount), 0)).group_by(Order.status)
+    orders_by_status_rows = (
+        await db.execute(
+            select(Order.status, func.count(), func.coalesce(func.sum(Order.amount), 0)).group_by(Order.status)
+        )
     ).all()
     orders_by_status = [StatusAgg(status=r[0], count=int(r[1]), amount_sum=int(r[2] or 0)) for r in orders_by_status_rows]
 
     # daily series (MySQL DATE())
-    orders_daily_rows = db.execute(
-        select(func.date(Order.created_at), func.count(), func.coalesce(func.sum(Order.amount), 0))
-        .where(Order.created_at >= func.date_sub(func.now(), text(f"interval {int(days)} day")))
-        .group_by(func.date(Order.created_at))
-        .order_by(func.date(Order.created_at).asc())
+    orders_daily_rows = (
+        await db.execute(
+            select(func.date(Order.created_at), func.count(), func.coalesce(func.sum(Order.amount), 0))
+            .where(Order.created_at >= func.date_sub(func.now(), text(f"interval {int(days)} day")))
+            .group_by(func.date(Order.created_at))
+            .order_by(func.date(Order.created_at).asc())
+        )
     ).all()
     orders_daily = [DailyAgg(date=str(r[0]), count=int(r[1]), amount_sum=int(r[2] or 0)) for r in orders_daily_rows]
 
-    credit_daily_rows = db.execute(
-        select(func.date(CreditLog.created_at), func.count(), func.coalesce(func.sum(CreditLog.amount), 0))
-        .where(CreditLog.created_at >= func.date_sub(func.now(), text(f"interval {int(days)} day")))
-        .group_by(func.date(CreditLog.created_at))
-        .order_by(func.date(CreditLog.created_at).asc())
+    credit_daily_rows = (
+        await db.execute(
+            select(func.date(CreditLog.created_at), func.count(), func.coalesce(func.sum(CreditLog.amount), 0))
+            .where(CreditLog.created_at >= func.date_sub(func.now(), text(f"interval {int(days)} day")))
+            .group_by(func.date(CreditLog.created_at))
+            .order_by(func.date(CreditLog.created_at).asc())
+        )
     ).all()
     credit_logs_daily = [DailyAgg(date=str(r[0]), count=int(r[1]), amount_sum=int(r[2] or 0)) for r in credit_daily_rows]
 
@@ -409,125 +380,92 @@ def admin_metrics_overview(
     )
 
 
+@router.get("/debug/pool", response_model=list[PoolStatus])
+async def admin_debug_pool(reset: bool = Query(default=False, description="reset counters after reading")):
+    out = [
+        PoolStatus(**pool_status("sync", engine)),
+        PoolStatus(**pool_status("async", async_engine.sync_engine)),
+    ]
+    if reset:
+        for s in pool_stats.values():
+            s.reset()
+    return out
+
+
+@router.get("/debug/caches", response_model=dict[str, dict[str, Any]])
+async def admin_debug_caches():
+    return {
+        "jwt": token_cache_stats(),
+        "principal": principal_cache_stats(),
+        "counts": count_cache_stats(),
+        "s3_listing": s3_listing_cache.stats(),
+        "media": media_cache_stats(),
+        "search": search_stats(),
+        **{f"local_assets:{p}": s for p, s in local_asset_index_stats().items()},
+        **{f"response:{name}": c.stats() for name, c in single_flight_caches.items()},
+    }
+
+
+@router.post("/episodes/bulk-delete", response_model=BulkDeleteStatus, status_code=202)
+def admin_bulk_delete_episodes(
+    body: BulkDeleteRequest,
+    background: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user: UserContext = Depends(require_admin),
+):
+    params = body.model_dump(mode="json", exclude_none=True)
+    if not is_narrowed(params):
+        raise HTTPException(status_code=400, detail="episode_ids, user_id, created_before or has_error=true is required")
+    task = create_bulk_delete(db, params, created_by=user.id)
+    background.add_task(run_bulk_delete, task.id)
+    return _bulk_status(task)
+
+
+@router.get("/episodes/bulk-delete/{task_id}", response_model=BulkDeleteStatus)
+def admin_bulk_delete_status(task_id: str, db: Session = Depends(get_db)):
+    task = db.get(BulkDeleteTask, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="task not found")
+    return _bulk_status(task)
+
+
+def _bulk_status(task: BulkDeleteTask) -> BulkDeleteStatus:
+    return BulkDeleteStatus(
+        task_id=task.id,
+        status=task.status,
+        params=task.params or {},
+        created_by=task.created_by,
+        total=task.total or 0,
+        processed=task.processed or 0,
+        deleted_episodes=task.deleted_episodes or 0,
+        deleted_rows=dict(task.deleted_rows or {}),
+        deleted_objects=task.deleted_objects or 0,
+        failed_objects=task.failed_objects or 0,
+        failures=list(task.failures or []),
+        error=task.error,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        finished_at=task.finished_at,
+    )
+
+
 @router.delete("/episodes/{episode_id}", response_model=EpisodeDeleteResult)
 def admin_delete_episode(
     episode_id: str,
     delete_objects: bool = Query(default=True, description="delete s3/local objects if URLs exist"),
     db: Session = Depends(get_db),
 ):
-    # Load episode and outputs first
-    ep: Episode | None = db.execute(select(Episode).where(Episode.episode_id == episode_id)).scalar_one_or_none()
-    if not ep:
+    exists = db.execute(select(Episode.id).where(Episode.episode_id == episode_id)).scalar_one_or_none()
+    if exists is None:
         raise HTTPException(status_code=404, detail="episode not found")
 
-    out: EpisodeOutputs | None = db.execute(
-        select(EpisodeOutputs).where(EpisodeOutputs.episode_id == episode_id)
-    ).scalar_one_or_none()
-
-    urls: list[str] = []
-    if out and out.video_url:
-        urls.append(str(out.video_url))
-    if out and out.preview_video_url:
-        urls.append(str(out.preview_video_url))
-
-    # Story assets may store only s3_key (no full url)
-    story_keys = [
-        str(r[0])
-        for r in db.execute(select(StoryAsset.s3_key).where(StoryAsset.episode_id == episode_id)).all()
-        if r and r[0]
-    ]
-
     deleted_objects: list[str] = []
     failed_objects: list[str] = []
-
     if delete_objects:
-        from pathlib import Path
-
-        static_root = Path("app/static")
-
-        # 1) delete by output URLs
-        for url in urls:
-            # local static
-            if url.startswith("/static/"):
-                rel = url[len("/static/") :].lstrip("/")
-                p = static_root / rel
-                try:
-                    if p.exists() and p.is_file():
-                        p.unlink()
-                        deleted_objects.append(url)
-                except Exception:
-                    failed_objects.append(url)
-                continue
-
-            # s3 url
-            parsed = parse_s3_url(url)
-            if parsed:
-                bucket, key = parsed
-                try:
-                    delete_s3_object(bucket=bucket, key=key)
-                    deleted_objects.append(url)
-                except Exception as e:
-                    failed_objects.append(f"{url} :: {type(e).__name__}: {e}")
-
-        # 2) delete story assets by s3_key (bucket inferred)
-        inferred_bucket: str | None = None
-        for url in urls:
-            parsed = parse_s3_url(url)
-            if parsed:
-                inferred_bucket = parsed[0]
-                break
-        # bucket selection heuristics
-        bucket_for_results = settings.s3_results_bucket or inferred_bucket
-        bucket_for_userassets = settings.s3_userassets_bucket
-        bucket_for_userbgm = settings.s3_userbgm_bucket
-
-        if story_keys:
-            seen: set[tuple[str, str]] = set()
-            for key in story_keys:
-                k = (key or "").lstrip("/")
-                if not k:
-                    continue
-
-                # bucket routing by key prefix
-                bucket = None
-                if k.startswith("userassets/") and bucket_for_userassets:
-                    bucket = bucket_for_userassets
-                elif k.startswith("userbgm/") and bucket_for_userbgm:
-                    bucket = bucket_for_userbgm
-                else:
-                    bucket = bucket_for_results
-
-                if not bucket:
-                    failed_objects.append(f"s3://(unknown-bucket)/{k}")
-                    continue
-
-                sig = (bucket, k)
-                if sig in seen:
-                    continue
-                seen.add(sig)
-
-                try:
-                    delete_s3_object(bucket=bucket, key=k)
-                    deleted_objects.append(f"s3://{bucket}/{k}")
-                except Exception as e:
-                    failed_objects.append(f"s3://{bucket}/{k} :: {type(e).__name__}: {e}")
-
-    # Delete DB rows (manual cascade to be safe)
-    # story assets/tts/shots
-    shot_ids = [
-        int(r[0])
-        for r in db.execute(select(StoryShot.id).where(StoryShot.episode_id == episode_id)).all()
-    ]
-    if shot_ids:
-        db.query(StoryTTSSegment).filter(StoryTTSSegment.shot_id.in_(shot_ids)).delete(synchronize_session=False)
-
-    db.query(StoryAsset).filter(StoryAsset.episode_id == episode_id).delete(synchronize_session=False)
-    db.query(StoryShot).filter(StoryShot.episode_id == episode_id).delete(synchronize_session=False)
-
-    db.query(EpisodeOutputs).filter(EpisodeOutputs.episode_id == episode_id).delete(synchronize_session=False)
-    db.query(EpisodeMeta).filter(EpisodeMeta.episode_id == episode_id).delete(synchronize_session=False)
-    db.query(Episode).filter(Episode.episode_id == episode_id).delete(synchronize_session=False)
+        objects = delete_episode_objects(db, [episode_id])
+        deleted_objects, failed_objects = objects.deleted, objects.failed
 
+    deleted_rows = cascade_delete_episodes(db, [episode_id])
     db.commit()
 
     # dedupe for cleaner responses
@@ -544,6 +482,7 @@ def admin_delete_episode(
     return EpisodeDeleteResult(
         episode_id=episode_id,
         deleted_db=True,
+        deleted_rows=deleted_rows,
         deleted_objects=_dedupe(deleted_objects),
         failed_objects=_dedupe(failed_objects),
     )
@@ -568,48 +507,163 @@ def _resolve_local_dir(kind: str):
     return Path("app/static") / "assets" / kind
 
 
-@router.get("/assets/{kind}", response_model=list[AssetItem])
-def admin_list_assets(kind: str, prefix: str = Query(default="")):
-    bucket = _resolve_bucket(kind)
-    if bucket:
-        items = list_s3_objects(bucket=bucket, prefix=prefix or "")
-        return [AssetItem(key=i.key, size=i.size, last_modified=i.last_modified, url=i.url) for i in items]
+def _asset_item(kind: str, a: ListedAsset, local: bool) -> AssetItem:
+    # Local URL points to mounted /static
+    url = f"/static/assets/{kind}/{a.key}" if local else a.url
+    return AssetItem(key=a.key, size=a.size, last_modified=a.last_modified, url=url)
 
-    base = _resolve_local_dir(kind)
-    items = list_local_assets(base)
-    if prefix:
-        items = [i for i in items if i.key.startswith(prefix)]
 
-    # Local URL points to mounted /static
-    return [AssetItem(key=i.key, size=i.size, last_modified=i.last_modified, url=f"/static/assets/{kind}/{i.key}") for i in items]
+def _ndjson_assets(kind: str, pages: Iterator[list[ListedAsset]], local: bool) -> Iterator[bytes]:
+    # one chunk per listing page keeps memory bounded by the page size
+    for page in pages:
+        yield "".join(_asset_item(kind, a, local).model_dump_json() + "\n" for a in page).encode("utf-8")
 
 
-@router.post("/assets/{kind}/upload", response_model=AssetItem)
-async def admin_upload_asset(kind: str, key: str = Query(...), file: UploadFile = File(...)):
+@router.get("/assets/{kind}", response_model=AssetPage)
+def admin_list_assets(
+    kind: str,
+    prefix: str = Query(default=""),
+    limit: int = Query(default=200, ge=1, le=1000),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    delimiter: str | None = Query(default=None, description='"/" to browse folders'),
+    format: Literal["json", "ndjson"] = Query(default="json", description="ndjson: stream every object (export)"),
+):
     bucket = _resolve_bucket(kind)
+    prefix = prefix or ""
+
+    if format == "ndjson":
+        if bucket:
+            pages = iter_s3_objects(bucket=bucket, prefix=prefix)
+        else:
+            pages = local_asset_index(_resolve_local_dir(kind)).iter_pages(prefix=prefix)
+        return StreamingResponse(_ndjson_assets(kind, pages, local=not bucket), media_type="application/x-ndjson")
+
+    source, listed_at = "local", None
+    if bucket:
+        cached = s3_listing_cache.page(bucket, prefix, limit=limit, cursor=cursor, delimiter=delimiter)
+        if cached is not None:
+            (page, listed_at), source = cached, "cache"
+        else:
+            page, source = list_s3_page(bucket=bucket, prefix=prefix, limit=limit, cursor=cursor, delimiter=delimiter), "s3"
+    else:
+        page = local_asset_index(_resolve_local_dir(kind)).page(
+            prefix=prefix, limit=limit, cursor=cursor, delimiter=delimiter
+        )
 
+    return AssetPage(
+        items=[_asset_item(kind, a, local=not bucket) for a in (sign_urls(bucket, page.items) if bucket else page.items)],
+        folders=page.folders,
+        limit=limit,
+        next_cursor=page.next_cursor,
+        source=source,
+        listed_at=datetime.fromtimestamp(listed_at, tz=timezone.utc) if listed_at else None,
+        stale_sec=round(time.time() - listed_at, 1) if listed_at else None,
+    )
+
+
+def _clean_key(key: str | None) -> str:
     # sanitize key
     key = (key or "").replace("..", "").lstrip("/")
     if not key:
         raise HTTPException(status_code=400, detail="key required")
+    return key
 
-    if bucket:
-        from pathlib import Path
 
-        tmp_dir = Path(".tmp_uploads")
-        tmp_dir.mkdir(parents=True, exist_ok=True)
-        tmp_path = tmp_dir / (file.filename or "upload.bin")
-        content = await file.read()
-        tmp_path.write_bytes(content)
+def _require_bucket(kind: str) -> str:
+    bucket = _resolve_bucket(kind)
+    if not bucket:
+        # the header tells clients to fall back to the proxied upload (local mode)
+        raise HTTPException(
+            status_code=400, detail=f"no S3 bucket configured for {kind}", headers={"X-Asset-Storage": "local"}
+        )
+    return bucket
+
+
+_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/assets/{kind}/upload", response_model=AssetItem, openapi_extra=_UPLOAD_BODY)
+async def admin_upload_asset(request: Request, kind: str, key: str = Query(...)):
+    # multipart body is parsed while streaming (no UploadFile spooling); field name: file
+    bucket = _resolve_bucket(kind)
 
-        upload_s3(bucket=bucket, key=key, file_path=tmp_path, content_type=file.content_type)
-        return AssetItem(key=key)
+    key = _clean_key(key)
+    content_type = request.headers.get("content-type", "")
+    try:
+        if bucket:
+            size = await stream_to_s3(content_type, request.stream(), bucket=bucket, key=key)
+            return AssetItem(key=key, size=size)
+
+        # local mode
+        base = _resolve_local_dir(kind)
+        size = await stream_to_file(content_type, request.stream(), base / key)
+    except UploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UploadStorageError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    local_asset_index(base).touch(key)
+
+    return AssetItem(key=key, size=size, url=f"/static/assets/{kind}/{key}")
+
+
+# --- Presigned (browser <-> S3 directly; this process stays off the data path) ---
+
+@router.post("/assets/{kind}/presign-upload", response_model=PresignUploadResponse)
+def admin_presign_upload(kind: str, body: PresignUploadRequest):
+    bucket = _require_bucket(kind)
+    key = _clean_key(body.key)
+
+    if body.size is not None and body.size > settings.s3_presign_multipart_mb * 1024 * 1024:
+        upload_id, part_size, urls = presigned_multipart(bucket, key, body.size, body.content_type)
+        return PresignUploadResponse(
+            key=key,
+            expires_in=settings.s3_presign_upload_ttl_sec,
+            upload_id=upload_id,
+            part_size=part_size,
+            parts=[PresignedPart(part_number=i + 1, url=u) for i, u in enumerate(urls)],
+        )
 
-    # local mode
-    base = _resolve_local_dir(kind)
-    dest = base / key
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    content = await file.read()
-    dest.write_bytes(content)
+    return PresignUploadResponse(
+        key=key,
+        expires_in=settings.s3_presign_upload_ttl_sec,
+        url=presigned_put_url(bucket, key, body.content_type),
+        headers={"Content-Type": body.content_type} if body.content_type else {},
+    )
 
-    return AssetItem(key=key, size=dest.stat().st_size, url=f"/static/assets/{kind}/{key}")
+
+@router.post("/assets/{kind}/presign-upload/complete", response_model=AssetItem)
+def admin_presign_complete(kind: str, body: PresignCompleteRequest):
+    bucket = _require_bucket(kind)
+    key = _clean_key(body.key)
+    if body.upload_id and not body.parts:
+        raise HTTPException(status_code=400, detail="parts required for multipart uploads")
+    try:
+        a = complete_upload(bucket, key, body.upload_id, [(p.part_number, p.etag) for p in body.parts])
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code in ("404", "NoSuchKey", "NoSuchUpload"):
+            raise HTTPException(status_code=404, detail="uploaded object not found")
+        raise HTTPException(status_code=400, detail=f"{code}: {e}")
+    return AssetItem(key=a.key, size=a.size, last_modified=a.last_modified, url=a.url)
+
+
+@router.get("/assets/{kind}/presign-download", response_model=PresignedDownload)
+def admin_presign_download(kind: str, key: str = Query(...)):
+    key = _clean_key(key)
+    bucket = _resolve_bucket(kind)
+    if not bucket:
+        return PresignedDownload(key=key, url=f"/static/assets/{kind}/{key}")
+    return PresignedDownload(key=key, url=presigned_get_url(bucket, key), expires_in=settings.s3_presign_ttl_sec)
@@ -1,18 +1,159 @@
-from fastapi import APIRouter, Depends, File, UploadFile
+from __future__ import annotations
 
-from app.core.security import require_admin
-from app.schemas.common import Message
+import os
+from datetime import datetime, timezone
+from typing import Optional
 
-router = APIRouter(dependencies=[Depends(require_admin)])
+from anyio import to_thread
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import FileResponse, RedirectResponse, Response, StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.security import get_current_user_verified, require_admin
+from app.db.session import get_db
+from app.schemas.common import MediaLink, Message
+from app.services.assets import presigned_get_url
+from app.services.media import iter_s3_body, media_token, open_s3_media, resolve_media, verify_media_token
 
-@router.post("/upload", response_model=Message)
+router = APIRouter()
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def require_media_access(
+    media_id: str,
+    token: str | None = Query(default=None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> None:
+    """A `?token=` from /{media_id}/link (for <video>/<img>) or an admin JWT."""
+    if token and verify_media_token(media_id, token):
+        return
+    require_admin(await get_current_user_verified(credentials))
+
+# response headers copied from GetObject/HeadObject
+_S3_HEADERS = {
+    "ContentLength": "content-length",
+    "ContentRange": "content-range",
+    "ETag": "etag",
+    "CacheControl": "cache-control",
+}
+
+
+@router.post("/upload", response_model=Message, dependencies=[Depends(require_admin)])
 async def upload_media(file: UploadFile = File(...)):
     # Placeholder: save to S3/local in real impl
     return Message(message=f"received upload: filename={file.filename} content_type={file.content_type}")
 
 
-@router.get("/{media_id}", response_model=Message)
-def download_media(media_id: str):
-    # Placeholder: should return StreamingResponse / Redirect to presigned url
-    return Message(message=f"placeholder download for media_id={media_id}")
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == bare for t in if_none_match.split(","))
+
+
+async def _local_response(request: Request, path) -> Response:
+    try:
+        st = await to_thread.run_sync(os.stat, path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="media not found")
+    # FileResponse handles Range / If-Range and hands the file to the server
+    # via the ASGI pathsend extension (sendfile) when it is available
+    resp = FileResponse(path, stat_result=st, content_disposition_type="inline")
+    inm = request.headers.get("if-none-match")
+    if inm and _etag_matches(inm, resp.headers["etag"]):
+        return Response(
+            status_code=304,
+            headers={"etag": resp.headers["etag"], "last-modified": resp.headers["last-modified"]},
+        )
+    return resp
+
+
+def _s3_unavailable(e: BotoCoreError) -> HTTPException:
+    if isinstance(e, NoCredentialsError):
+        return HTTPException(status_code=503, detail="S3 credentials are not configured")
+    return HTTPException(status_code=502, detail=f"S3 unavailable: {e}")
+
+
+def _s3_proxy_response(request: Request, bucket: str, key: str) -> Response:
+    head = request.method == "HEAD"
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    try:
+        if range_header and if_range:
+            # S3 has no If-Range: drop the range if the object changed
+            etag = open_s3_media(bucket, key, None, None, head=True).get("ETag", "")
+            if if_range.strip() != etag:
+                range_header = None
+        obj = open_s3_media(bucket, key, range_header, request.headers.get("if-none-match"), head=head)
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status == 304 or code == "304":
+            return Response(status_code=304)
+        if status == 416 or code == "InvalidRange":
+            return Response(status_code=416)
+        if code in ("404", "NoSuchKey"):
+            raise HTTPException(status_code=404, detail="media not found")
+        raise HTTPException(status_code=502, detail=f"{code}: {e}")
+    except BotoCoreError as e:
+        raise _s3_unavailable(e)
+
+    headers = {"accept-ranges": "bytes"}
+    for field, name in _S3_HEADERS.items():
+        if obj.get(field) is not None:
+            headers[name] = str(obj[field])
+    if obj.get("LastModified"):
+        headers["last-modified"] = obj["LastModified"].strftime("%a, %d %b %Y %H:%M:%S GMT")
+    status = 206 if obj.get("ContentRange") else 200
+    media_type = obj.get("ContentType") or "application/octet-stream"
+    if head:
+        return Response(status_code=status, headers=headers, media_type=media_type)
+    chunk = max(1, settings.media_stream_chunk_kb) * 1024
+    return StreamingResponse(
+        iter_s3_body(obj["Body"], chunk), status_code=status, headers=headers, media_type=media_type
+    )
+
+
+@router.get("/{media_id}/link", response_model=MediaLink, dependencies=[Depends(require_admin)])
+async def media_link(media_id: str, request: Request, db: Session = Depends(get_db)):
+    """Playable URL for `media_id` that carries its own short-lived token (MEDIA_TOKEN_TTL_SEC)."""
+    # also warms the lookup cache for the player's requests
+    if await to_thread.run_sync(resolve_media, db, media_id) is None:
+        raise HTTPException(status_code=404, detail="media not found")
+    token, exp = media_token(media_id)
+    path = request.url_for("download_media", media_id=media_id).path
+    return MediaLink(url=f"{path}?token={token}", expires_at=datetime.fromtimestamp(exp, tz=timezone.utc))
+
+
+@router.api_route(
+    "/{media_id}",
+    methods=["GET", "HEAD"],
+    response_class=Response,
+    dependencies=[Depends(require_media_access)],
+)
+async def download_media(media_id: str, request: Request, db: Session = Depends(get_db)):
+    """Serve an episode output or story asset; supports Range for seeking.
+
+    media_id: `asset:{id}` (or a bare story asset id), `video:{episode_id}`,
+    `preview:{episode_id}`. Auth: admin JWT, or `?token=` from /{media_id}/link.
+    S3 objects redirect to a presigned URL
+    (MEDIA_S3_MODE=redirect) or stream through this app (proxy).
+    """
+    target = await to_thread.run_sync(resolve_media, db, media_id)
+    if target is None:
+        raise HTTPException(status_code=404, detail="media not found")
+    if target.path is not None:
+        return await _local_response(request, target.path)
+    if target.url is not None:
+        return RedirectResponse(target.url, status_code=307)
+    if settings.media_s3_mode == "proxy":
+        return await to_thread.run_sync(_s3_proxy_response, request, target.bucket, target.key)
+    try:
+        url = await to_thread.run_sync(presigned_get_url, target.bucket, target.key)
+    except BotoCoreError as e:
+        raise _s3_unavailable(e)
+    # S3 answers the player's Range requests itself
+    return RedirectResponse(url, status_code=307)
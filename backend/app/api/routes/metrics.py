@@ -0,0 +1,28 @@
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.config import settings
+from app.core.metrics import render_prometheus
+from app.core.security import get_current_user_verified, require_admin
+
+router = APIRouter()
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def require_metrics_access(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> None:
+    """METRICS_TOKEN (scrapers can't do the admin login) or an admin JWT; anything else is rejected."""
+    token = credentials.credentials if credentials else ""
+    if settings.metrics_token and hmac.compare_digest(token.encode(), settings.metrics_token.encode()):
+        return
+    require_admin(await get_current_user_verified(credentials))
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_access)])
+def prometheus_metrics():
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
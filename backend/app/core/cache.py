@@ -0,0 +1,207 @@
+"""Small in-process caches.
+
+Per-process only: with several uvicorn workers each keeps its own copy, so
+anything that must take effect everywhere relies on a short TTL as backstop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache with a per-entry expiry and hit/miss counters."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = float(ttl)
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or entry[0] <= now:
+                if entry is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, pred: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [k for k in self._data if pred(k)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_sec": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class SingleFlightCache:
+    """Async response cache with request coalescing and stale-while-revalidate.
+
+    - fresh (age < ttl): served from memory
+    - stale (age < ttl + stale_ttl): served from memory, one background refresh
+    - missing/expired: concurrent callers await a single computation
+
+    Computations run as their own task (shielded from caller cancellation).
+    Event-loop local; no thread safety needed.
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0.0, maxsize: int = 256) -> None:
+        self.name = name
+        self.ttl = float(ttl)
+        self.stale_ttl = float(stale_ttl)
+        self.maxsize = max(1, int(maxsize))
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    async def get(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._data.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                self.hits += 1
+                return entry[1]
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._start(key, compute)
+                return entry[1]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._start(key, compute)
+        return await asyncio.shield(task)
+
+    def _start(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> "asyncio.Task[Any]":
+        task = asyncio.create_task(self._run(key, compute))
+        self._inflight[key] = task
+        # background refreshes may have no awaiter; don't warn about their errors
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_sec": self.ttl,
+            "stale_ttl_sec": self.stale_ttl,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+        }
+
+
+single_flight_caches: dict[str, SingleFlightCache] = {}
+
+
+def single_flight(
+    name: str,
+    ttl: float,
+    stale_ttl: float = 0.0,
+    key: tuple[str, ...] = (),
+    session_arg: str | None = "db",
+    maxsize: int = 256,
+):
+    """Decorate an `async def` endpoint with a SingleFlightCache.
+
+    `key` names the keyword arguments that identify a response. If the
+    endpoint takes an AsyncSession as `session_arg`, each computation opens
+    its own session: the caller's request-scoped one may be closed before a
+    shared or background computation finishes.
+    """
+
+    cache = SingleFlightCache(name, ttl=ttl, stale_ttl=stale_ttl, maxsize=maxsize)
+    single_flight_caches[name] = cache
+
+    def deco(fn):
+        async def _compute(kwargs: dict[str, Any]) -> Any:
+            if session_arg and session_arg in kwargs:
+                from app.db.session import AsyncSessionLocal
+
+                async with AsyncSessionLocal() as db:
+                    return await fn(**{**kwargs, session_arg: db})
+            return await fn(**kwargs)
+
+        @functools.wraps(fn)
+        async def wrapper(**kwargs: Any) -> Any:
+            k = tuple(kwargs.get(p) for p in key)
+            return await cache.get(k, lambda: _compute(kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return deco
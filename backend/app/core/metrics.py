@@ -0,0 +1,259 @@
+"""Per-route request/DB metrics and the slow-query log.
+
+- `install_query_timing(engine, name)` hooks before/after_cursor_execute:
+  every statement's time and rowcount are added to the current request
+  (a ContextVar set by the middleware; contextvars follow requests into
+  threadpool routes and SQLAlchemy's async greenlets) and to per-engine
+  totals. Statements slower than SLOW_QUERY_MS are logged with their SQL
+  text only; bound parameters can carry user data and are never logged.
+- `RequestMetricsMiddleware` (pure ASGI) records latency, DB time,
+  statement count and rows per (method, route template, status).
+- `render_prometheus()` is the text exposition served at /api/metrics.
+
+rows: cursor.rowcount, i.e. rows returned by SELECTs on buffered MySQL
+cursors and rows affected by DML. Drivers reporting -1 (SQLite SELECTs)
+add nothing. Per-process, like the other in-memory stats in this app.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+slow_log = logging.getLogger("app.slow_query")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+    route: str = ""
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class _RouteStats:
+    __slots__ = ("count", "seconds", "buckets", "db_seconds", "statements", "rows", "max_statements")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.db_seconds = 0.0
+        self.statements = 0
+        self.rows = 0
+        self.max_statements = 0
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes: dict[tuple[str, str, int], _RouteStats] = {}
+            self._engines: dict[str, QueryStats] = {}
+            self.slow_queries = 0
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, q: QueryStats) -> None:
+        with self._lock:
+            s = self._routes.get((method, route, status))
+            if s is None:
+                s = self._routes[(method, route, status)] = _RouteStats()
+            s.count += 1
+            s.seconds += seconds
+            for i, le in enumerate(LATENCY_BUCKETS):
+                if seconds <= le:
+                    s.buckets[i] += 1
+                    break
+            s.db_seconds += q.db_seconds
+            s.statements += q.statements
+            s.rows += q.rows
+            s.max_statements = max(s.max_statements, q.statements)
+
+    def observe_statement(self, engine: str, seconds: float, rows: int, slow: bool) -> None:
+        with self._lock:
+            e = self._engines.get(engine)
+            if e is None:
+                e = self._engines[engine] = QueryStats()
+            e.statements += 1
+            e.db_seconds += seconds
+            e.rows += rows
+            self.slow_queries += slow
+
+    def snapshot(self) -> tuple[dict[tuple[str, str, int], _RouteStats], dict[str, QueryStats], int]:
+        with self._lock:
+            routes = {}
+            for k, s in self._routes.items():
+                c = _RouteStats()
+                for f in _RouteStats.__slots__:
+                    setattr(c, f, list(s.buckets) if f == "buckets" else getattr(s, f))
+                routes[k] = c
+            engines = {k: QueryStats(v.statements, v.db_seconds, v.rows) for k, v in self._engines.items()}
+            return routes, engines, self.slow_queries
+
+
+metrics = MetricsRegistry()
+
+
+def install_query_timing(engine: Any, name: str) -> None:
+    """Time every statement on `engine` (a sync Engine; for async engines pass .sync_engine)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        rows = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+        q = _current.get()
+        if q is not None:
+            q.statements += 1
+            q.db_seconds += elapsed
+            q.rows += rows
+        slow = settings.slow_query_ms > 0 and elapsed * 1000 >= settings.slow_query_ms
+        metrics.observe_statement(name, elapsed, rows, slow)
+        if slow:
+            sql = " ".join(statement.split())
+            slow_log.warning(
+                "slow query %.1f ms engine=%s route=%s rows=%s: %s",
+                elapsed * 1000,
+                name,
+                q.route if q is not None else "-",
+                rows,
+                sql[: settings.slow_query_log_max_chars],
+            )
+
+
+_PARAM_RE = re.compile(r"{(\w+)(?::\w+)?}")
+
+
+def _route_label(scope: Scope) -> str:
+    """Full route template, e.g. /api/admin/episodes/{episode_id} (bounded label cardinality).
+
+    scope["route"] holds the template relative to its included router, so the
+    prefix is recovered from the raw path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+    params = scope.get("path_params") or {}
+    rendered = _PARAM_RE.sub(lambda m: str(params.get(m.group(1), m.group(0))), template)
+    path = scope.get("path", "")
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class RequestMetricsMiddleware:
+    """Records latency and DB usage per route template for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.request_metrics:
+            await self.app(scope, receive, send)
+            return
+
+        q = QueryStats(route=scope.get("path", ""))
+        token = _current.set(q)
+        status = 500
+        done = False
+        t0 = time.perf_counter()
+
+        def _observe() -> None:
+            nonlocal done
+            done = True
+            q.route = _route_label(scope)
+            metrics.observe_request(scope.get("method", ""), q.route, status, time.perf_counter() - t0, q)
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            # measured up to the last body chunk: BackgroundTasks run after it
+            final = message["type"] == "http.response.pathsend" or (
+                message["type"] == "http.response.body" and not message.get("more_body")
+            )
+            if final and not done:
+                _observe()
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _current.reset(token)
+            if not done:
+                _observe()
+
+
+def _labels(**kv: Any) -> str:
+    esc = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in kv.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(kv, esc)) + "}"
+
+
+def render_prometheus() -> str:
+    routes, engines, slow = metrics.snapshot()
+    out: list[str] = []
+
+    def family(name: str, kind: str, help_: str) -> None:
+        out.append(f"# HELP {name} {help_}")
+        out.append(f"# TYPE {name} {kind}")
+
+    family("http_requests_total", "counter", "Requests by route template and status.")
+    for (m, r, s), v in sorted(routes.items()):
+        out.append(f"http_requests_total{_labels(method=m, route=r, status=s)} {v.count}")
+
+    family("http_request_duration_seconds", "histogram", "Request latency by route template.")
+    for (m, r, s), v in sorted(routes.items()):
+        cum = 0
+        for le, n in zip(LATENCY_BUCKETS, v.buckets):
+            cum += n
+            out.append(f"http_request_duration_seconds_bucket{_labels(method=m, route=r, status=s, le=le)} {cum}")
+        out.append(f"http_request_duration_seconds_bucket{_labels(method=m, route=r, status=s, le='+Inf')} {v.count}")
+        out.append(f"http_request_duration_seconds_sum{_labels(method=m, route=r, status=s)} {v.seconds:.6f}")
+        out.append(f"http_request_duration_seconds_count{_labels(method=m, route=r, status=s)} {v.count}")
+
+    per_route = (
+        ("http_request_db_seconds_total", "counter", "DB time spent in requests.", "db_seconds"),
+        ("http_request_db_statements_total", "counter", "SQL statements executed by requests.", "statements"),
+        ("http_request_db_rows_total", "counter", "Rows returned/affected (cursor.rowcount) in requests.", "rows"),
+        ("http_request_db_statements_max", "gauge", "Most statements seen in one request.", "max_statements"),
+    )
+    for name, kind, help_, attr in per_route:
+        family(name, kind, help_)
+        for (m, r, s), v in sorted(routes.items()):
+            val = getattr(v, attr)
+            val = f"{val:.6f}" if isinstance(val, float) else val
+            out.append(f"{name}{_labels(method=m, route=r, status=s)} {val}")
+
+    family("db_statements_total", "counter", "SQL statements per engine (including background work).")
+    for e, v in sorted(engines.items()):
+        out.append(f"db_statements_total{_labels(engine=e)} {v.statements}")
+    family("db_statement_seconds_total", "counter", "Time in SQL statements per engine.")
+    for e, v in sorted(engines.items()):
+        out.append(f"db_statement_seconds_total{_labels(engine=e)} {v.db_seconds:.6f}")
+    family("db_slow_queries_total", "counter", "Statements slower than SLOW_QUERY_MS.")
+    out.append(f"db_slow_queries_total {slow}")
+    return "\n".join(out) + "\n"
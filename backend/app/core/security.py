@@ -10,6 +10,7 @@ Current assumptions (as provided):
 
 Env:
 - JWT_SECRET (shared with EasyShorts_backend)
+- JWT_BACKEND: jose (default) | pyjwt (faster, optional dependency)
 
 NOTE:
 - This file intentionally does NOT mint tokens. It only verifies.
@@ -17,37 +18,135 @@ NOTE:
 
 from __future__ import annotations
 
+import hashlib
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import AsyncSessionLocal
 
 
-@dataclass
+@dataclass(frozen=True)
 class UserContext:
+    # shared across requests through the token cache: immutable
     id: str
     email: str
     role: str
-    raw: Dict[str, Any] | None = None
+    raw: Mapping[str, Any] | None = None
 
 
 _bearer = HTTPBearer(auto_error=False)
 
+try:  # optional faster backend
+    import jwt as _pyjwt
+except ImportError:  # pragma: no cover
+    _pyjwt = None
+
+_use_pyjwt = settings.jwt_backend == "pyjwt" and _pyjwt is not None
+
+# sha256(token) -> verified UserContext; entries never outlive the token's `exp`
+_token_cache = TTLCache(maxsize=settings.jwt_cache_size, ttl=settings.jwt_cache_ttl_sec)
+
+
+@dataclass(frozen=True)
+class _Principal:
+    is_active: bool
+    role: str
+
+
+# DB-verified (is_active, role) per (user_id, jti|iat). Admin mutations call
+# invalidate_principal() in their own worker; other workers drop the entry
+# on their next sweep of users.updated_at (_sweep_user_changes).
+_principal_cache = TTLCache(maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl_sec)
+_principal_invalidations = 0
+
+# users.updated_at watermark of the last sweep and the ids already handled at it
+_sweep_at = 0.0
+_sweep_since: Any = None
+_sweep_seen: set[str] = set()
+
+
+def invalidate_principal(user_id: str) -> int:
+    """Drop cached principals for `user_id` (e.g. after deactivation/role change)."""
+    global _principal_invalidations
+    _principal_invalidations += 1
+    return _principal_cache.pop_where(lambda k: k[0] == user_id)
+
+
+async def _sweep_user_changes() -> None:
+    """Drop cached principals of users updated since the last sweep (by any worker).
+
+    At most one query per PRINCIPAL_REVALIDATE_SEC per process, not per request.
+    """
+    global _sweep_at, _sweep_since, _sweep_seen, _principal_invalidations
+    now = time.monotonic()
+    if settings.principal_revalidate_sec <= 0 or now - _sweep_at < settings.principal_revalidate_sec:
+        return
+    _sweep_at = now  # before awaiting: concurrent requests skip this sweep
+
+    from sqlalchemy import func, select
+    from app.db.tables import User
+
+    async with AsyncSessionLocal() as db:
+        if _sweep_since is None:
+            _sweep_since = (await db.execute(select(func.max(User.updated_at)))).scalar()
+            return
+        rows = (
+            await db.execute(select(User.user_id, User.updated_at).where(User.updated_at >= _sweep_since))
+        ).all()
+    changed = {r.user_id for r in rows if r.updated_at > _sweep_since or r.user_id not in _sweep_seen}
+    if changed:
+        _principal_invalidations += 1
+        _principal_cache.pop_where(lambda k: k[0] in changed)
+    if rows:
+        latest = max(r.updated_at for r in rows)
+        _sweep_seen = {r.user_id for r in rows if r.updated_at == latest}
+        _sweep_since = latest
+
+
+def principal_cache_stats() -> Dict[str, Any]:
+    return _principal_cache.stats()
+
+
+def token_cache_stats() -> Dict[str, Any]:
+    return {**_token_cache.stats(), "backend": "pyjwt" if _use_pyjwt else "jose"}
+
+
+# Claim checks that differ between jose and PyJWT (and across their versions)
+# are turned off in both and applied once in _check_claims.
+_DECODE_OPTIONS = {"verify_aud": False, "verify_sub": False}
+
+
+def _check_claims(payload: Any) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
+    # no audience is configured: tokens scoped to an audience are not for us
+    if "aud" in payload:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token: audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token: subject")
+    return payload
+
 
 def _decode_hs256_token(token: str) -> Dict[str, Any]:
-    try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
-        if not isinstance(payload, dict):
+    if _use_pyjwt:
+        try:
+            payload = _pyjwt.decode(token, settings.jwt_secret, algorithms=["HS256"], options=_DECODE_OPTIONS)
+        except _pyjwt.PyJWTError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
-        return payload
+        return _check_claims(payload)
+
+    try:
+        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"], options=_DECODE_OPTIONS)
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
+    return _check_claims(payload)
 
 
 def _to_user_context(payload: Dict[str, Any]) -> UserContext:
@@ -63,7 +162,7 @@ def _to_user_context(payload: Dict[str, Any]) -> UserContext:
         # fail closed
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token: unknown role")
 
-    return UserContext(id=str(user_id), email=str(email), role=str(role), raw=payload)
+    return UserContext(id=str(user_id), email=str(email), role=str(role), raw=MappingProxyType(payload))
 
 
 def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)) -> UserContext:
@@ -72,13 +171,26 @@ def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depen
     if not credentials or credentials.scheme.lower() != "bearer" or not credentials.credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="missing bearer token")
 
-    payload = _decode_hs256_token(credentials.credentials)
-    return _to_user_context(payload)
+    token = credentials.credentials
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    cached: UserContext | None = _token_cache.get(digest)
+    if cached is not None:
+        return cached
+
+    payload = _decode_hs256_token(token)
+    ctx = _to_user_context(payload)
 
+    ttl = settings.jwt_cache_ttl_sec
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, float(exp) - time.time())
+    if ttl > 0:
+        _token_cache.set(digest, ctx, ttl=ttl)
+    return ctx
 
-def get_current_user_verified(
+
+async def get_current_user_verified(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
-    db: Session = Depends(get_db),
 ) -> UserContext:
     """Return current user context and verify against DB.
 
@@ -86,7 +198,9 @@ def get_current_user_verified(
     - is_active must be truthy
     - role is taken from DB (fail closed if mismatch)
 
-    This prevents trusting a forged `role=admin` claim.
+    This prevents trusting a forged `role=admin` claim. The DB lookup is
+    cached per token for `PRINCIPAL_CACHE_TTL_SEC`; changes made through any
+    worker (users.updated_at) evict it within `PRINCIPAL_REVALIDATE_SEC`.
     """
 
     from sqlalchemy import select
@@ -94,11 +208,24 @@ def get_current_user_verified(
 
     u = get_current_user(credentials)
 
-    row = db.execute(select(User).where(User.user_id == u.id)).scalar_one_or_none()
-    if not row:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user not found")
-
-    if not int(getattr(row, "is_active", 0)):
+    raw = u.raw or {}
+    key = (u.id, raw.get("jti") or raw.get("iat"))
+    await _sweep_user_changes()
+    p: _Principal | None = _principal_cache.get(key)
+    if p is None:
+        gen = _principal_invalidations
+        # own short-lived session: a request-scoped one would pin a pooled
+        # connection for the whole response (e.g. long-lived SSE streams)
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(select(User.is_active, User.role).where(User.user_id == u.id))).one_or_none()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user not found")
+        p = _Principal(is_active=bool(int(row.is_active or 0)), role=str(row.role or "user"))
+        # skip caching if an invalidation raced with this lookup
+        if gen == _principal_invalidations:
+            _principal_cache.set(key, p)
+
+    if not p.is_active:
         # allow emergency bypass to recover from accidental admin deactivation
         # (read from settings + env for hotfix reliability)
         import os
@@ -109,7 +236,7 @@ def get_current_user_verified(
         if u.id not in (settings.superadmin_ids | runtime_ids):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="inactive user")
 
-    db_role = str(getattr(row, "role", "user") or "user")
+    db_role = p.role
     if db_role not in ("admin", "user"):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="invalid user role")
 
@@ -0,0 +1,73 @@
+"""Tables owned by this admin backend (not by EasyShorts_backend).
+
+Created by `scripts/create_admin_tables.py` (checkfirst, idempotent).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import JSON, BigInteger, Column, Date, DateTime, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.db.models import Base
+
+
+class MetricRollupDaily(Base):
+    """Per-day aggregates for the dashboard: one row per (metric, day, status).
+
+    day is DATE(created_at) of the source rows; status is the source status
+    (jobs/orders), 'active'/'inactive' (users) or 'all'.
+    """
+
+    __tablename__ = 'admin_metric_rollup_daily'
+
+    id = Column(Integer, primary_key=True)
+    metric = Column(String(32), nullable=False)
+    day = Column(Date, nullable=False)
+    status = Column(String(50), nullable=False)
+    count = Column(BigInteger, default=0, nullable=False)
+    amount_sum = Column(BigInteger, default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('metric', 'day', 'status', name='uq_rollup_metric_day_status'),
+        Index('ix_rollup_metric_status', 'metric', 'status'),
+    )
+
+
+class MetricRollupWatermark(Base):
+    __tablename__ = 'admin_metric_rollup_watermark'
+
+    metric = Column(String(32), primary_key=True)
+    watermark = Column(DateTime(timezone=True), nullable=True)
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class BulkDeleteTask(Base):
+    """One bulk episode deletion (POST /api/admin/episodes/bulk-delete).
+
+    params holds the request (episode_ids or filter); failures is a capped
+    list of "label :: error" strings for objects/episodes that failed.
+    """
+
+    __tablename__ = 'admin_bulk_delete_tasks'
+
+    id = Column(String(36), primary_key=True)
+    status = Column(String(20), default='queued', nullable=False)  # queued|running|done|failed
+    params = Column(JSON, nullable=False)
+    created_by = Column(String(255), nullable=True)
+
+    total = Column(Integer, default=0, nullable=False)
+    processed = Column(Integer, default=0, nullable=False)
+    deleted_episodes = Column(Integer, default=0, nullable=False)
+    deleted_objects = Column(Integer, default=0, nullable=False)
+    deleted_rows = Column(JSON, nullable=True)  # table -> rows
+    failed_objects = Column(Integer, default=0, nullable=False)
+    failures = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+ROLLUP_TABLES = [MetricRollupDaily.__table__, MetricRollupWatermark.__table__]
+ADMIN_TABLES = [*ROLLUP_TABLES, BulkDeleteTask.__table__]
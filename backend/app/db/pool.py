@@ -0,0 +1,159 @@
+"""Connection pool configuration and instrumentation.
+
+Both engines (sync + async) use a QueuePool subclass that times every
+checkout, so `/api/admin/debug/pool` can show wait times and timeouts
+directly instead of inferring exhaustion from 500s.
+
+Pre-ping strategies (`DB_POOL_PRE_PING`):
+- always: SQLAlchemy `pool_pre_ping` (one `SELECT 1` per checkout)
+- idle:   ping only connections idle longer than `DB_POOL_PRE_PING_IDLE_SEC`
+- never:  rely on `pool_recycle` only
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.pings = 0
+            self.invalidated = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.last_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += seconds
+            self.last_wait = seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            n = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "pings": self.pings,
+                "invalidated": self.invalidated,
+                "wait_avg_ms": round(self.wait_total / n * 1000, 3) if n else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "wait_last_ms": round(self.last_wait * 1000, 3),
+            }
+
+
+pool_stats: dict[str, PoolStats] = {"sync": PoolStats(), "async": PoolStats()}
+
+
+class _TimedCheckoutMixin:
+    _stats: PoolStats
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self._stats.record_wait(time.perf_counter() - t0, timed_out=True)
+            raise
+        self._stats.record_wait(time.perf_counter() - t0, timed_out=False)
+        return conn
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    _stats = pool_stats["sync"]
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    _stats = pool_stats["async"]
+
+
+def engine_pool_kwargs(poolclass: type) -> dict[str, Any]:
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": settings.db_pool_pre_ping == "always",
+    }
+
+
+def install_idle_pre_ping(sync_engine: Any, stats: PoolStats) -> None:
+    """Ping on checkout only if the connection sat idle past the threshold."""
+
+    if settings.db_pool_pre_ping != "idle":
+        return
+
+    threshold = float(settings.db_pool_pre_ping_idle_sec)
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_conn, record):
+        if record is not None:
+            record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        last = record.info.get("checked_in_at")
+        if last is None or time.monotonic() - last < threshold:
+            return
+        stats.incr("pings")
+        try:
+            cur = dbapi_conn.cursor()
+            try:
+                cur.execute("SELECT 1")
+            finally:
+                cur.close()
+        except Exception as e:
+            stats.incr("invalidated")
+            # pool discards this connection and retries checkout with a fresh one
+            raise exc.DisconnectionError() from e
+
+
+def pool_status(name: str, sync_engine: Any) -> dict[str, Any]:
+    pool = sync_engine.pool
+    size = pool.size() if hasattr(pool, "size") else None
+    checked_out = pool.checkedout() if hasattr(pool, "checkedout") else None
+    overflow = pool.overflow() if hasattr(pool, "overflow") else None
+    max_overflow = settings.db_max_overflow
+    exhausted = False
+    if checked_out is not None and size is not None and max_overflow >= 0:
+        exhausted = checked_out >= size + max_overflow
+    return {
+        "name": name,
+        "pool_class": type(pool).__name__,
+        "size": size,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": checked_out,
+        # QueuePool.overflow() is negative while the pool is still filling up
+        "overflow": max(overflow, 0) if overflow is not None else None,
+        "max_overflow": max_overflow,
+        "exhausted": exhausted,
+        "timeout_sec": settings.db_pool_timeout,
+        "recycle_sec": settings.db_pool_recycle,
+        "pre_ping": settings.db_pool_pre_ping,
+        **pool_stats[name].snapshot(),
+    }
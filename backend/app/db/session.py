@@ -3,15 +3,21 @@ from __future__ import annotations
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.metrics import install_query_timing
+from app.db.pool import TimedAsyncQueuePool, TimedQueuePool, engine_pool_kwargs, install_idle_pre_ping, pool_stats
 
 
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    **engine_pool_kwargs(TimedQueuePool),
 )
+install_idle_pre_ping(engine, pool_stats["sync"])
+install_query_timing(engine, "sync")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -22,3 +28,32 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async engine for hot read paths (admin lists/metrics/jobs, auth lookup).
+# Derived from DATABASE_URL by swapping in the async driver unless
+# ASYNC_DATABASE_URL is set explicitly.
+_ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def _async_url(url: str):
+    u = make_url(url)
+    driver = _ASYNC_DRIVERS.get(u.get_backend_name())
+    if not driver:
+        return u
+    return u.set(drivername=f"{u.get_backend_name()}+{driver}")
+
+
+async_engine = create_async_engine(
+    settings.async_database_url or _async_url(settings.database_url),
+    **engine_pool_kwargs(TimedAsyncQueuePool),
+)
+install_idle_pre_ping(async_engine.sync_engine, pool_stats["async"])
+install_query_timing(async_engine.sync_engine, "async")
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
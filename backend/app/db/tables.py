@@ -5,7 +5,7 @@ We keep this intentionally small: only columns needed by admin endpoints.
 
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.sql import func
 
 from app.db.models import Base
@@ -161,3 +161,28 @@ class StoryAsset(Base):
     s3_key = Column(String(500), nullable=False)
     meta_json = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+# Indexes for the admin list filters/sorts (ORDER BY created_at DESC, id DESC
+# under an optional equality filter) and the updated_at scans of background
+# pollers. Not part of the EasyShorts_backend schema:
+# `scripts/index_advisor.py --apply` creates the ones its EXPLAIN findings
+# call for (idempotent). InnoDB appends the primary key to every secondary
+# index, so (x, created_at) also serves the `id` tie-break and keyset cursors.
+ADMIN_QUERY_INDEXES = (
+    Index('ix_users_created_at', User.created_at),
+    Index('ix_users_is_active_created_at', User.is_active, User.created_at),
+    # updated_at scans: principal cache sweep (core/security.py), rollup _dirty_days
+    Index('ix_users_updated_at', User.updated_at),
+    Index('ix_episodes_created_at', Episode.created_at),
+    Index('ix_episodes_user_id_created_at', Episode.user_id, Episode.created_at),
+    Index('ix_episodes_updated_at', Episode.updated_at),
+    Index('ix_jobs_created_at', Job.created_at),
+    Index('ix_jobs_status_created_at', Job.status, Job.created_at),
+    Index('ix_jobs_job_type_created_at', Job.job_type, Job.created_at),
+    # job stream poller (WHERE (updated_at, id) > cursor ORDER BY updated_at, id), rollups
+    Index('ix_jobs_updated_at', Job.updated_at),
+    Index('ix_orders_created_at', Order.created_at),
+    Index('ix_orders_status_amount', Order.status, Order.amount),
+    Index('ix_credit_logs_created_at', CreditLog.created_at),
+)
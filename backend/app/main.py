@@ -1,8 +1,12 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import settings
+from app.core.metrics import RequestMetricsMiddleware
 from app.api.routes import (
     health_router,
     auth_router,
@@ -11,11 +15,25 @@ from app.api.routes import (
     shorts_router,
     media_router,
     admin_router,
+    metrics_router,
 )
+from app.services.bulk_delete import resume_stale_bulk_deletes
+from app.services.rollups import run_rollup_loop
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks: list[asyncio.Task] = []
+    if settings.metrics_rollups and settings.metrics_rollup_interval_sec > 0:
+        tasks.append(asyncio.create_task(run_rollup_loop(settings.metrics_rollup_interval_sec)))
+    tasks.append(asyncio.create_task(resume_stale_bulk_deletes()))
+    yield
+    for t in tasks:
+        t.cancel()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -23,13 +41,18 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # read by the admin UI's presigned upload fallback
+        expose_headers=["X-Asset-Storage"],
     )
+    # per-route latency / DB time / statement counts for /api/metrics
+    app.add_middleware(RequestMetricsMiddleware)
 
     # Static: /static/*
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
     # API: /api/*
     app.include_router(health_router, prefix="/api", tags=["health"])
+    app.include_router(metrics_router, prefix="/api", tags=["metrics"])
     app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
     app.include_router(series_router, prefix="/api/series", tags=["series"])
     app.include_router(episodes_router, prefix="/api/episodes", tags=["episodes"])
@@ -9,8 +9,12 @@ from pydantic import BaseModel, Field
 class Page(BaseModel):
     items: list[Any]
     total: int
+    # False when `total` is an estimate or a cached (possibly stale) count
+    total_exact: bool = True
     limit: int
     offset: int
+    # keyset cursor for the next page (pass back as `cursor=`); None on the last page
+    next_cursor: str | None = None
 
 
 class AdminUser(BaseModel):
@@ -45,6 +49,8 @@ class AdminJob(BaseModel):
     updated_at: datetime | None = None
     result: Any | None = None
     error: str | None = None
+    # set by the list `view=summary` projection (extracted from result)
+    progress: float | None = None
 
 
 class CreditPatch(BaseModel):
@@ -68,6 +74,60 @@ class AssetItem(BaseModel):
     url: str | None = None
 
 
+class AssetPage(BaseModel):
+    items: list[AssetItem]
+    # "folders" (common prefixes) when listing with a delimiter
+    folders: list[str] = []
+    limit: int
+    # pass back as `cursor=`; None on the last page
+    next_cursor: str | None = None
+    # s3 | cache | local; for cache, when the listing was taken and its age
+    source: str = "s3"
+    listed_at: datetime | None = None
+    stale_sec: float | None = None
+
+
+class PresignUploadRequest(BaseModel):
+    key: str
+    content_type: str | None = None
+    # bytes; above S3_PRESIGN_MULTIPART_MB a multipart upload is prepared
+    size: int | None = Field(default=None, ge=0)
+
+
+class PresignedPart(BaseModel):
+    part_number: int
+    url: str
+
+
+class PresignUploadResponse(BaseModel):
+    key: str
+    expires_in: int
+    # single PUT (send the same Content-Type header)
+    url: str | None = None
+    headers: dict[str, str] = {}
+    # multipart: PUT each part to its URL, then POST /complete with the ETags
+    upload_id: str | None = None
+    part_size: int | None = None
+    parts: list[PresignedPart] = []
+
+
+class CompletedPart(BaseModel):
+    part_number: int
+    etag: str
+
+
+class PresignCompleteRequest(BaseModel):
+    key: str
+    upload_id: str | None = None
+    parts: list[CompletedPart] = []
+
+
+class PresignedDownload(BaseModel):
+    key: str
+    url: str
+    expires_in: int | None = None
+
+
 class StatusAgg(BaseModel):
     status: str
     count: int
@@ -96,5 +156,59 @@ class AdminOverviewMetrics(BaseModel):
 class EpisodeDeleteResult(BaseModel):
     episode_id: str
     deleted_db: bool
+    # rows deleted per table by the cascade
+    deleted_rows: dict[str, int] = {}
     deleted_objects: list[str] = []
     failed_objects: list[str] = []
+
+
+class BulkDeleteRequest(BaseModel):
+    # explicit ids and/or a filter; at least one narrowing field must be given
+    # (has_error=false alone would match every healthy episode)
+    episode_ids: list[str] | None = Field(default=None, max_length=10_000)
+    user_id: str | None = None
+    has_error: bool | None = None
+    created_before: datetime | None = None
+    delete_objects: bool = True
+
+
+class BulkDeleteStatus(BaseModel):
+    task_id: str
+    status: str  # queued | running | done | failed
+    params: dict[str, Any]
+    created_by: str | None = None
+    total: int
+    processed: int
+    deleted_episodes: int
+    deleted_rows: dict[str, int] = {}
+    deleted_objects: int
+    failed_objects: int
+    # capped at BULK_DELETE_MAX_FAILURES ("label :: error")
+    failures: list[str] = []
+    error: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class PoolStatus(BaseModel):
+    name: str  # sync | async
+    pool_class: str
+    size: int | None = None
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+    max_overflow: int
+    exhausted: bool = False
+    timeout_sec: float
+    recycle_sec: int
+    pre_ping: str
+
+    # counters since start (or last reset)
+    checkouts: int = 0
+    timeouts: int = 0
+    pings: int = 0
+    invalidated: int = 0
+    wait_avg_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    wait_last_ms: float = 0.0
@@ -11,3 +11,9 @@ class HealthResponse(BaseModel):
     time: datetime
     app: str
     env: str
+
+
+class MediaLink(BaseModel):
+    # path + query (prefix with the API base URL); works without an Authorization header
+    url: str
+    expires_at: datetime
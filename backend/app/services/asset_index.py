@@ -0,0 +1,244 @@
+"""In-process index of the local asset trees (app/static/assets/{kind}).
+
+Local mode used to rglob + stat every file per request. The index scans a
+tree once, keeps keys sorted for bisect-based prefix/cursor lookups, and
+stays fresh by re-checking directory mtimes (at most every
+LOCAL_ASSET_INDEX_CHECK_SEC): adding, removing or renaming an entry bumps
+its parent directory's mtime, so only changed directories are rescanned.
+In-place overwrites don't touch the directory; writers through this
+backend call `touch()`.
+
+Per-process, like the other caches in this app.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from app.core.config import settings
+from app.services.assets import KEY_HIGH, ListedAsset, ListedPage
+
+_RACY_SEC = 1.0
+
+
+def page_sorted(
+    keys: list[str],
+    item: Callable[[str], ListedAsset],
+    prefix: str = "",
+    limit: int = 200,
+    cursor: str | None = None,
+    delimiter: str | None = None,
+) -> ListedPage:
+    """list_s3_page semantics over a sorted key list (bisect, no full scan)."""
+    i = bisect.bisect_left(keys, prefix)
+    if cursor and cursor >= prefix:
+        i = bisect.bisect_right(keys, cursor)
+        if delimiter and cursor.endswith(delimiter):
+            i = bisect.bisect_left(keys, cursor + KEY_HIGH)  # skip the folder's contents
+    end = bisect.bisect_left(keys, prefix + KEY_HIGH)
+
+    items: list[ListedAsset] = []
+    folders: list[str] = []
+    last: str | None = None
+    while i < end:
+        if len(items) + len(folders) >= limit:
+            return ListedPage(items=items, folders=folders, next_cursor=last)
+        key = keys[i]
+        cut = key.find(delimiter, len(prefix)) if delimiter else -1
+        if cut >= 0:
+            folder = key[: cut + len(delimiter)]
+            folders.append(folder)
+            last = folder
+            i = bisect.bisect_left(keys, folder + KEY_HIGH, i)
+            continue
+        items.append(item(key))
+        last = key
+        i += 1
+    return ListedPage(items=items, folders=folders, next_cursor=None)
+
+
+class LocalAssetIndex:
+    def __init__(self, base_dir: Path, check_interval: float | None = None) -> None:
+        self.base_dir = Path(base_dir)
+        self.check_interval = settings.local_asset_index_check_sec if check_interval is None else check_interval
+        self._lock = threading.Lock()
+        self._dirs: dict[str, float] = {}  # rel dir ('' = root) -> mtime
+        self._dir_files: dict[str, set[str]] = {}  # rel dir -> file names
+        self._files: dict[str, ListedAsset] = {}
+        self._keys: list[str] = []
+        self._checked = 0.0
+        self.scans = 0
+        self.rescanned_dirs = 0
+
+    # --- maintenance ---
+
+    def _abs(self, rel: str) -> Path:
+        return self.base_dir / rel if rel else self.base_dir
+
+    @staticmethod
+    def _join(rel: str, name: str) -> str:
+        return f"{rel}/{name}" if rel else name
+
+    def _scan_dir(self, rel: str, full: bool) -> None:
+        """(Re)read one directory; new subdirectories are scanned recursively."""
+        path = self._abs(rel)
+        try:
+            mtime = path.stat().st_mtime
+            entries = list(os.scandir(path))
+        except FileNotFoundError:
+            self._drop_dir(rel)
+            return
+        # a change within the same mtime tick as this scan would go unnoticed
+        # ("racy" mtime): keep rescanning until the directory has settled
+        self._dirs[rel] = -1.0 if time.time() - mtime < _RACY_SEC else mtime
+        self.rescanned_dirs += 1
+
+        names: set[str] = set()
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                sub = self._join(rel, e.name)
+                if sub not in self._dirs:
+                    self._scan_dir(sub, full)
+            elif e.is_file():
+                names.add(e.name)
+                key = self._join(rel, e.name)
+                st = e.stat()
+                self._files[key] = ListedAsset(
+                    key=key, size=st.st_size, last_modified=datetime.fromtimestamp(st.st_mtime)
+                )
+                if not full:
+                    i = bisect.bisect_left(self._keys, key)
+                    if i == len(self._keys) or self._keys[i] != key:
+                        self._keys.insert(i, key)
+
+        for gone in self._dir_files.get(rel, set()) - names:
+            key = self._join(rel, gone)
+            self._files.pop(key, None)
+            if not full:
+                i = bisect.bisect_left(self._keys, key)
+                if i < len(self._keys) and self._keys[i] == key:
+                    del self._keys[i]
+        self._dir_files[rel] = names
+
+    def _drop_dir(self, rel: str) -> None:
+        pre = f"{rel}/" if rel else ""
+        for d in [d for d in self._dirs if d == rel or d.startswith(pre)]:
+            self._dirs.pop(d, None)
+            self._dir_files.pop(d, None)
+        lo = bisect.bisect_left(self._keys, pre)
+        hi = bisect.bisect_left(self._keys, pre + KEY_HIGH)
+        for key in self._keys[lo:hi]:
+            self._files.pop(key, None)
+        del self._keys[lo:hi]
+
+    def _build(self) -> None:
+        self._dirs.clear()
+        self._dir_files.clear()
+        self._files.clear()
+        self._keys = []
+        if self.base_dir.is_dir():
+            self._scan_dir("", full=True)
+        self._keys = sorted(self._files)
+        self.scans += 1
+
+    def refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if not force and self.scans and now - self._checked < self.check_interval:
+                return
+            self._checked = now
+            if force or not self._dirs:
+                self._build()
+                return
+            for rel, mtime in list(self._dirs.items()):
+                if rel not in self._dirs:
+                    continue  # dropped with its parent
+                try:
+                    current = self._abs(rel).stat().st_mtime
+                except FileNotFoundError:
+                    self._drop_dir(rel)
+                    continue
+                if current != mtime:
+                    self._scan_dir(rel, full=False)
+
+    def touch(self, key: str) -> None:
+        """Re-stat one file after writing it (overwrites don't change dir mtimes)."""
+        with self._lock:
+            if not self._dirs:
+                return  # not built yet; the first lookup scans everything
+            p = self.base_dir / key
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                return
+            rel = key.rsplit("/", 1)[0] if "/" in key else ""
+            if rel not in self._dirs:
+                self._checked = 0.0  # new directory: picked up by the next refresh
+                return
+            if key not in self._files:
+                bisect.insort(self._keys, key)
+            self._dir_files.setdefault(rel, set()).add(key.rsplit("/", 1)[-1])
+            self._files[key] = ListedAsset(key=key, size=st.st_size, last_modified=datetime.fromtimestamp(st.st_mtime))
+
+    # --- lookups ---
+
+    def page(
+        self,
+        prefix: str = "",
+        limit: int = 200,
+        cursor: str | None = None,
+        delimiter: str | None = None,
+    ) -> ListedPage:
+        """Same paging contract as list_s3_page; `cursor` is the last key/folder returned."""
+        self.refresh()
+        with self._lock:
+            return page_sorted(self._keys, self._files.__getitem__, prefix, limit, cursor, delimiter)
+
+    def iter_pages(self, prefix: str = "", size: int = 1000) -> Iterator[list[ListedAsset]]:
+        cursor: str | None = None
+        while True:
+            page = self.page(prefix=prefix, limit=size, cursor=cursor)
+            if page.items:
+                yield page.items
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "files": len(self._keys),
+                "dirs": len(self._dirs),
+                "scans": self.scans,
+                "rescanned_dirs": self.rescanned_dirs,
+                "check_interval_sec": self.check_interval,
+            }
+
+
+_indexes: dict[Path, LocalAssetIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def local_asset_index(base_dir: Path) -> LocalAssetIndex:
+    key = Path(base_dir).resolve()
+    with _indexes_lock:
+        idx = _indexes.get(key)
+        if idx is None:
+            idx = _indexes[key] = LocalAssetIndex(key)
+        return idx
+
+
+def reset_local_asset_indexes() -> None:
+    with _indexes_lock:
+        _indexes.clear()
+
+
+def local_asset_index_stats() -> dict[str, dict[str, int | float]]:
+    with _indexes_lock:
+        return {str(p): idx.stats() for p, idx in _indexes.items()}
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import boto3
 from botocore.client import Config
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
@@ -19,65 +20,271 @@ class ListedAsset:
     url: str | None = None
 
 
-def _s3_client():
-    # boto3 will read env creds automatically; we also support explicit settings.
-    session = boto3.session.Session(
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-        region_name=settings.aws_region,
+_client_lock = threading.Lock()
+_client = None
+_client_key: tuple | None = None
+
+
+def s3_client():
+    """Process-wide S3 client, created once and reused across requests.
+
+    boto3 clients are thread-safe; building one per call re-resolves
+    credentials/endpoints and throws away its connection pool. Rebuilt if the
+    AWS settings change (tests) or after reset_s3_client().
+    """
+    global _client, _client_key
+    key = (
+        settings.aws_access_key_id,
+        settings.aws_secret_access_key,
+        settings.aws_region,
+        settings.s3_max_pool_connections,
+        settings.s3_tcp_keepalive,
     )
-    return session.client('s3', config=Config(signature_version='s3v4'))
+    client = _client
+    if client is not None and _client_key == key:
+        return client
+    with _client_lock:
+        if _client is None or _client_key != key:
+            # boto3 will read env creds automatically; we also support explicit settings.
+            session = boto3.session.Session(
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                region_name=settings.aws_region,
+            )
+            _client = session.client(
+                's3',
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=settings.s3_max_pool_connections,
+                    tcp_keepalive=settings.s3_tcp_keepalive,
+                ),
+            )
+            _client_key = key
+        return _client
 
 
-def list_s3_objects(bucket: str, prefix: str = '') -> list[ListedAsset]:
-    client = _s3_client()
-    paginator = client.get_paginator('list_objects_v2')
+def reset_s3_client() -> None:
+    """Drop the cached client (tests, credential rotation). The next call builds a new one."""
+    global _client, _client_key
+    with _client_lock:
+        old, _client, _client_key = _client, None, None
+    if old is not None:
+        old.close()
 
-    items: list[ListedAsset] = []
+
+def _listed(obj: dict) -> ListedAsset | None:
+    key = obj.get('Key')
+    if not key or key.endswith('/'):
+        return None
+    return ListedAsset(key=key, size=int(obj.get('Size') or 0), last_modified=obj.get('LastModified'))
+
+
+def iter_s3_objects(bucket: str, prefix: str = '') -> Iterator[list[ListedAsset]]:
+    """Yield objects one ListObjectsV2 page (<= 1000 keys) at a time."""
+    client = s3_client()
+    paginator = client.get_paginator('list_objects_v2')
     for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        for obj in page.get('Contents', []) or []:
-            key = obj.get('Key')
-            if not key or key.endswith('/'):
-                continue
-            items.append(
-                ListedAsset(
-                    key=key,
-                    size=int(obj.get('Size') or 0),
-                    last_modified=obj.get('LastModified'),
-                )
-            )
+        items = [a for a in map(_listed, page.get('Contents', []) or []) if a]
+        if items:
+            yield items
+
+
+_url_cache: TTLCache | None = None
+
+
+def _presigned_urls() -> TTLCache:
+    global _url_cache
+    if _url_cache is None:
+        # reuse a URL for half its lifetime, so callers always get >= ttl/2 of validity
+        _url_cache = TTLCache(maxsize=settings.s3_presign_cache_size, ttl=settings.s3_presign_ttl_sec / 2)
+    return _url_cache
+
+
+def presigned_get_url(bucket: str, key: str) -> str:
+    """Presigned GET URL (S3_PRESIGN_TTL_SEC), cached per object."""
+    cache = _presigned_urls()
+    url = cache.get((bucket, key))
+    if url is None:
+        url = s3_client().generate_presigned_url(
+            'get_object', Params={'Bucket': bucket, 'Key': key}, ExpiresIn=int(settings.s3_presign_ttl_sec)
+        )
+        cache.set((bucket, key), url)
+    return url
+
+
+def sign_urls(bucket: str, items: list[ListedAsset]) -> list[ListedAsset]:
+    for a in items:
+        a.url = presigned_get_url(bucket, a.key)
     return items
 
 
-def upload_s3(bucket: str, key: str, file_path: Path, content_type: str | None = None) -> None:
-    client = _s3_client()
-    extra = {}
+def presigned_put_url(bucket: str, key: str, content_type: str | None = None) -> str:
+    params = {'Bucket': bucket, 'Key': key}
     if content_type:
-        extra['ContentType'] = content_type
-    client.upload_file(str(file_path), bucket, key, ExtraArgs=extra or None)
+        params['ContentType'] = content_type
+    return s3_client().generate_presigned_url(
+        'put_object', Params=params, ExpiresIn=int(settings.s3_presign_upload_ttl_sec)
+    )
 
 
-def list_local_assets(base_dir: Path) -> list[ListedAsset]:
-    if not base_dir.exists():
-        return []
-    items: list[ListedAsset] = []
-    for p in base_dir.rglob('*'):
-        if not p.is_file():
-            continue
-        stat = p.stat()
-        items.append(
-            ListedAsset(
-                key=str(p.relative_to(base_dir)).replace('\\', '/'),
-                size=stat.st_size,
-                last_modified=datetime.fromtimestamp(stat.st_mtime),
-            )
+def presigned_multipart(
+    bucket: str, key: str, size: int, content_type: str | None = None
+) -> tuple[str, int, list[str]]:
+    """Start a multipart upload; returns (upload_id, part_size, one presigned URL per part)."""
+    client = s3_client()
+    part_size = max(5 * 1024 * 1024, settings.s3_presign_part_mb * 1024 * 1024)
+    # S3 allows at most 10000 parts
+    part_size = max(part_size, -(-size // 10000))
+    extra = {'ContentType': content_type} if content_type else {}
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, **extra)['UploadId']
+    urls = [
+        client.generate_presigned_url(
+            'upload_part',
+            Params={'Bucket': bucket, 'Key': key, 'UploadId': upload_id, 'PartNumber': n},
+            ExpiresIn=int(settings.s3_presign_upload_ttl_sec),
         )
-    return items
+        for n in range(1, max(1, -(-size // part_size)) + 1)
+    ]
+    return upload_id, part_size, urls
+
+
+def complete_upload(bucket: str, key: str, upload_id: str | None = None, parts: list[tuple[int, str]] | None = None) -> ListedAsset:
+    """Finish a presigned upload (multipart if upload_id) and record it; raises if the object is missing."""
+    client = s3_client()
+    if upload_id:
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': [{'PartNumber': n, 'ETag': etag} for n, etag in sorted(parts or [])]},
+        )
+    head = client.head_object(Bucket=bucket, Key=key)
+    asset = ListedAsset(key=key, size=int(head.get('ContentLength') or 0), last_modified=head.get('LastModified'))
+    _listing_cache().note_put(
+        bucket, key, asset.size or 0, asset.last_modified.timestamp() if asset.last_modified else None
+    )
+    _presigned_urls().pop((bucket, key))
+    asset.url = presigned_get_url(bucket, key)
+    return asset
+
+
+# sorts after any key sharing a prefix (also as UTF-8 bytes, which S3 compares)
+KEY_HIGH = "\U0010ffff"
+
+
+@dataclass
+class ListedPage:
+    items: list[ListedAsset]
+    # common prefixes ("folders") when listing with a delimiter
+    folders: list[str]
+    next_cursor: str | None = None
+
+
+def list_s3_page(
+    bucket: str,
+    prefix: str = '',
+    limit: int = 200,
+    cursor: str | None = None,
+    delimiter: str | None = None,
+) -> ListedPage:
+    """One page of objects after `cursor` (the last key or folder returned).
+
+    Uses StartAfter rather than continuation tokens so the same cursor also
+    works against the listing cache and the local index. With a delimiter,
+    S3 counts folders and objects together toward `limit`.
+    """
+    kwargs: dict = {'Bucket': bucket, 'Prefix': prefix, 'MaxKeys': max(1, min(int(limit), 1000))}
+    if delimiter:
+        kwargs['Delimiter'] = delimiter
+    if cursor:
+        # a folder cursor must skip everything below it, not just the folder name
+        kwargs['StartAfter'] = cursor + KEY_HIGH if delimiter and cursor.endswith(delimiter) else cursor
+    resp = s3_client().list_objects_v2(**kwargs)
+    items = [a for a in map(_listed, resp.get('Contents', []) or []) if a]
+    folders = [p['Prefix'] for p in resp.get('CommonPrefixes', []) or [] if p.get('Prefix')]
+    last = max([a.key for a in items[-1:]] + folders[-1:], default=None)
+    return ListedPage(items=items, folders=folders, next_cursor=last if resp.get('IsTruncated') else None)
+
+
+def _listing_cache():
+    # lazy: s3_listing builds on this module
+    from app.services.s3_listing import s3_listing_cache
+
+    return s3_listing_cache
+
+
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH = 1000
+
+
+@dataclass
+class DeleteFailure:
+    bucket: str
+    key: str
+    error: str
+
+
+def _delete_batch(client, bucket: str, keys: list[str]) -> tuple[list[tuple[str, str]], list[DeleteFailure]]:
+    try:
+        resp = client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': k} for k in keys], 'Quiet': True},
+        )
+    except Exception as e:
+        return [], [DeleteFailure(bucket, k, f"{type(e).__name__}: {e}") for k in keys]
+
+    # Quiet mode only reports errors; everything else was deleted
+    failed = [
+        DeleteFailure(bucket, err.get('Key') or '', f"{err.get('Code')}: {err.get('Message')}")
+        for err in resp.get('Errors', []) or []
+    ]
+    failed_keys = {f.key for f in failed}
+    return [(bucket, k) for k in keys if k not in failed_keys], failed
+
+
+def delete_s3_objects(
+    targets: list[tuple[str, str]],
+    max_workers: int | None = None,
+) -> tuple[list[tuple[str, str]], list[DeleteFailure]]:
+    """Delete many (bucket, key) pairs with batched DeleteObjects calls.
+
+    Keys are grouped per bucket into requests of up to 1000 keys, sent
+    concurrently on a bounded thread pool. Returns (deleted, failed) with
+    per-key results.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    by_bucket: dict[str, list[str]] = {}
+    seen: set[tuple[str, str]] = set()
+    for bucket, key in targets:
+        if (bucket, key) in seen:
+            continue
+        seen.add((bucket, key))
+        by_bucket.setdefault(bucket, []).append(key)
+
+    batches = [
+        (bucket, keys[i : i + _DELETE_BATCH])
+        for bucket, keys in by_bucket.items()
+        for i in range(0, len(keys), _DELETE_BATCH)
+    ]
+    if not batches:
+        return [], []
 
+    client = s3_client()
+    deleted: list[tuple[str, str]] = []
+    failed: list[DeleteFailure] = []
+    workers = max(1, min(max_workers or settings.s3_delete_concurrency, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ok, bad in pool.map(lambda b: _delete_batch(client, b[0], b[1]), batches):
+            deleted.extend(ok)
+            failed.extend(bad)
 
-def delete_s3_object(bucket: str, key: str) -> None:
-    client = _s3_client()
-    client.delete_object(Bucket=bucket, Key=key)
+    done: dict[str, list[str]] = {}
+    for bucket, key in deleted:
+        done.setdefault(bucket, []).append(key)
+    for bucket, keys in done.items():
+        _listing_cache().note_delete(bucket, keys)
+    return deleted, failed
 
 
 def parse_s3_url(url: str) -> tuple[str, str] | None:
@@ -0,0 +1,205 @@
+"""Bulk episode deletion run in the background.
+
+POST /api/admin/episodes/bulk-delete stores a BulkDeleteTask and schedules
+`run_bulk_delete`, which works through the matching episodes in batches of
+BULK_DELETE_BATCH_SIZE: objects first (batched, parallel S3 deletes), then
+the set-based DB cascade, committed per batch so progress is visible and a
+crash loses at most one batch. Explicit `episode_ids` are bound one batch-sized
+slice at a time.
+
+Tasks left queued/running by a restart are picked up by
+`resume_stale_bulk_deletes` at startup once they have not advanced for
+BULK_DELETE_STALE_SEC: deletes are idempotent, so a resumed task simply
+continues with the episodes that are still there.
+
+Needs the admin_bulk_delete_tasks table (`scripts/create_admin_tables.py`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.admin_tables import BulkDeleteTask
+from app.db.session import SessionLocal
+from app.db.tables import Episode
+from app.services.episode_cleanup import cascade_delete_episodes, delete_episode_objects
+
+log = logging.getLogger(__name__)
+
+
+def is_narrowed(params: dict[str, Any]) -> bool:
+    """True if params select a subset of episodes (has_error=false alone does not)."""
+    return bool(
+        params.get("episode_ids") or params.get("user_id") or params.get("created_before") or params.get("has_error") is True
+    )
+
+
+def _filters(params: dict[str, Any]) -> list[Any]:
+    """Filter clauses except episode_ids (bound per slice, see _id_slices)."""
+    where: list[Any] = []
+    if params.get("user_id"):
+        where.append(Episode.user_id == params["user_id"])
+    if params.get("has_error") is True:
+        where.append(Episode.error.is_not(None))
+    elif params.get("has_error") is False:
+        where.append(Episode.error.is_(None))
+    if params.get("created_before"):
+        where.append(Episode.created_at < datetime.fromisoformat(params["created_before"]))
+    return where
+
+
+def _id_slices(params: dict[str, Any], size: int) -> Iterator[Any]:
+    """One `episode_id IN (...)` clause per slice of explicit ids, or a single None."""
+    ids = list(dict.fromkeys(params.get("episode_ids") or []))
+    if not ids:
+        yield None
+        return
+    for i in range(0, len(ids), size):
+        yield Episode.episode_id.in_(ids[i : i + size])
+
+
+def create_bulk_delete(db: Session, params: dict[str, Any], created_by: str | None) -> BulkDeleteTask:
+    if not is_narrowed(params):
+        raise ValueError("episode_ids, user_id, created_before or has_error=true is required")
+    where = _filters(params)
+    total = 0
+    for ids in _id_slices(params, max(1, settings.bulk_delete_batch_size)):
+        q = select(func.count()).select_from(Episode).where(*where)
+        total += int(db.execute(q if ids is None else q.where(ids)).scalar() or 0)
+    task = BulkDeleteTask(
+        id=uuid.uuid4().hex,
+        status="queued",
+        params=params,
+        created_by=created_by,
+        total=total,
+    )
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    return task
+
+
+def _claim(db: Session, task_id: str) -> bool:
+    # atomic queued -> running so a task never runs twice
+    res = db.execute(
+        update(BulkDeleteTask)
+        .where(BulkDeleteTask.id == task_id, BulkDeleteTask.status == "queued")
+        .values(status="running", updated_at=func.now())
+    )
+    db.commit()
+    return bool(res.rowcount)
+
+
+def _requeue_stale(db: Session) -> list[str]:
+    cutoff = db.execute(select(func.now())).scalar() - timedelta(seconds=settings.bulk_delete_stale_sec)
+    stale = db.execute(
+        select(BulkDeleteTask.id).where(
+            BulkDeleteTask.status.in_(["queued", "running"]), BulkDeleteTask.updated_at < cutoff
+        )
+    ).scalars().all()
+    requeued = []
+    for task_id in stale:
+        # conditional, so two workers starting together resume a task only once
+        res = db.execute(
+            update(BulkDeleteTask)
+            .where(BulkDeleteTask.id == task_id, BulkDeleteTask.status.in_(["queued", "running"]),
+                   BulkDeleteTask.updated_at < cutoff)
+            .values(status="queued", updated_at=func.now())
+        )
+        if res.rowcount:
+            requeued.append(task_id)
+    db.commit()
+    return requeued
+
+
+async def resume_stale_bulk_deletes() -> None:
+    """Startup hook: re-run tasks a previous process left queued/running."""
+    def _requeue() -> list[str]:
+        db = SessionLocal()
+        try:
+            return _requeue_stale(db)
+        finally:
+            db.close()
+
+    try:
+        task_ids = await asyncio.to_thread(_requeue)
+    except Exception:
+        # e.g. admin tables not created yet
+        log.warning("bulk delete recovery skipped", exc_info=True)
+        return
+    for task_id in task_ids:
+        log.info("resuming bulk delete %s", task_id)
+        await asyncio.to_thread(run_bulk_delete, task_id)
+
+
+def _delete_batch(
+    db: Session, task: BulkDeleteTask, params: dict[str, Any], ids: list[str], failures: list[str], max_failures: int
+) -> None:
+    objects = None
+    if params.get("delete_objects", True):
+        objects = delete_episode_objects(db, ids)
+    rows_deleted = cascade_delete_episodes(db, ids)
+
+    if objects is not None:
+        failures.extend(objects.failed[: max(0, max_failures - len(failures))])
+    task.processed += len(ids)
+    task.deleted_episodes += rows_deleted["episodes"]
+    totals = dict(task.deleted_rows or {})
+    for table, n in rows_deleted.items():
+        totals[table] = totals.get(table, 0) + n
+    task.deleted_rows = totals
+    task.deleted_objects += len(objects.deleted) if objects else 0
+    task.failed_objects += len(objects.failed) if objects else 0
+    task.failures = list(failures)
+    task.updated_at = func.now()
+    db.commit()
+
+
+def run_bulk_delete(task_id: str) -> None:
+    """Process one task to completion (runs in a worker thread)."""
+    db = SessionLocal()
+    try:
+        if not _claim(db, task_id):
+            return
+        task = db.get(BulkDeleteTask, task_id)
+        params = dict(task.params or {})
+        where = _filters(params)
+        batch = max(1, settings.bulk_delete_batch_size)
+        max_failures = settings.bulk_delete_max_failures
+        failures: list[str] = list(task.failures or [])
+
+        for ids in _id_slices(params, batch):
+            last_id = 0
+            while True:
+                q = select(Episode.id, Episode.episode_id).where(*where, Episode.id > last_id)
+                if ids is not None:
+                    q = q.where(ids)
+                rows = db.execute(q.order_by(Episode.id.asc()).limit(batch)).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+                _delete_batch(db, task, params, [r.episode_id for r in rows], failures, max_failures)
+
+        task.status = "done"
+        task.finished_at = func.now()
+        task.updated_at = func.now()
+        db.commit()
+    except Exception as e:
+        log.exception("bulk delete %s failed", task_id)
+        db.rollback()
+        db.execute(
+            update(BulkDeleteTask)
+            .where(BulkDeleteTask.id == task_id)
+            .values(status="failed", error=f"{type(e).__name__}: {e}", finished_at=func.now(), updated_at=func.now())
+        )
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,103 @@
+"""Total-count strategies for admin list endpoints.
+
+`total_mode`:
+- exact:    COUNT(*) on the driving table (filters only touch that table, and
+            the admin joins are 1:1 on unique user_id/episode_id keys, so the
+            outer joins never change the row count)
+- cached:   exact count memoized per (endpoint, filter set) for
+            `settings.count_cache_ttl_sec`
+- estimate: MySQL row estimates (information_schema.TABLES when unfiltered,
+            EXPLAIN `rows` otherwise); falls back to exact on other dialects
+"""
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Literal
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+TotalMode = Literal["exact", "cached", "estimate"]
+
+_cache = TTLCache(maxsize=1024, ttl=settings.count_cache_ttl_sec)
+
+
+async def _exact(db: AsyncSession, table: Any, where: list[Any]) -> int:
+    q = select(func.count()).select_from(table)
+    if where:
+        q = q.where(*where)
+    return int((await db.execute(q)).scalar_one())
+
+
+async def _cached(db: AsyncSession, table: Any, where: list[Any], key: Hashable) -> tuple[int, bool]:
+    hit = _cache.get(key)
+    if hit is not None:
+        return hit, False
+
+    total = await _exact(db, table, where)
+    _cache.set(key, total)
+    return total, True
+
+
+async def _estimate(db: AsyncSession, table: Any, where: list[Any]) -> int | None:
+    if db.get_bind().dialect.name != "mysql":
+        return None
+
+    if not where:
+        v = (
+            await db.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t"
+                ),
+                {"t": table.__tablename__},
+            )
+        ).scalar()
+        return int(v) if v is not None else None
+
+    q = select(table.id).where(*where)
+    compiled = q.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positional:
+        # the driver formats `%s` placeholders from a tuple in statement order
+        params = tuple(params[k] for k in compiled.positiontup)
+    conn = await db.connection()
+    rows = (await conn.exec_driver_sql("EXPLAIN " + str(compiled), params)).mappings().all()
+    if not rows:
+        return None
+    v = rows[0].get("rows")
+    return int(v) if v is not None else None
+
+
+async def count_total(
+    db: AsyncSession,
+    table: Any,
+    where: list[Any],
+    mode: TotalMode = "exact",
+    key: Hashable | None = None,
+) -> tuple[int, bool]:
+    """Return (total, is_exact) for `table` filtered by `where`.
+
+    `key` identifies the filter set for `cached` mode, e.g.
+    ("jobs", status, job_type). Cached hits are reported as not exact.
+    """
+
+    if mode == "cached":
+        return await _cached(db, table, where, key if key is not None else (table.__tablename__,))
+    if mode == "estimate":
+        est = await _estimate(db, table, where)
+        if est is not None:
+            return est, False
+    return await _exact(db, table, where), True
+
+
+def clear_count_cache() -> None:
+    _cache.clear()
+
+
+def count_cache_stats() -> dict[str, Any]:
+    return _cache.stats()
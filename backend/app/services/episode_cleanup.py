@@ -0,0 +1,167 @@
+"""Episode deletion shared by DELETE /episodes/{id} and bulk deletes.
+
+Objects (output videos, story assets) are removed first, then the DB rows
+with one set-based delete per table for the whole batch of episodes.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.tables import Episode, EpisodeMeta, EpisodeOutputs, StoryAsset, StoryShot, StoryTTSSegment
+from app.services.assets import delete_s3_objects, parse_s3_url
+from app.services.rollups import adjust_rollup
+
+# local outputs (/static/... URLs) live under this directory
+STATIC_ROOT = Path("app/static")
+
+# deletion order used by cascade_delete_episodes
+_CASCADE_TABLES = (
+    "story_assets",
+    "story_tts_segments",
+    "story_shots",
+    "episode_outputs",
+    "episode_meta",
+    "episodes",
+)
+
+
+@dataclass
+class ObjectCleanup:
+    deleted: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+def story_bucket(key: str, results_bucket: str | None) -> str | None:
+    """Bucket of a story asset key: routed by key prefix, else `results_bucket`."""
+    if key.startswith("userassets/") and settings.s3_userassets_bucket:
+        return settings.s3_userassets_bucket
+    if key.startswith("userbgm/") and settings.s3_userbgm_bucket:
+        return settings.s3_userbgm_bucket
+    return results_bucket
+
+
+def delete_episode_objects(db: Session, episode_ids: list[str]) -> ObjectCleanup:
+    """Delete output files and story assets of the given episodes.
+
+    Local /static/ outputs are unlinked; S3 objects are collected and removed
+    with batched DeleteObjects calls. Labels are URLs or s3://bucket/key.
+    """
+    res = ObjectCleanup()
+    if not episode_ids:
+        return res
+
+    outputs = db.execute(
+        select(EpisodeOutputs.episode_id, EpisodeOutputs.video_url, EpisodeOutputs.preview_video_url).where(
+            EpisodeOutputs.episode_id.in_(episode_ids)
+        )
+    ).all()
+    urls_by_episode: dict[str, list[str]] = {}
+    for ep_id, video_url, preview_url in outputs:
+        urls_by_episode[ep_id] = [str(u) for u in (video_url, preview_url) if u]
+
+    # Story assets may store only s3_key (no full url)
+    story_keys = db.execute(
+        select(StoryAsset.episode_id, StoryAsset.s3_key).where(
+            StoryAsset.episode_id.in_(episode_ids), StoryAsset.s3_key.is_not(None)
+        )
+    ).all()
+
+    # (bucket, key) -> label used in the response
+    s3_targets: dict[tuple[str, str], str] = {}
+
+    # 1) output URLs: local static or s3
+    inferred_bucket: dict[str, str] = {}
+    for ep_id, urls in urls_by_episode.items():
+        for url in urls:
+            if url.startswith("/static/"):
+                p = STATIC_ROOT / url[len("/static/") :].lstrip("/")
+                try:
+                    if p.exists() and p.is_file():
+                        p.unlink()
+                        res.deleted.append(url)
+                except Exception:
+                    res.failed.append(url)
+                continue
+            parsed = parse_s3_url(url)
+            if parsed:
+                s3_targets.setdefault(parsed, url)
+                inferred_bucket.setdefault(ep_id, parsed[0])
+
+    # 2) story assets by s3_key (bucket inferred from the episode's outputs)
+    for ep_id, key in story_keys:
+        k = str(key or "").lstrip("/")
+        if not k:
+            continue
+        bucket = story_bucket(k, settings.s3_results_bucket or inferred_bucket.get(ep_id))
+        if not bucket:
+            res.failed.append(f"s3://(unknown-bucket)/{k}")
+            continue
+        s3_targets.setdefault((bucket, k), f"s3://{bucket}/{k}")
+
+    # 3) batched DeleteObjects per bucket, run concurrently
+    deleted, failed = delete_s3_objects(list(s3_targets))
+    res.deleted.extend(s3_targets[t] for t in deleted)
+    res.failed.extend(
+        f"{s3_targets.get((f.bucket, f.key), f's3://{f.bucket}/{f.key}')} :: {f.error}" for f in failed
+    )
+    return res
+
+
+def _chunked_delete(db: Session, stmt: Any, chunk: int, limited: bool) -> int:
+    # MySQL: DELETE ... LIMIT n repeated, which bounds each statement's size
+    # and run time (row locks and undo still accumulate until the caller
+    # commits); other dialects run the statement once.
+    total = 0
+    if limited:
+        stmt = stmt.with_dialect_options(mysql_limit=chunk)
+    while True:
+        n = db.execute(stmt).rowcount or 0
+        total += n
+        if not limited or n < chunk:
+            return total
+
+
+def cascade_delete_episodes(db: Session, episode_ids: list[str], chunk: int | None = None) -> dict[str, int]:
+    """Delete the episodes and their dependent rows (manual cascade to be safe).
+
+    Set-based: children are matched by episode_id or a subquery on
+    story_shots, never by ids pulled into Python. Story assets go first so
+    the FK cascades from shots/segments have nothing left to do and the
+    per-table counts stay exact. Runs in the caller's transaction; returns
+    rows deleted per table.
+    """
+    counts = {t: 0 for t in _CASCADE_TABLES}
+    if not episode_ids:
+        return counts
+
+    chunk = max(1, chunk or settings.episode_delete_chunk_rows)
+    limited = db.get_bind().dialect.name == "mysql"
+    days = Counter(
+        d.date()
+        for (d,) in db.execute(select(Episode.created_at).where(Episode.episode_id.in_(episode_ids))).all()
+        if d is not None
+    )
+
+    shots = select(StoryShot.id).where(StoryShot.episode_id.in_(episode_ids))
+    stmts = {
+        "story_assets": delete(StoryAsset).where(StoryAsset.episode_id.in_(episode_ids)),
+        "story_tts_segments": delete(StoryTTSSegment).where(StoryTTSSegment.shot_id.in_(shots)),
+        "story_shots": delete(StoryShot).where(StoryShot.episode_id.in_(episode_ids)),
+        "episode_outputs": delete(EpisodeOutputs).where(EpisodeOutputs.episode_id.in_(episode_ids)),
+        "episode_meta": delete(EpisodeMeta).where(EpisodeMeta.episode_id.in_(episode_ids)),
+        "episodes": delete(Episode).where(Episode.episode_id.in_(episode_ids)),
+    }
+    for table, stmt in stmts.items():
+        counts[table] = _chunked_delete(db, stmt, chunk, limited)
+
+    for day, count in days.items():
+        adjust_rollup(db, "episodes", day, "all", -count)
+    return counts
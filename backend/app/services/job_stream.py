@@ -0,0 +1,135 @@
+"""Server-push job updates for the admin UI.
+
+A single background poller per process reads jobs changed after the last
+`(updated_at, id)` cursor and fans the rows out to every SSE subscriber, so
+DB load stays at one query per interval no matter how many admin tabs are
+open. The query walks `ix_jobs_updated_at` (ADMIN_QUERY_INDEXES, created by
+scripts/index_advisor.py --apply); without it every poll scans and sorts
+`jobs`. Rows are the list's summary projection (no `result`/`error` blobs).
+The poller starts with the first subscriber and stops when the last one
+disconnects.
+
+The cursor is strict, so a full batch of rows sharing one `updated_at`
+cannot stall it. A row committed late with an older `(updated_at, id)` than
+the cursor is not pushed; clients still refetch the list every 30s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from sqlalchemy import and_, or_, select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.db.tables import Job
+from app.services.jobs import job_summary_columns, to_job_summary
+
+log = logging.getLogger(__name__)
+
+_QUEUE_SIZE = 64
+_BATCH_LIMIT = 500
+
+
+class JobBroadcaster:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+        # (updated_at, id) of the last row seen
+        self._cursor: tuple[datetime, int] | None = None
+        self.polls = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        q: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        self._subscribers.add(q)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return q
+
+    def unsubscribe(self, q: asyncio.Queue) -> None:
+        self._subscribers.discard(q)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _init_cursor(self) -> None:
+        # clients already have current state from /jobs; only push later changes
+        async with AsyncSessionLocal() as db:
+            row = (
+                await db.execute(select(Job.updated_at, Job.id).order_by(Job.updated_at.desc(), Job.id.desc()).limit(1))
+            ).first()
+        self._cursor = (row.updated_at, row.id) if row else None
+
+    async def _poll_once(self) -> list[dict[str, Any]]:
+        q = select(*job_summary_columns()).order_by(Job.updated_at.asc(), Job.id.asc()).limit(_BATCH_LIMIT)
+        if self._cursor is not None:
+            ts, last_id = self._cursor
+            q = q.where(or_(Job.updated_at > ts, and_(Job.updated_at == ts, Job.id > last_id)))
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(q)).all()
+        self.polls += 1
+        if rows:
+            self._cursor = (rows[-1].updated_at, rows[-1].id)
+        return [to_job_summary(r).model_dump(mode="json", exclude={"result"}) for r in rows]
+
+    def _publish(self, rows: list[dict[str, Any]]) -> None:
+        for q in list(self._subscribers):
+            if q.full():
+                # slow consumer: drop its oldest batch rather than block everyone
+                try:
+                    q.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            q.put_nowait(rows)
+
+    async def _run(self) -> None:
+        try:
+            await self._init_cursor()
+            while self._subscribers:
+                await asyncio.sleep(self.interval)
+                try:
+                    rows = await self._poll_once()
+                except Exception:
+                    log.exception("job stream poll failed")
+                    continue
+                if rows:
+                    self._publish(rows)
+        except asyncio.CancelledError:
+            pass
+
+    async def sse(self, is_disconnected: Any, job_type: str | None = None) -> AsyncIterator[str]:
+        """Yield SSE frames: `event: jobs` with a JSON list of changed rows.
+
+        Rows are not filtered by status so clients also see jobs leaving
+        their current status filter.
+        """
+        q = self.subscribe()
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    rows = await asyncio.wait_for(q.get(), timeout=settings.job_stream_heartbeat_sec)
+                except asyncio.TimeoutError:
+                    if await is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+
+                if job_type:
+                    rows = [r for r in rows if r["job_type"] == job_type]
+                if rows:
+                    yield f"event: jobs\ndata: {json.dumps(rows, default=str)}\n\n"
+        finally:
+            self.unsubscribe(q)
+
+
+job_broadcaster = JobBroadcaster(interval=settings.job_stream_interval_sec)
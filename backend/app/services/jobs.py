@@ -0,0 +1,51 @@
+"""Summary projection of job rows (admin list `view=summary` and the SSE stream).
+
+Summary rows skip the `result` JSON blob and the full `error` text; the
+only thing the list view reads from `result` is a progress number.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import func
+
+from app.db.tables import Job
+from app.schemas.admin import AdminJob
+
+JOB_PROGRESS_KEYS = ("progress", "percent", "pct", "step_progress")
+JOB_ERROR_PREVIEW = 200
+
+
+def job_summary_columns() -> tuple[Any, ...]:
+    return (
+        Job.id,
+        Job.job_id,
+        Job.job_type,
+        Job.status,
+        Job.created_at,
+        Job.updated_at,
+        func.coalesce(*[func.json_extract(Job.result, f"$.{k}") for k in JOB_PROGRESS_KEYS]).label("progress"),
+        func.substr(Job.error, 1, JOB_ERROR_PREVIEW).label("error"),
+    )
+
+
+def as_progress(v: Any) -> float | None:
+    if v is None:
+        return None
+    try:
+        return float(str(v).strip('"'))
+    except ValueError:
+        return None
+
+
+def to_job_summary(r: Any) -> AdminJob:
+    return AdminJob(
+        job_id=r.job_id,
+        job_type=r.job_type,
+        status=r.status,
+        created_at=r.created_at,
+        updated_at=r.updated_at,
+        progress=as_progress(r.progress),
+        error=r.error,
+    )
@@ -0,0 +1,174 @@
+"""Media lookup for GET /api/media/{media_id}.
+
+media_id forms:
+
+- `asset:{StoryAsset.id}` (or a bare integer): the asset's s3_key
+- `video:{episode_id}` / `preview:{episode_id}`: EpisodeOutputs.video_url /
+  preview_video_url
+
+A media_id resolves to a local file under app/static or an S3 object. The
+route serves local files with FileResponse (Range, ETag, and the ASGI
+pathsend extension, i.e. sendfile, when the server offers it). S3 objects
+either redirect to a presigned URL or are proxied through a bounded buffer.
+Both paths let players seek with Range requests. Lookups are cached briefly
+(MEDIA_CACHE_TTL_SEC) because a player scrubbing a video sends many range
+requests for the same id.
+
+Browsers can't put an Authorization header on a <video> element's Range
+requests, so an admin first fetches `/api/media/{id}/link`: the media URL
+with `?token=`, an HMAC of (media_id, expiry) under JWT_SECRET that is valid
+for MEDIA_TOKEN_TTL_SEC and for that one media_id only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.tables import EpisodeOutputs, StoryAsset
+from app.services.assets import parse_s3_url, s3_client
+from app.services.episode_cleanup import STATIC_ROOT, story_bucket
+
+_OUTPUT_KINDS = {"video": "video_url", "preview": "preview_video_url"}
+
+
+@dataclass(frozen=True)
+class MediaTarget:
+    path: Path | None = None  # local file
+    bucket: str | None = None
+    key: str | None = None
+    url: str | None = None  # external URL, redirected to as is
+
+
+_targets: TTLCache | None = None
+
+
+def _target_cache() -> TTLCache:
+    global _targets
+    if _targets is None:
+        _targets = TTLCache(maxsize=4096, ttl=settings.media_cache_ttl_sec)
+    return _targets
+
+
+def _local(url: str) -> MediaTarget | None:
+    root = STATIC_ROOT.resolve()
+    p = (root / url[len("/static/") :].lstrip("/")).resolve()
+    if not p.is_relative_to(root):
+        return None
+    return MediaTarget(path=p)
+
+
+def _from_url(url: str) -> MediaTarget | None:
+    if url.startswith("/static/"):
+        return _local(url)
+    parsed = parse_s3_url(url)
+    if parsed:
+        return MediaTarget(bucket=parsed[0], key=parsed[1])
+    if url.startswith(("http://", "https://")):
+        return MediaTarget(url=url)
+    return None
+
+
+def _asset_target(db: Session, asset_id: int) -> MediaTarget | None:
+    row = db.execute(select(StoryAsset.episode_id, StoryAsset.s3_key).where(StoryAsset.id == asset_id)).first()
+    if not row or not row.s3_key:
+        return None
+    key = str(row.s3_key)
+    if key.startswith(("/static/", "http://", "https://")):
+        return _from_url(key)
+    key = key.lstrip("/")
+    # same bucket routing as episode deletes: by key prefix, else the results
+    # bucket, else whatever bucket the episode's outputs live in
+    results_bucket = settings.s3_results_bucket
+    if not results_bucket:
+        url = db.execute(
+            select(EpisodeOutputs.video_url).where(EpisodeOutputs.episode_id == row.episode_id)
+        ).scalar()
+        parsed = parse_s3_url(str(url)) if url else None
+        results_bucket = parsed[0] if parsed else None
+    bucket = story_bucket(key, results_bucket)
+    return MediaTarget(bucket=bucket, key=key) if bucket else None
+
+
+def _output_target(db: Session, kind: str, episode_id: str) -> MediaTarget | None:
+    url = db.execute(
+        select(getattr(EpisodeOutputs, _OUTPUT_KINDS[kind])).where(EpisodeOutputs.episode_id == episode_id)
+    ).scalar()
+    return _from_url(str(url)) if url else None
+
+
+def resolve_media(db: Session, media_id: str) -> MediaTarget | None:
+    cache = _target_cache()
+    hit = cache.get(media_id)
+    if hit is not None:
+        return hit
+    kind, sep, ref = media_id.partition(":")
+    if not sep:
+        kind, ref = "asset", media_id
+    target: MediaTarget | None = None
+    if kind == "asset" and ref.isdigit():
+        target = _asset_target(db, int(ref))
+    elif kind in _OUTPUT_KINDS and ref:
+        target = _output_target(db, kind, ref)
+    if target is not None:
+        cache.set(media_id, target)
+    return target
+
+
+def clear_media_cache() -> None:
+    _target_cache().clear()
+
+
+def media_cache_stats() -> dict[str, object]:
+    return _target_cache().stats()
+
+
+def _media_sig(media_id: str, exp: int) -> str:
+    msg = f"media:{media_id}:{exp}".encode()
+    return hmac.new(settings.jwt_secret.encode(), msg, hashlib.sha256).hexdigest()
+
+
+def media_token(media_id: str) -> tuple[str, int]:
+    """(token, expiry epoch) for `?token=` on /api/media/{media_id}."""
+    exp = int(time.time() + settings.media_token_ttl_sec)
+    return f"{exp}.{_media_sig(media_id, exp)}", exp
+
+
+def verify_media_token(media_id: str, token: str) -> bool:
+    exp, _, sig = token.partition(".")
+    if not exp.isdigit() or int(exp) < time.time():
+        return False
+    return hmac.compare_digest(sig, _media_sig(media_id, int(exp)))
+
+
+def open_s3_media(
+    bucket: str, key: str, range_header: str | None, if_none_match: str | None, head: bool = False
+) -> dict:
+    """GetObject (HeadObject for HEAD) passing Range / If-None-Match through to S3.
+
+    Raises botocore ClientError: 304 (not modified), 416 / InvalidRange, 404.
+    """
+    params: dict = {"Bucket": bucket, "Key": key}
+    if range_header:
+        params["Range"] = range_header
+    if if_none_match:
+        params["IfNoneMatch"] = if_none_match
+    client = s3_client()
+    return client.head_object(**params) if head else client.get_object(**params)
+
+
+def iter_s3_body(body, chunk_size: int) -> Iterator[bytes]:
+    """Yield a GetObject body in chunk_size pieces (at most one chunk buffered)."""
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
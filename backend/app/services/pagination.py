@@ -0,0 +1,49 @@
+"""Keyset (cursor) pagination helpers for admin list endpoints.
+
+Admin lists are ordered by `(created_at DESC, id DESC)`. A cursor is an opaque
+token encoding the `(created_at, id)` of the last row on a page; the next page
+is fetched with `WHERE (created_at, id) < (:created_at, :id)` so every page
+costs the same index range scan regardless of depth (unlike LIMIT/OFFSET).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), int(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Return (created_at, id). Raises ValueError for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
+def keyset_before(created_col: Any, id_col: Any, cursor: str):
+    """WHERE clause selecting rows strictly after `cursor` in DESC order."""
+    created_at, row_id = decode_cursor(cursor)
+    # expanded row-value comparison; MySQL uses the (created_at, id) range for both forms
+    return or_(created_col < created_at, and_(created_col == created_at, id_col < row_id))
+
+
+def next_cursor(rows: list[Any], limit: int, created_attr: str = "created_at", id_attr: str = "id") -> str | None:
+    """Cursor for the page following `rows`, or None when this was the last page."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    created_at = getattr(last, created_attr)
+    if created_at is None:
+        return None
+    return encode_cursor(created_at, getattr(last, id_attr))
@@ -0,0 +1,244 @@
+"""Incremental daily rollups backing /api/admin/metrics/overview.
+
+Each metric aggregates one source table into `admin_metric_rollup_daily`
+rows keyed by (metric, DATE(created_at), status). A refresh only recomputes
+the days that can have changed since the metric's watermark:
+
+- sources with an `updated_at` column (users, episodes, jobs): days of rows
+  updated at/after the watermark
+- append-mostly sources (orders, credit_logs): days at/after the watermark
+- always the trailing `METRICS_ROLLUP_LOOKBACK_DAYS` (late status updates)
+
+Recomputing a day is idempotent, so overlapping windows are harmless.
+Deletes done through this backend adjust the rollup in the same transaction
+(`adjust_rollup`); anything else is corrected by `refresh_rollups(full=True)`.
+
+Enable with METRICS_ROLLUPS=true after `scripts/rollup_metrics.py --create`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.admin_tables import MetricRollupDaily, MetricRollupWatermark
+from app.db.session import SessionLocal
+from app.db.tables import CreditLog, Episode, Job, Order, User
+from app.schemas.admin import AdminOverviewMetrics, DailyAgg, StatusAgg
+
+log = logging.getLogger(__name__)
+
+_DAY_CHUNK = 100
+
+
+@dataclass(frozen=True)
+class _Source:
+    table: Any
+    created: Any
+    changed: Any | None  # None: no update marker, rely on watermark + lookback
+    status: Any | None  # None: single 'all' bucket
+    amount: Any | None = None
+
+
+def _sources() -> dict[str, _Source]:
+    return {
+        "users": _Source(
+            User, User.created_at, User.updated_at, case((User.is_active == 1, "active"), else_="inactive")
+        ),
+        "episodes": _Source(Episode, Episode.created_at, Episode.updated_at, None),
+        "jobs": _Source(Job, Job.created_at, Job.updated_at, Job.status),
+        "orders": _Source(Order, Order.created_at, None, Order.status, Order.amount),
+        "credit_logs": _Source(CreditLog, CreditLog.created_at, None, None, CreditLog.amount),
+    }
+
+
+def _to_day(v: Any) -> date:
+    if isinstance(v, datetime):
+        return v.date()
+    if isinstance(v, date):
+        return v
+    return date.fromisoformat(str(v)[:10])
+
+
+def _chunks(xs: list[date], n: int) -> Iterable[list[date]]:
+    for i in range(0, len(xs), n):
+        yield xs[i : i + n]
+
+
+def _dirty_days(db: Session, src: _Source, watermark: datetime, today: date) -> set[date]:
+    days = {today - timedelta(days=i) for i in range(settings.metrics_rollup_lookback_days + 1)}
+    if src.changed is not None:
+        q = select(func.date(src.created)).where(src.changed >= watermark).distinct()
+        days |= {_to_day(d) for d in db.execute(q).scalars() if d is not None}
+    else:
+        d = _to_day(watermark)
+        while d <= today:
+            days.add(d)
+            d += timedelta(days=1)
+    return days
+
+
+def _recompute(db: Session, metric: str, src: _Source, days: list[date] | None) -> None:
+    day_expr = func.date(src.created)
+    cols = [day_expr.label("day"), func.count().label("n")]
+    group = [day_expr]
+    if src.status is not None:
+        cols.append(src.status.label("status"))
+        group.append(src.status)
+    if src.amount is not None:
+        cols.append(func.coalesce(func.sum(src.amount), 0).label("amount"))
+    base = select(*cols).select_from(src.table).group_by(*group)
+
+    R = MetricRollupDaily
+    windows: Iterable[list[date] | None] = [None] if days is None else _chunks(days, _DAY_CHUNK)
+    for chunk in windows:
+        q = base
+        clear = delete(R).where(R.metric == metric)
+        if chunk is not None:
+            # range bound keeps the scan on created_at; IN drops untouched days in between
+            q = q.where(
+                src.created >= datetime.combine(chunk[0], time.min),
+                src.created < datetime.combine(chunk[-1] + timedelta(days=1), time.min),
+                day_expr.in_([d.isoformat() for d in chunk]),
+            )
+            clear = clear.where(R.day.in_(chunk))
+
+        rows = db.execute(q).all()
+        db.execute(clear)
+        if rows:
+            db.execute(
+                insert(R),
+                [
+                    {
+                        "metric": metric,
+                        "day": _to_day(r.day),
+                        "status": str(r.status) if src.status is not None else "all",
+                        "count": int(r.n),
+                        "amount_sum": int(r.amount or 0) if src.amount is not None else 0,
+                    }
+                    for r in rows
+                ],
+            )
+
+
+def refresh_rollups(db: Session, full: bool = False) -> dict[str, int]:
+    """Bring every metric up to date. Returns days recomputed per metric (-1 = full)."""
+
+    today = _to_day(db.execute(select(func.current_date())).scalar())
+    out: dict[str, int] = {}
+    for metric, src in _sources().items():
+        marker = src.changed if src.changed is not None else src.created
+        # read the next watermark first: rows changing mid-refresh are picked up next time
+        next_wm = db.execute(select(func.max(marker))).scalar()
+
+        wm_row = db.get(MetricRollupWatermark, metric)
+        if full or wm_row is None or wm_row.watermark is None:
+            _recompute(db, metric, src, None)
+            out[metric] = -1
+        else:
+            days = sorted(_dirty_days(db, src, wm_row.watermark, today))
+            _recompute(db, metric, src, days)
+            out[metric] = len(days)
+
+        if wm_row is None:
+            wm_row = MetricRollupWatermark(metric=metric)
+            db.add(wm_row)
+        if next_wm is not None:
+            wm_row.watermark = next_wm
+        wm_row.refreshed_at = func.now()
+        db.commit()
+    return out
+
+
+def adjust_rollup(db: Session, metric: str, day: date, status: str, delta: int, amount: int = 0) -> None:
+    """Apply a known row delta (e.g. an admin delete) in the caller's transaction."""
+    if not settings.metrics_rollups:
+        return
+    R = MetricRollupDaily
+    db.execute(
+        update(R)
+        .where(R.metric == metric, R.day == day, R.status == status)
+        .values(count=R.count + delta, amount_sum=R.amount_sum + amount)
+    )
+
+
+async def rollup_overview(db: AsyncSession, days: int) -> AdminOverviewMetrics:
+    R = MetricRollupDaily
+
+    totals = (
+        await db.execute(
+            select(R.metric, R.status, func.sum(R.count), func.sum(R.amount_sum))
+            .where(R.metric.in_(["users", "episodes", "jobs", "orders"]))
+            .group_by(R.metric, R.status)
+        )
+    ).all()
+
+    # the DB's date, like refresh_rollups and the raw now() - interval queries
+    today = _to_day((await db.execute(select(func.current_date()))).scalar())
+    since = today - timedelta(days=int(days))
+    daily = (
+        await db.execute(
+            select(R.metric, R.day, func.sum(R.count), func.sum(R.amount_sum))
+            .where(R.metric.in_(["orders", "credit_logs"]), R.day >= since)
+            .group_by(R.metric, R.day)
+            .order_by(R.day.asc())
+        )
+    ).all()
+
+    by_metric: dict[str, list[tuple[str, int, int]]] = {}
+    for metric, status, n, amount in totals:
+        by_metric.setdefault(metric, []).append((status, int(n or 0), int(amount or 0)))
+
+    def _total(metric: str, status: str | None = None) -> int:
+        return sum(n for s, n, _ in by_metric.get(metric, []) if status is None or s == status)
+
+    return AdminOverviewMetrics(
+        users_total=_total("users"),
+        users_active=_total("users", "active"),
+        episodes_total=_total("episodes"),
+        jobs_total=_total("jobs"),
+        jobs_by_status=[
+            StatusAgg(status=s, count=n, amount_sum=None) for s, n, _ in by_metric.get("jobs", []) if n
+        ],
+        orders_by_status=[
+            StatusAgg(status=s, count=n, amount_sum=a) for s, n, a in by_metric.get("orders", []) if n
+        ],
+        orders_daily=[
+            DailyAgg(date=_to_day(d).isoformat(), count=int(n or 0), amount_sum=int(a or 0))
+            for m, d, n, a in daily
+            if m == "orders"
+        ],
+        credit_logs_daily=[
+            DailyAgg(date=_to_day(d).isoformat(), count=int(n or 0), amount_sum=int(a or 0))
+            for m, d, n, a in daily
+            if m == "credit_logs"
+        ],
+    )
+
+
+def _refresh_once() -> dict[str, int]:
+    db = SessionLocal()
+    try:
+        return refresh_rollups(db)
+    finally:
+        db.close()
+
+
+async def run_rollup_loop(interval: float) -> None:
+    """Background refresher started from create_app() when METRICS_ROLLUPS is on."""
+    while True:
+        try:
+            await asyncio.to_thread(_refresh_once)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("metrics rollup refresh failed")
+        await asyncio.sleep(interval)
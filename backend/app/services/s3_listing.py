@@ -0,0 +1,244 @@
+"""In-memory cache of S3 listings for /api/admin/assets/{kind}.
+
+One snapshot per (bucket, prefix): sorted keys with sizes and mtimes in
+parallel arrays (a few dozen bytes per key beyond the key string itself).
+A query is served by any snapshot whose prefix covers it.
+
+- no snapshot yet: the caller lists S3 directly; a background build starts
+- older than S3_LISTING_CACHE_TTL_SEC: served as is, one background refresh
+- writes through this backend (uploads, completed presigned uploads,
+  delete_s3_objects) patch every
+  covering snapshot immediately
+
+Listings above S3_LISTING_CACHE_MAX_KEYS are not cached (served from S3):
+the walk stops at the limit, and neither that prefix nor any broader one
+in the bucket is walked again for S3_LISTING_CACHE_TOO_LARGE_SEC.
+Per-process, like the other caches in this app.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.services.asset_index import page_sorted
+from app.services.assets import ListedAsset, ListedPage, iter_s3_objects
+
+log = logging.getLogger(__name__)
+
+
+class _TooLarge(Exception):
+    pass
+
+
+class ListingSnapshot:
+    def __init__(self, bucket: str, prefix: str) -> None:
+        self.bucket = bucket
+        self.prefix = prefix
+        self.keys: list[str] = []
+        self.sizes = array("q")
+        self.mtimes = array("d")  # epoch seconds
+        self.built_at = 0.0  # time.time() of the listing
+        self.built_mono = 0.0
+        self.build_ms = 0.0
+
+    @classmethod
+    def build(cls, bucket: str, prefix: str, max_keys: int) -> "ListingSnapshot":
+        snap = cls(bucket, prefix)
+        t0 = time.perf_counter()
+        started = time.time()
+        rows: list[tuple[str, int, float]] = []
+        for page in iter_s3_objects(bucket, prefix):
+            if len(rows) + len(page) > max_keys:
+                raise _TooLarge(f"{bucket}/{prefix}: more than {max_keys} keys")
+            for a in page:
+                rows.append((a.key, a.size or 0, a.last_modified.timestamp() if a.last_modified else 0.0))
+        rows.sort()  # S3 already returns keys in order; cheap insurance
+        snap.keys = [r[0] for r in rows]
+        snap.sizes = array("q", (r[1] for r in rows))
+        snap.mtimes = array("d", (r[2] for r in rows))
+        snap.built_at = started
+        snap.built_mono = time.monotonic()
+        snap.build_ms = (time.perf_counter() - t0) * 1000
+        return snap
+
+    def _item(self, key: str) -> ListedAsset:
+        i = bisect.bisect_left(self.keys, key)
+        ts = self.mtimes[i]
+        return ListedAsset(
+            key=key,
+            size=self.sizes[i],
+            last_modified=datetime.fromtimestamp(ts, tz=timezone.utc) if ts else None,
+        )
+
+    def page(self, prefix: str, limit: int, cursor: str | None, delimiter: str | None) -> ListedPage:
+        return page_sorted(self.keys, self._item, prefix, limit, cursor, delimiter)
+
+    def put(self, key: str, size: int, mtime: float) -> None:
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            self.sizes[i] = size
+            self.mtimes[i] = mtime
+            return
+        self.keys.insert(i, key)
+        self.sizes.insert(i, size)
+        self.mtimes.insert(i, mtime)
+
+    def remove(self, key: str) -> None:
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+            del self.sizes[i]
+            del self.mtimes[i]
+
+
+class S3ListingCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snaps: dict[tuple[str, str], ListingSnapshot] = {}
+        self._inflight: set[tuple[str, str]] = set()
+        # writes seen while a build is running, replayed onto the new snapshot
+        self._journal: dict[tuple[str, str], list[tuple[str, str, int, float]]] = {}
+        # (bucket, prefix) -> monotonic time until which it is not retried after an error
+        self._skip: dict[tuple[str, str], float] = {}
+        # (bucket, prefix) over MAX_KEYS -> monotonic time until which it (and any broader prefix) is not walked
+        self._too_large: dict[tuple[str, str], float] = {}
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="s3-listing")
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.errors = 0
+
+    def _covering(self, bucket: str, prefix: str) -> ListingSnapshot | None:
+        best: ListingSnapshot | None = None
+        for (b, p), snap in self._snaps.items():
+            if b == bucket and prefix.startswith(p) and (best is None or len(p) > len(best.prefix)):
+                best = snap
+        return best
+
+    def page(
+        self,
+        bucket: str,
+        prefix: str,
+        limit: int,
+        cursor: str | None = None,
+        delimiter: str | None = None,
+    ) -> tuple[ListedPage, float] | None:
+        """(page, listed_at epoch) from a covering snapshot, or None (caller lists S3).
+
+        Schedules a build on a miss and a background refresh once the TTL passed.
+        """
+        if not settings.s3_listing_cache:
+            return None
+        with self._lock:
+            snap = self._covering(bucket, prefix)
+            if snap is None:
+                self.misses += 1
+                self._schedule(bucket, prefix)
+                return None
+            self.hits += 1
+            if time.monotonic() - snap.built_mono >= settings.s3_listing_cache_ttl_sec:
+                self._schedule(snap.bucket, snap.prefix)
+            return snap.page(prefix, limit, cursor, delimiter), snap.built_at
+
+    def _schedule(self, bucket: str, prefix: str) -> None:
+        key = (bucket, prefix)
+        now = time.monotonic()
+        if key in self._inflight or self._skip.get(key, 0) > now:
+            return
+        # a prefix covering one known to be too large is at least as large
+        if any(b == bucket and p.startswith(prefix) and until > now for (b, p), until in self._too_large.items()):
+            return
+        self._inflight.add(key)
+        self._journal[key] = []
+        self._pool.submit(self._build, bucket, prefix)
+
+    def _build(self, bucket: str, prefix: str) -> None:
+        key = (bucket, prefix)
+        try:
+            snap = ListingSnapshot.build(bucket, prefix, settings.s3_listing_cache_max_keys)
+        except Exception as e:
+            if isinstance(e, _TooLarge):
+                log.info("s3 listing not cached: %s", e)
+            else:
+                log.exception("s3 listing build failed for %s/%s", bucket, prefix)
+            with self._lock:
+                self._inflight.discard(key)
+                self._journal.pop(key, None)
+                if isinstance(e, _TooLarge):
+                    wait = settings.s3_listing_cache_too_large_sec
+                    self._too_large[key] = time.monotonic() + wait if wait > 0 else float("inf")
+                else:
+                    self.errors += 1
+                    self._skip[key] = time.monotonic() + settings.s3_listing_cache_ttl_sec
+            return
+
+        with self._lock:
+            self._inflight.discard(key)
+            for op, k, size, ts in self._journal.pop(key, []):
+                if op == "put":
+                    snap.put(k, size, ts)
+                else:
+                    snap.remove(k)
+            self._snaps[key] = snap
+            self.builds += 1
+            # narrower snapshots are now redundant
+            for k in [k for k in self._snaps if k[0] == bucket and k[1] != prefix and k[1].startswith(prefix)]:
+                del self._snaps[k]
+            while len(self._snaps) > max(1, settings.s3_listing_cache_max_entries):
+                oldest = min(self._snaps, key=lambda k: self._snaps[k].built_mono)
+                del self._snaps[oldest]
+
+    def note_put(self, bucket: str, key: str, size: int, mtime: float | None = None) -> None:
+        ts = time.time() if mtime is None else mtime
+        with self._lock:
+            for (b, p), snap in self._snaps.items():
+                if b == bucket and key.startswith(p):
+                    snap.put(key, size, ts)
+            for (b, p), ops in self._journal.items():
+                if b == bucket and key.startswith(p):
+                    ops.append(("put", key, size, ts))
+
+    def note_delete(self, bucket: str, keys: list[str]) -> None:
+        with self._lock:
+            for (b, p), snap in self._snaps.items():
+                if b != bucket:
+                    continue
+                for key in keys:
+                    if key.startswith(p):
+                        snap.remove(key)
+            for (b, p), ops in self._journal.items():
+                if b == bucket:
+                    ops.extend(("delete", k, 0, 0.0) for k in keys if k.startswith(p))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snaps.clear()
+            self._skip.clear()
+            self._too_large.clear()
+
+    def stats(self) -> dict[str, object]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "snapshots": {
+                    f"{b}/{p}": {"keys": len(s.keys), "age_sec": round(now - s.built_mono, 1), "build_ms": round(s.build_ms, 1)}
+                    for (b, p), s in self._snaps.items()
+                },
+                "inflight": len(self._inflight),
+                "too_large": [f"{b}/{p}" for (b, p), until in self._too_large.items() if until > now],
+                "hits": self.hits,
+                "misses": self.misses,
+                "builds": self.builds,
+                "errors": self.errors,
+                "ttl_sec": settings.s3_listing_cache_ttl_sec,
+            }
+
+
+s3_listing_cache = S3ListingCache()
@@ -0,0 +1,125 @@
+"""`q` search for the admin user/episode lists.
+
+The original filter was `LIKE '%q%'` OR-ed over three columns, which no
+B-tree index can serve. `search_filter` picks a strategy (`search` param):
+
+- prefix:   opt-in (`search=prefix`): `col LIKE 'q%'` on the indexed id /
+            email columns, an index range scan. It only matches ids and
+            emails that start with q, so auto never picks it; the Users /
+            Episodes pages send it from their "starts with" checkbox.
+- fulltext: `MATCH(...) AGAINST('"q"' IN BOOLEAN MODE)` on a FULLTEXT
+            index built WITH PARSER ngram (scripts/create_search_indexes.py).
+            An ngram phrase query matches substrings. A LIKE recheck drops
+            its false positives. The index must be built with
+            innodb_ft_enable_stopword=OFF: otherwise the ngram parser skips
+            every token containing a stopword ("at", "in", "a", ...), so
+            e.g. "cat" would miss rows. Only indexes carrying
+            FULLTEXT_INDEX_COMMENT (set by the script) count as ready.
+- contains: the original LIKE '%q%' (full scan). Used on other
+            dialects, before the index exists, or for queries shorter
+            than the ngram size.
+
+auto = fulltext when a stopword-free index exists, else contains: both
+return exactly the rows of the original filter. Index availability is detected once per
+SEARCH_INDEX_CHECK_SEC from information_schema.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from sqlalchemy import and_, or_, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.tables import Episode, User
+
+SearchMode = Literal["auto", "prefix", "fulltext", "contains"]
+
+# target -> (model, FULLTEXT index name, its columns, prefix-searchable indexed columns)
+SEARCH_TARGETS: dict[str, tuple[Any, str, tuple[str, ...], tuple[str, ...]]] = {
+    "users": (User, "ft_users_search", ("user_id", "email", "username"), ("user_id", "email")),
+    "episodes": (Episode, "ft_episodes_search", ("episode_id", "title", "user_id"), ("episode_id", "user_id")),
+}
+
+# marks indexes built without stopwords; older ones are not used
+FULLTEXT_INDEX_COMMENT = "ngram, stopwords off"
+
+_index_cache: TTLCache | None = None
+_strategy_counts: dict[str, int] = {}
+
+
+def _indexes() -> TTLCache:
+    global _index_cache
+    if _index_cache is None:
+        _index_cache = TTLCache(maxsize=16, ttl=settings.search_index_check_sec)
+    return _index_cache
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains(model: Any, cols: tuple[str, ...], q: str) -> Any:
+    like = f"%{q}%"
+    return or_(*(getattr(model, c).like(like) for c in cols))
+
+
+def _prefix(model: Any, cols: tuple[str, ...], q: str) -> Any:
+    # literal pattern (not CONCAT) so MySQL can turn it into an index range
+    pattern = _escape_like(q) + "%"
+    return or_(*(getattr(model, c).like(pattern, escape="\\") for c in cols))
+
+
+async def fulltext_ready(db: AsyncSession, target: str) -> bool:
+    """True when the target's stopword-free FULLTEXT index exists (MySQL only, cached)."""
+    if not settings.search_fulltext or db.get_bind().dialect.name != "mysql":
+        return False
+    model, index, _, _ = SEARCH_TARGETS[target]
+    cache = _indexes()
+    hit = cache.get(index)
+    if hit is not None:
+        return hit
+    found = (
+        await db.execute(
+            text(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND INDEX_NAME = :i "
+                "AND INDEX_TYPE = 'FULLTEXT' AND INDEX_COMMENT = :c LIMIT 1"
+            ),
+            {"t": model.__tablename__, "i": index, "c": FULLTEXT_INDEX_COMMENT},
+        )
+    ).first() is not None
+    cache.set(index, found)
+    return found
+
+
+def _fulltext(model: Any, cols: tuple[str, ...], q: str) -> Any:
+    phrase = q.replace('"', " ").strip()
+    return and_(
+        match(*(getattr(model, c) for c in cols), against=f'"{phrase}"').in_boolean_mode(),
+        _contains(model, cols, q),
+    )
+
+
+async def search_filter(db: AsyncSession, target: str, q: str, mode: SearchMode = "auto") -> tuple[Any, str]:
+    """(where clause, strategy used) for `q` on 'users' or 'episodes'."""
+    model, _, ft_cols, prefix_cols = SEARCH_TARGETS[target]
+    q = q.strip()
+    strategy = "prefix" if mode == "prefix" else "contains"
+    if mode in ("auto", "fulltext"):
+        if len(q.replace('"', "")) >= settings.search_ngram_size and await fulltext_ready(db, target):
+            strategy = "fulltext"
+
+    _strategy_counts[strategy] = _strategy_counts.get(strategy, 0) + 1
+    if strategy == "prefix":
+        return _prefix(model, prefix_cols, q), strategy
+    if strategy == "fulltext":
+        return _fulltext(model, ft_cols, q), strategy
+    return _contains(model, ft_cols, q), strategy
+
+
+def search_stats() -> dict[str, Any]:
+    return {"strategies": dict(_strategy_counts), "indexes": _indexes().stats()}
@@ -0,0 +1,285 @@
+"""Streaming uploads for /api/admin/assets/{kind}/upload.
+
+The multipart request body is parsed as it arrives (python-multipart's
+push parser) instead of through UploadFile, so the file is never held in
+memory or spooled to a temp file first:
+
+- S3: bytes are cut into S3_UPLOAD_PART_MB parts and sent with
+  UploadPart on a small thread pool (S3_UPLOAD_CONCURRENCY parts in flight,
+  so memory stays ~part size x (concurrency + 1)). Small files use a single
+  PutObject; failures abort the multipart upload.
+- local: chunks go to a temp file under UPLOAD_TMP_DIR (outside the served
+  and indexed asset trees), moved into place when complete (no partial
+  files, no name collisions).
+
+UploadError is the client's fault (400); UploadStorageError means S3
+failed (502).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator
+
+from anyio import to_thread
+from botocore.exceptions import BotoCoreError, ClientError
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.core.config import settings
+from app.services.assets import s3_client
+from app.services.s3_listing import s3_listing_cache
+
+# S3 minimum for every part but the last
+_MIN_PART = 5 * 1024 * 1024
+_LOCAL_BUFFER = 1024 * 1024
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _upload_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=max(1, settings.s3_upload_concurrency) * 4, thread_name_prefix="s3-upload"
+            )
+        return _pool
+
+
+class UploadError(Exception):
+    pass
+
+
+class UploadStorageError(Exception):
+    pass
+
+
+class S3MultipartWriter:
+    """Blocking writer; call its methods from worker threads, not the event loop."""
+
+    def __init__(self, bucket: str, key: str, content_type: str | None) -> None:
+        self.bucket = bucket
+        self.key = key
+        self.content_type = content_type
+        self.part_size = max(_MIN_PART, settings.s3_upload_part_mb * 1024 * 1024)
+        self.size = 0
+        self._client = s3_client()
+        self._upload_id: str | None = None
+        self._parts: list[Future] = []
+        self._slots = threading.Semaphore(max(1, settings.s3_upload_concurrency))
+
+    def _extra(self) -> dict:
+        return {"ContentType": self.content_type} if self.content_type else {}
+
+    def _send(self, number: int, data: bytes) -> dict:
+        try:
+            resp = self._client.upload_part(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, PartNumber=number, Body=data
+            )
+            return {"PartNumber": number, "ETag": resp["ETag"]}
+        finally:
+            self._slots.release()
+
+    def put_part(self, data: bytes) -> None:
+        """Queue one full part; blocks while S3_UPLOAD_CONCURRENCY parts are in flight."""
+        if self._upload_id is None:
+            resp = self._client.create_multipart_upload(Bucket=self.bucket, Key=self.key, **self._extra())
+            self._upload_id = resp["UploadId"]
+        for f in self._parts:
+            if f.done() and f.exception() is not None:
+                raise UploadStorageError(f"part upload failed: {f.exception()}")
+        self._slots.acquire()
+        self.size += len(data)
+        self._parts.append(_upload_pool().submit(self._send, len(self._parts) + 1, data))
+
+    def complete(self, tail: bytes) -> int:
+        if self._upload_id is None:
+            # fits in one part: a single PutObject
+            self._client.put_object(Bucket=self.bucket, Key=self.key, Body=tail, **self._extra())
+            self.size = len(tail)
+        else:
+            if tail:
+                self.put_part(tail)
+            parts = [f.result() for f in self._parts]
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, MultipartUpload={"Parts": parts}
+            )
+        s3_listing_cache.note_put(self.bucket, self.key, self.size)
+        return self.size
+
+    def abort(self) -> None:
+        for f in self._parts:
+            f.cancel()
+        if self._upload_id is not None:
+            try:
+                self._client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+            except Exception:
+                pass
+
+
+class _FilePart:
+    """Collects the `file` field's bytes from the push parser callbacks."""
+
+    def __init__(self, boundary: bytes, field: str) -> None:
+        self.field = field
+        self.filename: str | None = None
+        self.content_type: str | None = None
+        self.seen = False
+        self.chunks: list[bytes] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._active = False
+        self._done = False
+        self.parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._header_end,
+                "on_headers_finished": self._headers_finished,
+                "on_part_data": self._part_data,
+                "on_part_end": self._part_end,
+            },
+        )
+
+    def _part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _headers_finished(self) -> None:
+        _, opts = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = (opts.get(b"name") or b"").decode("utf-8", "replace")
+        self._active = name == self.field and not self._done
+        if self._active:
+            self.seen = True
+            self.filename = (opts.get(b"filename") or b"").decode("utf-8", "replace") or None
+            ct = self._headers.get(b"content-type")
+            self.content_type = ct.decode("latin-1") if ct else None
+
+    def _part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._active:
+            self.chunks.append(data[start:end])
+
+    def _part_end(self) -> None:
+        if self._active:
+            self._done = True
+        self._active = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        try:
+            self.parser.write(chunk)
+        except MultipartParseError as e:
+            raise UploadError(f"malformed multipart body: {e}")
+        out, self.chunks = self.chunks, []
+        return out
+
+    def finalize(self) -> None:
+        try:
+            self.parser.finalize()
+        except MultipartParseError as e:
+            raise UploadError(f"malformed multipart body: {e}")
+
+
+def _boundary(content_type: str) -> bytes:
+    ctype, opts = parse_options_header(content_type)
+    boundary = opts.get(b"boundary")
+    if ctype != b"multipart/form-data" or not boundary:
+        raise UploadError("multipart/form-data with a boundary required")
+    return boundary
+
+
+async def _file_chunks(content_type: str, body: AsyncIterator[bytes], field: str, meta: dict) -> AsyncIterator[bytes]:
+    part = _FilePart(_boundary(content_type), field)
+    async for chunk in body:
+        chunks = part.feed(chunk)
+        if part.seen:
+            meta["filename"], meta["content_type"] = part.filename, part.content_type
+        for data in chunks:
+            if data:
+                yield data
+    part.finalize()
+    if not part.seen:
+        raise UploadError(f"missing '{field}' field")
+
+
+async def stream_to_s3(
+    content_type: str, body: AsyncIterator[bytes], bucket: str, key: str, field: str = "file"
+) -> int:
+    """Stream the multipart field `field` into s3://bucket/key. Returns bytes written."""
+    meta: dict = {}
+    writer: S3MultipartWriter | None = None
+    buf = bytearray()
+    try:
+        async for data in _file_chunks(content_type, body, field, meta):
+            if writer is None:
+                writer = S3MultipartWriter(bucket, key, meta.get("content_type"))
+            buf += data
+            while len(buf) >= writer.part_size:
+                part = bytes(buf[: writer.part_size])
+                del buf[: writer.part_size]
+                await to_thread.run_sync(writer.put_part, part)
+        if writer is None:
+            writer = S3MultipartWriter(bucket, key, meta.get("content_type"))
+        return await to_thread.run_sync(writer.complete, bytes(buf))
+    except BaseException as e:
+        if writer is not None:
+            await to_thread.run_sync(writer.abort)
+        if isinstance(e, (ClientError, BotoCoreError)):
+            raise UploadStorageError(f"S3 upload failed: {e}") from e
+        raise
+
+
+def _move_into_place(tmp: Path, dest: Path) -> None:
+    try:
+        os.replace(tmp, dest)  # atomic when UPLOAD_TMP_DIR is on the same filesystem
+    except OSError:
+        shutil.move(tmp, dest)
+
+
+async def stream_to_file(content_type: str, body: AsyncIterator[bytes], dest: Path, field: str = "file") -> int:
+    """Stream the multipart field `field` into dest via a staging file. Returns bytes written."""
+    tmp_dir = Path(settings.upload_tmp_dir)
+
+    def _prepare() -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    await to_thread.run_sync(_prepare)
+    tmp = tmp_dir / f"{uuid.uuid4().hex}.part"
+    f = await to_thread.run_sync(open, tmp, "wb")
+    size = 0
+    buf = bytearray()
+    try:
+        async for data in _file_chunks(content_type, body, field, {}):
+            buf += data
+            size += len(data)
+            if len(buf) >= _LOCAL_BUFFER:
+                await to_thread.run_sync(f.write, bytes(buf))
+                buf.clear()
+        if buf:
+            await to_thread.run_sync(f.write, bytes(buf))
+        await to_thread.run_sync(f.close)
+        await to_thread.run_sync(_move_into_place, tmp, dest)
+        return size
+    except BaseException:
+        f.close()
+        tmp.unlink(missing_ok=True)
+        raise
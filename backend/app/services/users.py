@@ -0,0 +1,134 @@
+"""Admin user projection and two-statement user patches.
+
+`user_projection()` is the users + plan + credit + oauth row shown in the
+admin (list and PATCH responses). Each patch reads the projection once,
+locking the users row (also the existence check: a missing user returns
+None without writing), then writes with one statement:
+
+- credit/plan: upsert (ON DUPLICATE KEY UPDATE / ON CONFLICT DO UPDATE;
+  UPDATE-then-INSERT on other dialects). `add` is `credit = credit + delta`
+  in SQL, so concurrent adds never lose updates.
+- active: one UPDATE.
+
+The response is the locked row with the patched value applied; nothing is
+read back after the write.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.tables import Credit, OAuth, Plan, User
+from app.schemas.admin import AdminUser
+
+_UPSERT_DIALECTS = {"mysql": mysql, "sqlite": sqlite, "postgresql": postgresql}
+
+
+def user_projection(*extra: Any):
+    return (
+        select(
+            *extra,
+            User.user_id,
+            User.email,
+            User.username,
+            User.is_active,
+            User.created_at,
+            Plan.plan,
+            Credit.credit,
+            OAuth.oauth_provider,
+        )
+        .select_from(User)
+        .outerjoin(Plan, Plan.user_id == User.user_id)
+        .outerjoin(Credit, Credit.user_id == User.user_id)
+        .outerjoin(OAuth, OAuth.user_id == User.user_id)
+    )
+
+
+def to_admin_user(row: Any) -> AdminUser:
+    return AdminUser(
+        user_id=row.user_id,
+        email=row.email,
+        username=row.username,
+        is_active=row.is_active,
+        created_at=row.created_at,
+        plan=row.plan,
+        credit=row.credit,
+        oauth_provider=row.oauth_provider,
+    )
+
+
+def _lock_user(db: Session, user_id: str) -> AdminUser | None:
+    """Projection of the user as it is before the patch; locks the users row until commit.
+
+    Doubles as the existence check. Admin patches all take this lock first,
+    so they are serialized per user and `before + delta` is the new balance.
+    """
+    row = db.execute(user_projection().where(User.user_id == user_id).with_for_update(of=User)).first()
+    if row is None:
+        db.rollback()
+        return None
+    return to_admin_user(row)
+
+
+def _upsert(db: Session, model: Any, user_id: str, column: str, value: Any, add: bool = False) -> Any:
+    """Write model.column for user_id (insert or update); returns the stored value if the DB reports it.
+
+    MySQL: INSERT ... ON DUPLICATE KEY UPDATE. SQLite/PostgreSQL: ON CONFLICT
+    DO UPDATE ... RETURNING. Other dialects: UPDATE, then INSERT if no row
+    matched (safe under the _lock_user lock). `add` is `credit + delta` in SQL.
+    """
+    bind = db.get_bind()
+    dialect = _UPSERT_DIALECTS.get(bind.dialect.name)
+    col = getattr(model, column)
+    if dialect is None:
+        new = func.coalesce(col, 0) + value if add else value
+        if db.execute(update(model).where(model.user_id == user_id).values({column: new})).rowcount == 0:
+            db.execute(insert(model).values({"user_id": user_id, column: value}))
+        return None
+    stmt = dialect.insert(model).values({"user_id": user_id, column: value})
+    new = stmt.inserted[column] if dialect is mysql else stmt.excluded[column]
+    new = func.coalesce(col, 0) + new if add else new
+    if dialect is mysql:
+        db.execute(stmt.on_duplicate_key_update({column: new}))
+        return None
+    stmt = stmt.on_conflict_do_update(index_elements=[model.user_id], set_={column: new})
+    if not bind.dialect.insert_returning:
+        db.execute(stmt)
+        return None
+    return db.execute(stmt.returning(col)).scalar()
+
+
+def patch_credit(db: Session, user_id: str, mode: Literal["set", "add"], amount: int) -> AdminUser | None:
+    before = _lock_user(db, user_id)
+    if before is None:
+        return None
+    stored = _upsert(db, Credit, user_id, "credit", int(amount), add=mode == "add")
+    if stored is None:
+        stored = (before.credit or 0) + int(amount) if mode == "add" else int(amount)
+    db.commit()
+    return before.model_copy(update={"credit": stored})
+
+
+def patch_plan(db: Session, user_id: str, plan: str) -> AdminUser | None:
+    before = _lock_user(db, user_id)
+    if before is None:
+        return None
+    _upsert(db, Plan, user_id, "plan", plan)
+    db.commit()
+    return before.model_copy(update={"plan": plan})
+
+
+def patch_active(db: Session, user_id: str, is_active: int) -> AdminUser | None:
+    before = _lock_user(db, user_id)
+    if before is None:
+        return None
+    # metrics rollups pick up users by updated_at
+    db.execute(
+        update(User).where(User.user_id == user_id).values(is_active=int(is_active), updated_at=func.now())
+    )
+    db.commit()
+    return before.model_copy(update={"is_active": int(is_active)})
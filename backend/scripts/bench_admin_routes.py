@@ -0,0 +1,177 @@
+"""Statement-count and latency budgets for every /api/admin route (regression gate).
+
+Runs create_app() in-process through TestClient (admin auth bypassed)
+against DATABASE_URL: a MySQL container or a SQLite file as stand-in.
+Per request, the statement count and DB time come from the request
+metrics hooks (app/core/metrics.py). Each route has a budget below:
+max statements (exact for a given code path, so N+1 regressions show up
+immediately) and max latency in ms (best of --repeat; scale with
+--latency-factor for slower hosts). Exits 1 if any budget is exceeded.
+
+Mutating routes run once, on the newest bench_* rows: PATCH a user,
+DELETE an episode, bulk-delete two episodes, upload and then remove a
+local font. /jobs/stream (SSE) is not covered, and /metrics/overview only
+runs on MySQL (its SQL is MySQL-only). S3-only routes answer 400
+without bucket settings, which is still measured.
+
+Seed first (scratch database only):
+  python scripts/seed_bench_data.py --scale 0.01 --create
+
+Usage:
+  python scripts/bench_admin_routes.py [--repeat N] [--latency-factor F] [--seed SCALE]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core import security
+from app.core.cache import single_flight_caches
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import engine
+from app.db.tables import Episode, Job, StoryShot, User
+from app.main import create_app
+from app.services.counts import clear_count_cache
+
+args = sys.argv[1:]
+
+
+def _opt(name: str, default, cast):
+    return cast(args[args.index(name) + 1]) if name in args else default
+
+
+repeat = _opt('--repeat', 5, int)
+latency_factor = _opt('--latency-factor', 1.0, float)
+seed_scale = _opt('--seed', 0.0, float)
+
+if seed_scale:
+    from seed_bench_data import seed
+
+    seed(scale=seed_scale, create=True)
+
+# (label, method, path, request kwargs, max statements, max ms)
+BUDGETS: list[tuple[str, str, str, dict, int, float]] = []
+
+
+def budget(label: str, method: str, path: str, max_statements: int, max_ms: float, **kw) -> None:
+    BUDGETS.append((label, method, path, kw, max_statements, max_ms))
+
+
+with engine.connect() as conn:
+    user = conn.execute(select(User.user_id).where(User.user_id.like('bench\\_%', escape='\\'))
+                        .order_by(User.id.desc()).limit(1)).scalar()
+    job, job_type = conn.execute(select(Job.job_id, Job.job_type).order_by(Job.id.desc()).limit(1)).one()
+    # newest episodes with story data: one for DELETE, two for bulk-delete, one for reads
+    eps = list(conn.execute(
+        select(Episode.episode_id)
+        .where(Episode.episode_id.in_(select(StoryShot.episode_id).distinct()))
+        .order_by(Episode.id.desc())
+        .limit(4)
+    ).scalars())
+if not (user and job and len(eps) == 4):
+    print('NO_DATA run scripts/seed_bench_data.py first')
+    sys.exit(2)
+ep_read, ep_delete, bulk = eps[0], eps[1], eps[2:]
+
+# reads: statements, ms
+budget('users', 'GET', '/api/admin/users', 2, 150)
+budget('users q', 'GET', '/api/admin/users', 3, 400, params={'q': user})
+budget('users inactive', 'GET', '/api/admin/users', 2, 150, params={'is_active': 0})
+budget('users cursor', 'GET', '/api/admin/users', 2, 150, params={'cursor': None})
+budget('episodes', 'GET', '/api/admin/episodes', 2, 150)
+budget('episodes q', 'GET', '/api/admin/episodes', 3, 400, params={'q': ep_read})
+budget('episodes by user', 'GET', '/api/admin/episodes', 2, 150, params={'user_id': user})
+budget('jobs', 'GET', '/api/admin/jobs', 2, 150)
+budget('jobs summary', 'GET', '/api/admin/jobs', 2, 150, params={'view': 'summary'})
+budget('jobs failed', 'GET', '/api/admin/jobs', 2, 200, params={'status': 'failed'})
+budget('jobs cached total', 'GET', '/api/admin/jobs', 2, 150, params={'total_mode': 'cached'})
+# estimate: EXPLAIN rows on MySQL (two bound params in the filtered case), exact elsewhere
+budget('jobs estimate', 'GET', '/api/admin/jobs', 2, 150, params={'total_mode': 'estimate'})
+budget('jobs estimate filtered', 'GET', '/api/admin/jobs', 2, 200,
+       params={'total_mode': 'estimate', 'status': 'failed', 'job_type': job_type})
+budget('job detail', 'GET', f'/api/admin/jobs/{job}', 1, 50)
+if engine.dialect.name == 'mysql':  # date_sub/interval SQL is MySQL-only
+    budget('metrics overview', 'GET', '/api/admin/metrics/overview', 6, 1500)
+budget('debug pool', 'GET', '/api/admin/debug/pool', 0, 50)
+budget('debug caches', 'GET', '/api/admin/debug/caches', 0, 50)
+budget('assets local', 'GET', '/api/admin/assets/fonts', 0, 200)
+budget('presign download', 'GET', '/api/admin/assets/fonts/presign-download', 0, 50, params={'key': 'a.ttf'})
+budget('presign upload', 'POST', '/api/admin/assets/fonts/presign-upload', 0, 50, json={'key': 'a.ttf', 'size': 1})
+# writes (run once)
+budget('patch credit', 'PATCH', f'/api/admin/users/{user}/credit', 2, 150, json={'mode': 'add', 'amount': 1})
+budget('patch plan', 'PATCH', f'/api/admin/users/{user}/plan', 2, 150, json={'plan': 'pro'})
+budget('patch active', 'PATCH', f'/api/admin/users/{user}/active', 2, 150, json={'is_active': 1})
+budget('upload local', 'POST', '/api/admin/assets/fonts/upload', 0, 200,
+       params={'key': 'bench/bench.ttf'}, files={'file': ('bench.ttf', b'x' * 4096, 'font/ttf')})
+budget('delete episode', 'DELETE', f'/api/admin/episodes/{ep_delete}', 10, 1000)
+budget('bulk delete', 'POST', '/api/admin/episodes/bulk-delete', 3, 300, json={'episode_ids': bulk})
+budget('bulk delete status', 'GET', '/api/admin/episodes/bulk-delete/{task}', 1, 50)
+
+app = create_app()
+app.dependency_overrides[security.require_admin] = lambda: security.UserContext(id='bench', email='', role='admin')
+client = TestClient(app, raise_server_exceptions=False)
+settings.request_metrics = True
+
+
+def _run(method: str, path: str, kw: dict) -> tuple[int, int, float, object]:
+    for c in single_flight_caches.values():
+        c.clear()
+    clear_count_cache()
+    metrics.reset()
+    t0 = time.perf_counter()
+    r = client.request(method, path, **kw)
+    ms = (time.perf_counter() - t0) * 1000
+    routes, _, _ = metrics.snapshot()
+    statements = sum(s.max_statements for s in routes.values())
+    try:
+        body = r.json()
+    except ValueError:
+        body = None
+    return r.status_code, statements, ms, body
+
+
+failures = 0
+task_id = None
+first_page_cursor = None
+print(f"{'route':20} {'status':>6} {'stmts':>5} {'max':>4} {'ms':>9} {'max':>7}")
+for label, method, path, kw, max_statements, max_ms in BUDGETS:
+    if label == 'users cursor':
+        kw = {'params': {'cursor': first_page_cursor}} if first_page_cursor else {}
+    if label == 'bulk delete status':
+        path = path.replace('{task}', task_id or 'missing')
+    runs = repeat if method == 'GET' else 1
+    best_ms = float('inf')
+    statements = 0
+    status = 0
+    for _ in range(runs):
+        status, statements, ms, body = _run(method, path, kw)
+        best_ms = min(best_ms, ms)
+    if label == 'users' and isinstance(body, dict):
+        first_page_cursor = body.get('next_cursor')
+    if label == 'bulk delete' and isinstance(body, dict):
+        task_id = body.get('task_id')
+
+    limit_ms = max_ms * latency_factor
+    ok = statements <= max_statements and best_ms <= limit_ms and status < 500
+    failures += not ok
+    print(f"{label:20} {status:>6} {statements:>5} {max_statements:>4} {best_ms:9.1f} {limit_ms:7.0f}"
+          f"{'' if ok else '  FAIL'}")
+
+local_font = ROOT / 'app/static/assets/fonts/bench/bench.ttf'
+if local_font.exists():
+    local_font.unlink()
+    for d in (local_font.parent, local_font.parent.parent, local_font.parent.parent.parent):
+        try:
+            d.rmdir()
+        except OSError:
+            break
+
+print('\nFAILED' if failures else '\nOK', f'{failures} route(s) over budget' if failures else '')
+sys.exit(1 if failures else 0)
@@ -0,0 +1,97 @@
+"""Compare episode cascade deletes: per-table ORM deletes vs cascade_delete_episodes.
+
+Seeds one synthetic episode with SHOTS shots x SEGMENTS TTS segments (plus
+one asset per segment) inside a transaction, times the delete, and rolls
+back, so the database is left unchanged.
+
+Usage:
+  python scripts/bench_episode_cascade.py [shots] [segments_per_shot] [repeat]
+  python scripts/bench_episode_cascade.py 500 25 3      # 12.5k TTS segments
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.session import engine
+from app.db.tables import Episode, EpisodeMeta, EpisodeOutputs, StoryAsset, StoryShot, StoryTTSSegment
+from app.services.episode_cleanup import cascade_delete_episodes
+
+shots = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+segments = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+statements = 0
+
+
+@event.listens_for(engine, 'before_cursor_execute')
+def _count(*_args):
+    global statements
+    statements += 1
+
+
+def _seed(db: Session) -> str:
+    ep = f'bench_{uuid.uuid4().hex[:12]}'
+    db.execute(insert(Episode).values(episode_id=ep, title='bench'))
+    db.execute(insert(EpisodeMeta).values(episode_id=ep))
+    db.execute(insert(EpisodeOutputs).values(episode_id=ep))
+    db.execute(
+        insert(StoryShot),
+        [{'episode_id': ep, 'order_index': i, 'start_sec': i, 'duration_sec': 1} for i in range(shots)],
+    )
+    shot_ids = list(db.execute(select(StoryShot.id).where(StoryShot.episode_id == ep)).scalars())
+    db.execute(
+        insert(StoryTTSSegment),
+        [{'shot_id': s, 'order_index': k, 'speaker_id': 'a', 'text': 'x'} for s in shot_ids for k in range(segments)],
+    )
+    db.execute(
+        insert(StoryAsset),
+        [{'episode_id': ep, 'shot_id': s, 'asset_type': 'audio', 's3_key': f'results/{ep}/{s}_{k}.mp3'}
+         for s in shot_ids for k in range(segments)],
+    )
+    return ep
+
+
+def _legacy(db: Session, ep: str) -> None:
+    # previous admin_delete_episode: materialize shot ids, then one delete per table
+    shot_ids = [int(r[0]) for r in db.execute(select(StoryShot.id).where(StoryShot.episode_id == ep)).all()]
+    if shot_ids:
+        db.query(StoryTTSSegment).filter(StoryTTSSegment.shot_id.in_(shot_ids)).delete(synchronize_session=False)
+    db.query(StoryAsset).filter(StoryAsset.episode_id == ep).delete(synchronize_session=False)
+    db.query(StoryShot).filter(StoryShot.episode_id == ep).delete(synchronize_session=False)
+    db.query(EpisodeOutputs).filter(EpisodeOutputs.episode_id == ep).delete(synchronize_session=False)
+    db.query(EpisodeMeta).filter(EpisodeMeta.episode_id == ep).delete(synchronize_session=False)
+    db.query(Episode).filter(Episode.episode_id == ep).delete(synchronize_session=False)
+
+
+def _cascade(db: Session, ep: str) -> None:
+    cascade_delete_episodes(db, [ep])
+
+
+def _bench(label, fn):
+    global statements
+    best = float('inf')
+    stmts = 0
+    for _ in range(repeat):
+        with Session(engine) as db:
+            ep = _seed(db)
+            db.flush()
+            statements = 0
+            t0 = time.perf_counter()
+            fn(db, ep)
+            best = min(best, time.perf_counter() - t0)
+            stmts = statements
+            db.rollback()
+    print(f'{label:8} best={best * 1000:9.1f} ms  statements={stmts}')
+
+
+print(f'SHOTS {shots}  TTS_SEGMENTS {shots * segments}  ASSETS {shots * segments}  (best of {repeat})')
+_bench('legacy', _legacy)
+_bench('cascade', _cascade)
@@ -0,0 +1,78 @@
+"""Compare /api/admin/jobs page cost: view=full vs view=summary.
+
+Reports query time, response bytes and JSON serialization time for one page
+of the newest jobs.
+
+Usage:
+  python scripts/bench_job_list.py [limit] [repeat]
+  python scripts/bench_job_list.py 200 20
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import select
+
+from app.api.routes.admin import _as_progress, _job_summary_columns
+from app.db.session import engine
+from app.db.tables import Job
+from app.schemas.admin import AdminJob, Page
+
+limit = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+
+def _full(conn):
+    rows = conn.execute(select(Job.__table__).order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)).all()
+    return [
+        AdminJob(
+            job_id=r.job_id,
+            job_type=r.job_type,
+            status=r.status,
+            created_at=r.created_at,
+            updated_at=r.updated_at,
+            result=r.result,
+            error=r.error,
+        )
+        for r in rows
+    ]
+
+
+def _summary(conn):
+    rows = conn.execute(select(*_job_summary_columns()).order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)).all()
+    return [
+        AdminJob(
+            job_id=r.job_id,
+            job_type=r.job_type,
+            status=r.status,
+            created_at=r.created_at,
+            updated_at=r.updated_at,
+            progress=_as_progress(r.progress),
+            error=r.error,
+        )
+        for r in rows
+    ]
+
+
+def _bench(label, fn, conn):
+    q_best = ser_best = float('inf')
+    body = b''
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        items = fn(conn)
+        t1 = time.perf_counter()
+        body = Page(items=items, total=len(items), limit=limit, offset=0).model_dump_json().encode('utf-8')
+        t2 = time.perf_counter()
+        q_best = min(q_best, t1 - t0)
+        ser_best = min(ser_best, t2 - t1)
+    print(f'{label:8} query={q_best * 1000:8.2f} ms  serialize={ser_best * 1000:8.2f} ms  bytes={len(body):10d}')
+
+
+print(f'LIMIT {limit} (best of {repeat})')
+with engine.connect() as conn:
+    _bench('full', _full, conn)
+    _bench('summary', _summary, conn)
@@ -0,0 +1,93 @@
+"""Local asset listing: rglob + stat per request vs the in-process index.
+
+Creates N empty files under a temp dir (100 dirs), then times one
+prefix-filtered page the old way (list_local_assets + Python filter/sort)
+and through LocalAssetIndex (first build, then warm lookups).
+
+Usage:
+  python scripts/bench_local_assets.py [files] [repeat]
+  python scripts/bench_local_assets.py 100000 5
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.services.asset_index import LocalAssetIndex
+from app.services.assets import ListedAsset
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+PREFIX = 'user_042/'
+LIMIT = 200
+
+
+def _seed(base: Path) -> None:
+    for d in range(100):
+        (base / f'user_{d:03d}').mkdir()
+    for i in range(n):
+        (base / f'user_{i % 100:03d}' / f'asset_{i:06d}.png').touch()
+
+
+def list_local_assets(base_dir: Path) -> list[ListedAsset]:
+    # the pre-index implementation: rglob + stat every file
+    items: list[ListedAsset] = []
+    for p in base_dir.rglob('*'):
+        if not p.is_file():
+            continue
+        stat = p.stat()
+        items.append(
+            ListedAsset(
+                key=str(p.relative_to(base_dir)).replace('\\', '/'),
+                size=stat.st_size,
+                last_modified=datetime.fromtimestamp(stat.st_mtime),
+            )
+        )
+    return items
+
+
+def _rglob_page(base: Path):
+    items = [i for i in list_local_assets(base) if i.key.startswith(PREFIX)]
+    items.sort(key=lambda i: i.key)
+    return items[:LIMIT]
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    base = Path(tmp)
+    t0 = time.perf_counter()
+    _seed(base)
+    print(f'FILES {n}  seeded in {time.perf_counter() - t0:.1f}s  (best of {repeat})')
+
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        old = _rglob_page(base)
+        best = min(best, time.perf_counter() - t0)
+    print(f'RGLOB        {best * 1000:10.2f} ms/request')
+
+    idx = LocalAssetIndex(base, check_interval=0)
+    t0 = time.perf_counter()
+    idx.refresh()
+    print(f'INDEX_BUILD  {(time.perf_counter() - t0) * 1000:10.2f} ms (once)')
+
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        new = idx.page(prefix=PREFIX, limit=LIMIT).items  # includes the mtime freshness check
+        best = min(best, time.perf_counter() - t0)
+    print(f'INDEX_PAGE   {best * 1000:10.2f} ms/request  (dir mtime check each call)')
+
+    idx.check_interval = 60
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        idx.page(prefix=PREFIX, limit=LIMIT)
+        best = min(best, time.perf_counter() - t0)
+    print(f'INDEX_CACHED {best * 1000:10.2f} ms/request  (within check interval)')
+
+    assert [a.key for a in old] == [a.key for a in new], 'index and rglob disagree'
@@ -0,0 +1,59 @@
+"""Compare deep-page latency: LIMIT/OFFSET vs keyset cursor.
+
+Usage:
+  python scripts/bench_pagination.py [table] [page] [limit] [repeat]
+  python scripts/bench_pagination.py jobs 1000 50 5
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import select
+
+from app.db.session import engine
+from app.db.tables import Episode, Job, User
+from app.services.pagination import encode_cursor, keyset_before
+
+TABLES = {'jobs': Job, 'episodes': Episode, 'users': User}
+
+table = sys.argv[1] if len(sys.argv) > 1 else 'jobs'
+page = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+limit = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+repeat = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+M = TABLES[table]
+offset = (page - 1) * limit
+ordered = select(M.id, M.created_at).order_by(M.created_at.desc(), M.id.desc())
+
+
+def _timed(conn, stmt) -> tuple[float, int]:
+    best = float('inf')
+    n = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = len(conn.execute(stmt).all())
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, n
+
+
+with engine.connect() as conn:
+    # the row just before the target page is what a client would hold as its cursor
+    anchor = conn.execute(ordered.offset(offset - 1).limit(1)).first() if offset else None
+    if offset and not anchor:
+        print('NOT_ENOUGH_ROWS', table, 'page', page)
+        sys.exit(1)
+
+    offset_ms, offset_n = _timed(conn, ordered.limit(limit).offset(offset))
+
+    keyset_q = ordered.limit(limit)
+    if anchor:
+        keyset_q = keyset_q.where(keyset_before(M.created_at, M.id, encode_cursor(anchor.created_at, anchor.id)))
+    cursor_ms, cursor_n = _timed(conn, keyset_q)
+
+print(f'TABLE {table} page={page} limit={limit} (best of {repeat})')
+print(f'OFFSET  {offset_ms:8.2f} ms  rows={offset_n}')
+print(f'CURSOR  {cursor_ms:8.2f} ms  rows={cursor_n}')
@@ -0,0 +1,63 @@
+"""Per-call overhead of S3 helpers: fresh client per call vs the shared client.
+
+Runs N small PutObject/HeadObject/DeleteObject operations against an
+in-process moto S3 (`pip install moto`). Moto skips the network, so this
+measures session/client construction (credential + endpoint resolution);
+against real S3 the shared client also keeps TLS connections alive.
+
+Usage:
+  python scripts/bench_s3_client.py [ops]
+  python scripts/bench_s3_client.py 1000
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+from moto import mock_aws
+
+from app.services import assets
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+BUCKET = 'bench-client'
+
+
+def _ops(get_client) -> float:
+    t0 = time.perf_counter()
+    for i in range(n):
+        key = f'bench/{i:05d}.txt'
+        op = i % 3
+        client = get_client()
+        if op == 0:
+            client.put_object(Bucket=BUCKET, Key=key, Body=b'x')
+        elif op == 1:
+            client.head_object(Bucket=BUCKET, Key=f'bench/{i - 1:05d}.txt')
+        else:
+            client.delete_object(Bucket=BUCKET, Key=f'bench/{i - 2:05d}.txt')
+    return time.perf_counter() - t0
+
+
+def _fresh():
+    assets.reset_s3_client()
+    return assets.s3_client()
+
+
+with mock_aws():
+    assets.reset_s3_client()
+    assets.s3_client().create_bucket(Bucket=BUCKET)
+
+    before = _ops(_fresh)
+    assets.reset_s3_client()
+    after = _ops(assets.s3_client)
+
+print(f'OPS {n}')
+print(f'PER_CALL_CLIENT {before * 1000:10.1f} ms  ({before / n * 1000:6.2f} ms/op)')
+print(f'SHARED_CLIENT   {after * 1000:10.1f} ms  ({after / n * 1000:6.2f} ms/op)')
@@ -0,0 +1,57 @@
+"""Benchmark episode-style S3 cleanup: per-key DeleteObject vs batched DeleteObjects.
+
+Runs against an in-process moto S3 (`pip install moto`), so no real bucket
+is touched.
+
+Usage:
+  python scripts/bench_s3_delete.py [objects]
+  python scripts/bench_s3_delete.py 5000
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+from moto import mock_aws
+
+from app.services import assets
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+BUCKET = 'bench-results'
+
+
+def _seed(client) -> list[tuple[str, str]]:
+    keys = [f'results/ep_bench/shot_{i:05d}.png' for i in range(n)]
+    for k in keys:
+        client.put_object(Bucket=BUCKET, Key=k, Body=b'x')
+    return [(BUCKET, k) for k in keys]
+
+
+with mock_aws():
+    client = assets.s3_client()
+    client.create_bucket(Bucket=BUCKET)
+
+    targets = _seed(client)
+    t0 = time.perf_counter()
+    for bucket, key in targets:
+        client.delete_object(Bucket=bucket, Key=key)
+    per_key = time.perf_counter() - t0
+
+    targets = _seed(client)
+    t0 = time.perf_counter()
+    deleted, failed = assets.delete_s3_objects(targets)
+    batched = time.perf_counter() - t0
+
+    left = client.list_objects_v2(Bucket=BUCKET).get('KeyCount', 0)
+
+print(f'OBJECTS {n}')
+print(f'PER_KEY  {per_key * 1000:10.1f} ms')
+print(f'BATCHED  {batched * 1000:10.1f} ms  deleted={len(deleted)} failed={len(failed)} remaining={left}')
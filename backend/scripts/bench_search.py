@@ -0,0 +1,95 @@
+"""Time admin `q` search strategies: contains (LIKE '%q%') vs prefix vs fulltext.
+
+Runs the episode/user list query (first page, ORDER BY created_at DESC,
+id DESC, LIMIT 50) with each strategy's filter. fulltext needs MySQL plus
+scripts/create_search_indexes.py.
+
+--seed N inserts N synthetic episodes (episode_id 'bsearch_<n>', random
+titles) in 10k-row batches first; --cleanup deletes them again.
+
+Usage:
+  python scripts/bench_search.py [target] [query ...] [--seed N] [--cleanup] [--repeat R]
+  python scripts/bench_search.py episodes bsearch_0004211 sunset --seed 5000000
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import delete, insert, select
+
+from app.db.session import engine
+from app.db.tables import Episode
+from app.services.search import SEARCH_TARGETS, _contains, _fulltext, _prefix
+
+args = sys.argv[1:]
+
+
+def _opt(name: str, default: int) -> int:
+    if name in args:
+        i = args.index(name)
+        v = int(args[i + 1])
+        del args[i : i + 2]
+        return v
+    return default
+
+
+seed = _opt('--seed', 0)
+repeat = _opt('--repeat', 5)
+cleanup = '--cleanup' in args
+if cleanup:
+    args.remove('--cleanup')
+target = args[0] if args else 'episodes'
+queries = args[1:] or ['bsearch_0000042', 'sunset']
+
+WORDS = 'sunset ocean city night forest rain coffee story cat dog space robot river dream summer'.split()
+
+if seed:
+    rnd = random.Random(0)
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        for start in range(0, seed, 10_000):
+            conn.execute(
+                insert(Episode),
+                [
+                    {'episode_id': f'bsearch_{n:07d}', 'title': ' '.join(rnd.sample(WORDS, 3)) + f' #{n}'}
+                    for n in range(start, min(seed, start + 10_000))
+                ],
+            )
+    print(f'SEEDED {seed} episodes in {time.perf_counter() - t0:.1f}s')
+
+model, _, ft_cols, prefix_cols = SEARCH_TARGETS[target]
+strategies = {
+    'contains': lambda q: _contains(model, ft_cols, q),
+    'prefix': lambda q: _prefix(model, prefix_cols, q),
+}
+if engine.dialect.name == 'mysql':
+    strategies['fulltext'] = lambda q: _fulltext(model, ft_cols, q)
+
+with engine.connect() as conn:
+    print(f'TARGET {target} rows={conn.execute(select(model.id).order_by(model.id.desc()).limit(1)).scalar()} '
+          f'(max id), best of {repeat}')
+    for q in queries:
+        for name, build in strategies.items():
+            stmt = select(model.id).where(build(q)).order_by(model.created_at.desc(), model.id.desc()).limit(50)
+            best = float('inf')
+            n = 0
+            try:
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    n = len(conn.execute(stmt).all())
+                    best = min(best, time.perf_counter() - t0)
+            except Exception as e:  # e.g. fulltext without the index
+                print(f'{q!r:24} {name:9} ERROR {type(e).__name__}: {e}'.splitlines()[0])
+                conn.rollback()
+                continue
+            print(f'{q!r:24} {name:9} {best * 1000:9.2f} ms  rows={n}')
+
+if cleanup:
+    with engine.begin() as conn:
+        n = conn.execute(delete(Episode).where(Episode.episode_id.like('bsearch\\_%', escape='\\'))).rowcount
+    print('CLEANED', n)
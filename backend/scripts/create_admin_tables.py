@@ -0,0 +1,20 @@
+"""Create the tables owned by this admin backend (app/db/admin_tables.py).
+
+Idempotent (checkfirst): existing tables are left untouched.
+
+Usage:
+  python scripts/create_admin_tables.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.db.admin_tables import ADMIN_TABLES
+from app.db.models import Base
+from app.db.session import engine
+
+Base.metadata.create_all(engine, tables=ADMIN_TABLES, checkfirst=True)
+print('TABLES_OK', ', '.join(t.name for t in ADMIN_TABLES))
@@ -0,0 +1,75 @@
+"""Create (or drop) the FULLTEXT ngram indexes used by admin `q` search.
+
+MySQL only. Indexes are built with innodb_ft_enable_stopword=OFF (session):
+with the default stopword list the ngram parser skips every token that
+contains a stopword ("at", "in", "is", "a", ...), and search would miss rows
+that LIKE finds. They carry FULLTEXT_INDEX_COMMENT; search ignores FULLTEXT
+indexes without it (built by an older version of this script), and
+--rebuild replaces those.
+
+Idempotent: indexes that already exist are skipped. The first FULLTEXT index
+on a table rebuilds it (adds FTS_DOC_ID), so run this off-peak on large
+tables. Search falls back to LIKE until the index exists.
+
+Usage:
+  python scripts/create_search_indexes.py            # create
+  python scripts/create_search_indexes.py --rebuild  # also replace stale (stopword) indexes
+  python scripts/create_search_indexes.py --drop     # drop
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text
+
+from app.db.session import engine
+from app.services.search import FULLTEXT_INDEX_COMMENT, SEARCH_TARGETS
+
+drop = '--drop' in sys.argv[1:]
+rebuild = '--rebuild' in sys.argv[1:]
+
+if engine.dialect.name != 'mysql':
+    print('SKIP not mysql:', engine.dialect.name)
+    sys.exit(0)
+
+with engine.begin() as conn:
+    # applies to indexes created on this connection, and is stored with them
+    conn.execute(text('SET SESSION innodb_ft_enable_stopword = OFF'))
+    for target, (model, index, cols, _) in SEARCH_TARGETS.items():
+        table = model.__tablename__
+        exists = conn.execute(
+            text(
+                'SELECT INDEX_COMMENT FROM information_schema.STATISTICS '
+                'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND INDEX_NAME = :i LIMIT 1'
+            ),
+            {'t': table, 'i': index},
+        ).first()
+        if drop:
+            if exists:
+                conn.execute(text(f'ALTER TABLE `{table}` DROP INDEX `{index}`'))
+                print('DROPPED', table, index)
+            continue
+        if exists and exists[0] == FULLTEXT_INDEX_COMMENT:
+            print('EXISTS', table, index)
+            continue
+        if exists and not rebuild:
+            print('STALE', table, index, '(built with stopwords; not used by search, run with --rebuild)')
+            continue
+        if exists:
+            conn.execute(text(f'ALTER TABLE `{table}` DROP INDEX `{index}`'))
+            print('DROPPED stale', table, index)
+        col_list = ', '.join(f'`{c}`' for c in cols)
+        conn.execute(
+            text(
+                f'ALTER TABLE `{table}` ADD FULLTEXT INDEX `{index}` ({col_list}) WITH PARSER ngram '
+                f"COMMENT '{FULLTEXT_INDEX_COMMENT}'"
+            )
+        )
+        print('CREATED', table, index, f'({col_list})')
+
+    ngram = conn.execute(text("SHOW VARIABLES LIKE 'ngram_token_size'")).first()
+    if ngram:
+        print('ngram_token_size =', ngram[1], '(set SEARCH_NGRAM_SIZE to match)')
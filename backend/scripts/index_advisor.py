@@ -0,0 +1,299 @@
+"""EXPLAIN the admin endpoint / background poller queries and suggest indexes from the plans.
+
+Calls each admin list/metrics endpoint in-process (admin auth bypassed) and
+runs one pass of each updated_at poller (job stream, principal cache sweep,
+rollup dirty-day scan), captures the SELECTs and EXPLAINs them (EXPLAIN on
+MySQL, EXPLAIN QUERY PLAN on SQLite).
+
+For every full scan or filesort the plan reports, the flagged table's
+columns are read off the statement: equality/IN filters first, then the
+first ORDER BY / GROUP BY column (or range-filtered column). If no existing
+index leads with those columns, that is a suggestion: the matching
+`ADMIN_QUERY_INDEXES` entry (app/db/tables.py) when there is one, otherwise
+a new `ix_adv_<table>_<cols>` index. Findings no index can fix (e.g.
+`LIKE '%q%'`, an unfiltered COUNT) yield no suggestion.
+
+  (no flag)  report only, plus the DDL of the suggested indexes
+  --apply    time the targets, create the suggested indexes (idempotent),
+             EXPLAIN and time again: before/after report per target
+  --drop     drop ADMIN_QUERY_INDEXES and any ix_adv_* indexes (rollback / to re-measure)
+
+Usage:
+  python scripts/index_advisor.py [--apply | --drop] [--repeat N]
+"""
+
+import asyncio
+import re
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Index, event, inspect, select
+from sqlalchemy.schema import CreateIndex
+
+from app.core import security
+from app.core.cache import single_flight_caches
+from app.db.models import Base
+from app.db.session import SessionLocal, async_engine, engine
+from app.db.tables import ADMIN_QUERY_INDEXES, Episode, Job
+from app.main import create_app
+from app.services.counts import clear_count_cache
+from app.services.job_stream import JobBroadcaster
+from app.services.rollups import _dirty_days, _sources
+
+args = sys.argv[1:]
+apply = '--apply' in args
+drop = '--drop' in args
+repeat = int(args[args.index('--repeat') + 1]) if '--repeat' in args else 5
+mysql = engine.dialect.name == 'mysql'
+TABLES = {ix.table.name for ix in ADMIN_QUERY_INDEXES}
+
+
+def _existing() -> dict[str, list[tuple[str, tuple[str, ...]]]]:
+    """table -> [(index name, columns)], primary key included."""
+    insp = inspect(engine)
+    out: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+    for t in TABLES:
+        pk = tuple(insp.get_pk_constraint(t).get('constrained_columns') or ())
+        out[t] = [('PRIMARY', pk)] if pk else []
+        out[t] += [(ix['name'], tuple(c for c in ix['column_names'] if c)) for ix in insp.get_indexes(t)]
+    return out
+
+
+if drop:
+    have = _existing()
+    with engine.begin() as conn:
+        for ix in ADMIN_QUERY_INDEXES:
+            if any(name == ix.name for name, _ in have[ix.table.name]):
+                ix.drop(conn)
+                print('DROPPED', ix.table.name, ix.name)
+        for t, indexes in have.items():
+            for name, _ in indexes:
+                if name.startswith('ix_adv_'):
+                    Index(name, _table=Base.metadata.tables[t]).drop(conn)
+                    print('DROPPED', t, name)
+    sys.exit(0)
+
+with engine.connect() as conn:
+    sample_user = conn.execute(select(Episode.user_id).where(Episode.user_id.is_not(None)).limit(1)).scalar()
+    sample_type = conn.execute(select(Job.job_type).limit(1)).scalar()
+
+ENDPOINTS = [
+    ('users', '/api/admin/users', {}),
+    ('users active', '/api/admin/users', {'is_active': 1}),
+    ('episodes', '/api/admin/episodes', {}),
+    ('episodes by user', '/api/admin/episodes', {'user_id': sample_user or 'x'}),
+    ('jobs', '/api/admin/jobs', {}),
+    ('jobs failed', '/api/admin/jobs', {'status': 'failed'}),
+    ('jobs by type', '/api/admin/jobs', {'job_type': sample_type or 'x'}),
+    ('metrics overview', '/api/admin/metrics/overview', {'days': 14}),
+]
+
+app = create_app()
+app.dependency_overrides[security.require_admin] = lambda: security.UserContext(id='index-advisor', email='', role='admin')
+client = TestClient(app, raise_server_exceptions=False)
+
+# a cursor/watermark this far back makes the pollers do a full pass
+SINCE = datetime(2000, 1, 1)
+
+
+def _endpoint(path: str, params: dict):
+    def run() -> bool:
+        for c in single_flight_caches.values():
+            c.clear()
+        clear_count_cache()
+        return client.get(path, params=params).status_code == 200
+
+    return run
+
+
+async def _job_stream_poll() -> None:
+    b = JobBroadcaster(1.0)
+    b._cursor = (SINCE, 0)
+    await b._poll_once()
+    await async_engine.dispose()  # its connections belong to this event loop
+
+
+async def _principal_sweep() -> None:
+    security._sweep_at, security._sweep_since, security._sweep_seen = 0.0, SINCE, set()
+    await security._sweep_user_changes()
+    await async_engine.dispose()
+
+
+def _rollup_dirty_days() -> bool:
+    with SessionLocal() as db:
+        for src in _sources().values():
+            _dirty_days(db, src, SINCE, date.today())
+    return True
+
+
+TARGETS = [(label, _endpoint(path, params)) for label, path, params in ENDPOINTS] + [
+    ('job stream poll', lambda: asyncio.run(_job_stream_poll()) or True),
+    ('principal sweep', lambda: asyncio.run(_principal_sweep()) or True),
+    ('rollup dirty days', _rollup_dirty_days),
+]
+
+captured: list[tuple[str, object]] | None = None
+
+
+def _capture(conn, cursor, statement, parameters, context, executemany):
+    if captured is not None and statement.lstrip().upper().startswith('SELECT'):
+        captured.append((statement, parameters))
+
+
+for eng in (engine, async_engine.sync_engine):
+    event.listen(eng, 'before_cursor_execute', _capture)
+
+
+def _time_targets() -> dict[str, float | None]:
+    out: dict[str, float | None] = {}
+    for label, run in TARGETS:
+        best, ok = float('inf'), True
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            ok = run()
+            best = min(best, time.perf_counter() - t0)
+        out[label] = best * 1000 if ok else None
+    return out
+
+
+def _findings(statement: str, parameters) -> list[tuple[str | None, str]]:
+    """(table the finding is about, description) per plan issue."""
+    found: list[tuple[str | None, str]] = []
+    with engine.connect() as conn:
+        if mysql:
+            for r in conn.exec_driver_sql('EXPLAIN ' + statement, parameters).mappings():
+                t, extra = r['table'], r.get('Extra') or ''
+                if r.get('type') == 'ALL':
+                    found.append((t, f'full scan of {t} (~{r["rows"]} rows)'))
+                elif r.get('type') == 'index' and 'Using filesort' not in extra:
+                    found.append((t, f'full index scan of {t} ({r["key"]})'))
+                if 'Using filesort' in extra:
+                    found.append((t, f'filesort on {t}'))
+                if 'Using temporary' in extra:
+                    found.append((t, f'temporary table for {t}'))
+        else:
+            main = re.search(r'\bFROM (\w+)', statement)
+            for r in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters):
+                detail = str(r[-1])
+                m = re.match(r'(?:SCAN|SEARCH) (\w+)', detail)
+                if detail.startswith('SCAN ') and 'INDEX' not in detail:
+                    found.append((m.group(1) if m else None, f'full scan: {detail}'))
+                if 'TEMP B-TREE' in detail:
+                    found.append((main.group(1) if main else None, f'sort: {detail}'))
+    return found
+
+
+def _columns(statement: str, table: str) -> tuple[str, ...]:
+    """Index columns the statement wants on `table`: equality filters, then one sort/range column."""
+    sql = ' '.join(statement.split())
+    col = rf'\b{table}\.(\w+)'
+    where = re.split(r'\b(?:ORDER BY|GROUP BY|LIMIT)\b', sql.split(' WHERE ', 1)[1])[0] if ' WHERE ' in sql else ''
+    eq = re.findall(col + r' (?:= |IN \()', where)
+    ordered = re.findall(col, ' '.join(re.findall(r'\b(?:ORDER|GROUP) BY (.*?)(?= LIMIT\b|\)|$)', sql)))
+    ranged = re.findall(col + r' [<>]=? ', where)
+    cols = list(dict.fromkeys(c for c in eq if c != 'id'))
+    if 'id' in eq:
+        return ()  # primary-key lookup
+    tail = [c for c in ordered + ranged if c not in cols and c != 'id']
+    return tuple(cols + tail[:1])
+
+
+def _suggest(table: str, cols: tuple[str, ...], have) -> Index | None:
+    if not cols or table not in TABLES:
+        return None
+    if any(ix_cols[: len(cols)] == cols for _, ix_cols in have.get(table, [])):
+        return None  # an index already leads with these columns: not an indexing problem
+    for ix in ADMIN_QUERY_INDEXES:
+        if ix.table.name == table and tuple(c.name for c in ix.columns)[: len(cols)] == cols:
+            return ix
+    t = Base.metadata.tables[table]
+    return Index(f'ix_adv_{table}_{"_".join(cols)}'[:64], *(t.c[c] for c in cols))
+
+
+def _explain_all():
+    """label -> [(statement, findings, suggested index or None)]."""
+    global captured
+    have = _existing()
+    report = {}
+    for label, run in TARGETS:
+        captured = []
+        ok = run()
+        stmts, captured = captured, None
+        seen: set[str] = set()
+        rows = []
+        for statement, parameters in stmts:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            try:
+                found = _findings(statement, parameters)
+            except Exception as e:
+                rows.append((statement, [f'EXPLAIN failed: {type(e).__name__}'], []))
+                continue
+            suggested = {ix.name: ix for t in {t for t, _ in found if t} if (ix := _suggest(t, _columns(statement, t), have))}
+            rows.append((statement, [f for _, f in found], list(suggested.values())))
+        if not ok:
+            rows.append(('', ['target failed (non-200 / error)'], []))
+        report[label] = rows
+    return report
+
+
+def _print_report(report) -> dict[str, Index]:
+    suggested: dict[str, Index] = {}
+    for label, rows in report.items():
+        issues = [r for r in rows if r[1]]
+        print(f'\n== {label}: {len(rows)} statements, {len(issues)} with findings')
+        for statement, found, indexes in issues:
+            print('   ', ' '.join(statement.split())[:160])
+            for f in found:
+                print('      -', f)
+            for ix in indexes:
+                print(f'      -> {ix.name} ({", ".join(c.name for c in ix.columns)})')
+                suggested[ix.name] = ix
+    return suggested
+
+
+def _ddl(ix: Index) -> str:
+    return str(CreateIndex(ix).compile(dialect=engine.dialect)).strip() + ';'
+
+
+suggested = _print_report(_explain_all())
+
+print('\n== suggested indexes (from EXPLAIN)')
+for ix in suggested.values():
+    print('  ', _ddl(ix))
+if not suggested:
+    print('   none')
+
+if not apply:
+    print('\n(run with --apply to create)')
+    sys.exit(0)
+
+before = _time_targets()
+with engine.begin() as conn:
+    for ix in suggested.values():
+        t0 = time.perf_counter()
+        ix.create(conn, checkfirst=True)
+        print(f'CREATED {ix.table.name}.{ix.name} in {time.perf_counter() - t0:.2f}s')
+if mysql:
+    with engine.begin() as conn:
+        for t in sorted({ix.table.name for ix in suggested.values()}):
+            conn.exec_driver_sql(f'ANALYZE TABLE `{t}`')
+
+_print_report(_explain_all())
+after = _time_targets()
+
+print(f'\n== timing (best of {repeat}, ms)')
+print(f"{'target':20} {'before':>10} {'after':>10} {'speedup':>8}")
+for label, _ in TARGETS:
+    b, a = before[label], after[label]
+    if b is None or a is None:
+        print(f'{label:20} {"error":>10} {"error":>10}')
+        continue
+    print(f'{label:20} {b:10.2f} {a:10.2f} {b / a if a else 0:7.1f}x')
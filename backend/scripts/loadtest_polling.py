@@ -0,0 +1,92 @@
+"""Load test: sync (threadpool) vs async DB path under many concurrent pollers.
+
+Mounts two in-process endpoints that run the same query as the JobsPage poll
+(first page of /api/admin/jobs + its count): one `def` + Session, one
+`async def` + AsyncSession. N pollers hit each for a fixed duration and we
+report requests/sec and latency percentiles.
+
+Requires httpx (`pip install httpx`).
+
+Usage:
+  python scripts/loadtest_polling.py [pollers] [seconds] [interval_sec]
+  python scripts/loadtest_polling.py 200 20 0.5
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.session import get_async_db, get_db
+from app.db.tables import Job
+
+pollers = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+interval = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+
+page_q = select(Job.job_id, Job.status, Job.updated_at).order_by(Job.created_at.desc(), Job.id.desc()).limit(50)
+count_q = select(func.count()).select_from(Job)
+
+app = FastAPI()
+
+
+@app.get('/sync')
+def poll_sync(db: Session = Depends(get_db)):
+    total = db.execute(count_q).scalar_one()
+    return {'total': total, 'n': len(db.execute(page_q).all())}
+
+
+@app.get('/async')
+async def poll_async(db: AsyncSession = Depends(get_async_db)):
+    total = (await db.execute(count_q)).scalar_one()
+    return {'total': total, 'n': len((await db.execute(page_q)).all())}
+
+
+async def _poller(client: httpx.AsyncClient, path: str, deadline: float, lat: list[float], errors: list[int]):
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        try:
+            r = await client.get(path)
+            if r.status_code != 200:
+                errors.append(r.status_code)
+        except Exception:
+            errors.append(-1)
+        lat.append(time.perf_counter() - t0)
+        await asyncio.sleep(interval)
+
+
+def _pct(xs: list[float], p: float) -> float:
+    if not xs:
+        return 0.0
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(round(p / 100 * (len(xs) - 1))))] * 1000
+
+
+async def _run(path: str):
+    lat: list[float] = []
+    errors: list[int] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=60) as client:
+        await client.get(path)  # warm the pool
+        t0 = time.perf_counter()
+        deadline = t0 + seconds
+        await asyncio.gather(*[_poller(client, path, deadline, lat, errors) for _ in range(pollers)])
+        elapsed = time.perf_counter() - t0
+    print(
+        f'{path:7} req={len(lat):6d} rps={len(lat) / elapsed:8.1f} '
+        f'p50={_pct(lat, 50):8.1f}ms p99={_pct(lat, 99):8.1f}ms errors={len(errors)}'
+    )
+
+
+print(f'POLLERS {pollers} duration={seconds}s interval={interval}s')
+asyncio.run(_run('/sync'))
+asyncio.run(_run('/async'))
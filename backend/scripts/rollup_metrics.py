@@ -0,0 +1,45 @@
+"""Create/refresh the dashboard metric rollups (services/rollups.py).
+
+Usage:
+  python scripts/rollup_metrics.py --create        # create rollup tables (idempotent)
+  python scripts/rollup_metrics.py                 # incremental refresh since watermark
+  python scripts/rollup_metrics.py --full          # rebuild every day from scratch
+  python scripts/rollup_metrics.py --loop 60       # refresh every 60s (cron/sidecar)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.db.admin_tables import ROLLUP_TABLES
+from app.db.models import Base
+from app.db.session import SessionLocal, engine
+from app.services.rollups import refresh_rollups
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--create', action='store_true', help='create rollup tables if missing')
+parser.add_argument('--full', action='store_true', help='recompute all days')
+parser.add_argument('--loop', type=float, default=0, help='repeat every N seconds')
+args = parser.parse_args()
+
+if args.create:
+    Base.metadata.create_all(engine, tables=ROLLUP_TABLES, checkfirst=True)
+    print('TABLES_OK', ', '.join(t.name for t in ROLLUP_TABLES))
+
+full = args.full
+while True:
+    t0 = time.perf_counter()
+    db = SessionLocal()
+    try:
+        stats = refresh_rollups(db, full=full)
+    finally:
+        db.close()
+    print(f'REFRESH {(time.perf_counter() - t0) * 1000:.1f}ms', ' '.join(f'{k}={v}' for k, v in stats.items()))
+    if not args.loop:
+        break
+    full = False
+    time.sleep(args.loop)
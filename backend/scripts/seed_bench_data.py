@@ -0,0 +1,199 @@
+"""Bulk-load a synthetic admin dataset for benchmarks (scratch databases only).
+
+Default volumes (--scale multiplies all row counts):
+  users 50k (+ plan/credit/oauth), jobs 1M, episodes 500k (+ meta/outputs),
+  orders 200k, credit_logs 500k, and per episode 50 story shots x 4 TTS
+  segments, one image asset per shot and one audio asset per segment.
+
+Rows are generated with explicit primary keys and inserted by executemany
+in --batch sized chunks. MySQL turns off per-session FK and unique checks
+while loading; SQLite turns off fsync and keeps its journal in memory.
+Ids start above the current max, so reruns append. Every string id is
+prefixed with 'bench_'.
+
+Usage:
+  python scripts/seed_bench_data.py [--scale F] [--shots N] [--segments N] [--batch N] [--create]
+  python scripts/seed_bench_data.py --scale 0.01 --create     # quick SQLite stand-in
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import func, insert, select
+
+from app.db import admin_tables  # noqa: F401  (registers admin tables on Base.metadata)
+from app.db.models import Base
+from app.db.session import engine
+from app.db.tables import (
+    Credit,
+    CreditLog,
+    Episode,
+    EpisodeMeta,
+    EpisodeOutputs,
+    Job,
+    OAuth,
+    Order,
+    Plan,
+    StoryAsset,
+    StoryShot,
+    StoryTTSSegment,
+    User,
+)
+
+VOLUMES = {'users': 50_000, 'jobs': 1_000_000, 'episodes': 500_000, 'orders': 200_000, 'credit_logs': 500_000}
+JOB_TYPES = ('render', 'tts', 'image', 'bgm', 'subtitle')
+JOB_STATUSES = ('done', 'done', 'done', 'failed', 'pending', 'running')
+ORDER_STATUSES = ('paid', 'paid', 'pending', 'refunded')
+WORDS = 'sunset ocean city night forest rain coffee story cat dog space robot river dream summer'.split()
+EPOCH = datetime(2024, 1, 1)
+
+
+def _next_id(conn, model) -> int:
+    return int(conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _bulk(conn, model, rows, batch: int) -> int:
+    n = 0
+    chunk = []
+    for r in rows:
+        chunk.append(r)
+        if len(chunk) >= batch:
+            conn.execute(insert(model), chunk)
+            n += len(chunk)
+            chunk = []
+    if chunk:
+        conn.execute(insert(model), chunk)
+        n += len(chunk)
+    return n
+
+
+def seed(scale: float = 1.0, shots: int = 50, segments: int = 4, batch: int = 10_000, create: bool = False) -> dict:
+    rnd = random.Random(42)
+    counts = {k: max(1, int(v * scale)) for k, v in VOLUMES.items()}
+    span = timedelta(days=365).total_seconds()
+
+    def ts(i: int, n: int) -> datetime:
+        return EPOCH + timedelta(seconds=span * i / n)
+
+    if create:
+        Base.metadata.create_all(engine, checkfirst=True)
+
+    done: dict[str, int] = {}
+    t_all = time.perf_counter()
+    with engine.begin() as conn:
+        if engine.dialect.name == 'mysql':
+            conn.exec_driver_sql('SET foreign_key_checks = 0')
+            conn.exec_driver_sql('SET unique_checks = 0')
+        elif engine.dialect.name == 'sqlite':
+            conn.exec_driver_sql('PRAGMA synchronous = OFF')
+            conn.exec_driver_sql('PRAGMA journal_mode = MEMORY')
+
+        def step(name, model, rows):
+            t0 = time.perf_counter()
+            done[name] = _bulk(conn, model, rows, batch)
+            print(f'{name:20} {done[name]:>11,} rows {time.perf_counter() - t0:8.1f}s', flush=True)
+
+        u0 = _next_id(conn, User)
+        nu = counts['users']
+        uid = [f'bench_u{u0 + i}' for i in range(nu)]
+        step('users', User, (
+            {'id': u0 + i, 'user_id': uid[i], 'email': f'{uid[i]}@example.com', 'username': f'{rnd.choice(WORDS)}{i}',
+             'hashed_password': 'x', 'is_active': 0 if i % 20 == 0 else 1, 'role': 'user',
+             'created_at': ts(i, nu), 'updated_at': ts(i, nu)}
+            for i in range(nu)
+        ))
+        step('plan', Plan, ({'user_id': u, 'plan': 'pro' if i % 7 == 0 else 'free'} for i, u in enumerate(uid)))
+        step('credit', Credit, ({'user_id': u, 'credit': i % 500} for i, u in enumerate(uid)))
+        step('oauth', OAuth, ({'user_id': u, 'oauth_provider': 'kakao'} for i, u in enumerate(uid) if i % 3 == 0))
+
+        j0 = _next_id(conn, Job)
+        nj = counts['jobs']
+        step('jobs', Job, (
+            {'id': j0 + i, 'job_id': f'bench_j{j0 + i}', 'job_type': JOB_TYPES[i % len(JOB_TYPES)],
+             'status': JOB_STATUSES[rnd.randrange(len(JOB_STATUSES))],
+             'result': {'progress': rnd.randrange(101), 'output': 's3://bench/' + 'x' * 200},
+             'error': 'Traceback ...\n' * 20 if i % 37 == 0 else None,
+             'created_at': ts(i, nj), 'updated_at': ts(i, nj)}
+            for i in range(nj)
+        ))
+
+        e0 = _next_id(conn, Episode)
+        ne = counts['episodes']
+        eid = [f'bench_e{e0 + i}' for i in range(ne)]
+        step('episodes', Episode, (
+            {'id': e0 + i, 'episode_id': eid[i], 'user_id': uid[i % nu], 'title': ' '.join(rnd.sample(WORDS, 3)),
+             'error': 'failed' if i % 50 == 0 else None, 'created_at': ts(i, ne), 'updated_at': ts(i, ne)}
+            for i in range(ne)
+        ))
+        step('episode_meta', EpisodeMeta, ({'episode_id': e, 'series_layout': 'default'} for e in eid))
+        step('episode_outputs', EpisodeOutputs, (
+            {'episode_id': e, 'video_url': f'https://bench-results.s3.amazonaws.com/results/{e}/final.mp4',
+             'preview_video_url': f'https://bench-results.s3.amazonaws.com/results/{e}/preview.mp4'}
+            for e in eid
+        ))
+
+        o0 = _next_id(conn, Order)
+        no = counts['orders']
+        step('orders', Order, (
+            {'id': o0 + i, 'order_id': f'bench_o{o0 + i}', 'user_id': uid[i % nu], 'plan_id': 'pro', 'amount': 9900,
+             'status': ORDER_STATUSES[i % len(ORDER_STATUSES)], 'created_at': ts(i, no)}
+            for i in range(no)
+        ))
+        nc = counts['credit_logs']
+        step('credit_logs', CreditLog, (
+            {'user_id': uid[i % nu], 'amount': rnd.choice((-10, -5, 5, 100)), 'reason': 'bench', 'created_at': ts(i, nc)}
+            for i in range(nc)
+        ))
+
+        s0 = _next_id(conn, StoryShot)
+        g0 = _next_id(conn, StoryTTSSegment)
+        step('story_shots', StoryShot, (
+            {'id': s0 + i * shots + k, 'episode_id': e, 'order_index': k, 'start_sec': k * 2.0, 'duration_sec': 2.0,
+             'visual_summary': 'bench shot', 'created_at': EPOCH, 'updated_at': EPOCH}
+            for i, e in enumerate(eid) for k in range(shots)
+        ))
+        step('story_tts_segments', StoryTTSSegment, (
+            {'id': g0 + s * segments + k, 'shot_id': s0 + s, 'order_index': k, 'speaker_id': 'narrator',
+             'text': 'bench line', 'created_at': EPOCH, 'updated_at': EPOCH}
+            for s in range(ne * shots) for k in range(segments)
+        ))
+        step('story_assets', StoryAsset, (
+            row
+            for i, e in enumerate(eid)
+            for k in range(shots)
+            for row in (
+                [{'episode_id': e, 'shot_id': s0 + i * shots + k, 'asset_type': 'image',
+                  's3_key': f'results/{e}/shots/{k}.png', 'created_at': EPOCH}]
+                + [{'episode_id': e, 'shot_id': s0 + i * shots + k, 'segment_id': g0 + (i * shots + k) * segments + g,
+                    'asset_type': 'audio', 's3_key': f'results/{e}/tts/{k}_{g}.mp3', 'created_at': EPOCH}
+                   for g in range(segments)]
+            )
+        ))
+
+        if engine.dialect.name == 'mysql':
+            conn.exec_driver_sql('SET unique_checks = 1')
+            conn.exec_driver_sql('SET foreign_key_checks = 1')
+
+    print(f'SEEDED in {time.perf_counter() - t_all:.1f}s')
+    return done
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+
+    def _opt(name: str, default, cast):
+        return cast(args[args.index(name) + 1]) if name in args else default
+
+    seed(
+        scale=_opt('--scale', 1.0, float),
+        shots=_opt('--shots', 50, int),
+        segments=_opt('--segments', 4, int),
+        batch=_opt('--batch', 10_000, int),
+        create='--create' in args,
+    )
@@ -1,10 +1,13 @@
+import axios from 'axios'
 import { api } from '../../lib/api'
 
 export type Page<T> = {
   items: T[]
   total: number
+  total_exact?: boolean
   limit: number
   offset: number
+  next_cursor?: string | null
 }
 
 export type AdminUser = {
@@ -37,8 +40,14 @@ export type AdminJob = {
   updated_at?: string
   result?: any
   error?: string | null
+  progress?: number | null
 }
 
+export type TotalMode = 'exact' | 'cached' | 'estimate'
+
+// 'prefix': id/email starts with q (index range scan); auto matches anywhere
+export type SearchMode = 'auto' | 'prefix' | 'fulltext' | 'contains'
+
 export type CreditPatch = {
   mode: 'set' | 'add'
   amount: number
@@ -52,6 +61,17 @@ export type AssetItem = {
   url?: string | null
 }
 
+export type AssetPage = {
+  items: AssetItem[]
+  folders: string[]
+  limit: number
+  next_cursor?: string | null
+  // 'cache': served from the backend listing cache, taken stale_sec ago
+  source: 's3' | 'cache' | 'local'
+  listed_at?: string | null
+  stale_sec?: number | null
+}
+
 export type StatusAgg = {
   status: string
   count: number
@@ -75,14 +95,47 @@ export type AdminOverviewMetrics = {
   credit_logs_daily: DailyAgg[]
 }
 
+export type MediaLink = {
+  // absolute, carries its own short-lived ?token= (a <video> can't send the Bearer header)
+  url: string
+  expires_at: string
+}
+
 export type EpisodeDeleteResult = {
   episode_id: string
   deleted_db: boolean
+  deleted_rows: Record<string, number>
   deleted_objects: string[]
   failed_objects: string[]
 }
 
-export async function listUsers(params: { q?: string; is_active?: number; limit?: number; offset?: number }): Promise<Page<AdminUser>> {
+export type BulkDeleteRequest = {
+  episode_ids?: string[]
+  user_id?: string
+  has_error?: boolean
+  created_before?: string
+  delete_objects?: boolean
+}
+
+export type BulkDeleteStatus = {
+  task_id: string
+  status: 'queued' | 'running' | 'done' | 'failed'
+  params: BulkDeleteRequest
+  created_by?: string | null
+  total: number
+  processed: number
+  deleted_episodes: number
+  deleted_rows: Record<string, number>
+  deleted_objects: number
+  failed_objects: number
+  failures: string[]
+  error?: string | null
+  created_at?: string | null
+  updated_at?: string | null
+  finished_at?: string | null
+}
+
+export async function listUsers(params: { q?: string; search?: SearchMode; is_active?: number; limit?: number; offset?: number; cursor?: string; total_mode?: TotalMode }): Promise<Page<AdminUser>> {
   const { data } = await api.get<Page<AdminUser>>('/api/admin/users', { params })
   return data
 }
@@ -97,17 +150,33 @@ export async function patchUserActive(user_id: string, is_active: number): Promi
   return data
 }
 
-export async function listEpisodes(params: { q?: string; user_id?: string; limit?: number; offset?: number }): Promise<Page<AdminEpisode>> {
+export async function listEpisodes(params: { q?: string; search?: SearchMode; user_id?: string; limit?: number; offset?: number; cursor?: string; total_mode?: TotalMode }): Promise<Page<AdminEpisode>> {
   const { data } = await api.get<Page<AdminEpisode>>('/api/admin/episodes', { params })
   return data
 }
 
+// media_id: `video:{episode_id}`, `preview:{episode_id}` or `asset:{id}`
+export async function getMediaLink(media_id: string): Promise<MediaLink> {
+  const { data } = await api.get<MediaLink>(`/api/media/${encodeURIComponent(media_id)}/link`)
+  return { ...data, url: new URL(data.url, api.defaults.baseURL).toString() }
+}
+
 export async function deleteEpisode(episode_id: string, params?: { delete_objects?: boolean }): Promise<EpisodeDeleteResult> {
   const { data } = await api.delete<EpisodeDeleteResult>(`/api/admin/episodes/${episode_id}`, { params })
   return data
 }
 
-export async function listJobs(params: { status?: string; job_type?: string; limit?: number; offset?: number }): Promise<Page<AdminJob>> {
+export async function bulkDeleteEpisodes(payload: BulkDeleteRequest): Promise<BulkDeleteStatus> {
+  const { data } = await api.post<BulkDeleteStatus>('/api/admin/episodes/bulk-delete', payload)
+  return data
+}
+
+export async function getBulkDelete(task_id: string): Promise<BulkDeleteStatus> {
+  const { data } = await api.get<BulkDeleteStatus>(`/api/admin/episodes/bulk-delete/${task_id}`)
+  return data
+}
+
+export async function listJobs(params: { status?: string; job_type?: string; view?: 'full' | 'summary'; limit?: number; offset?: number; cursor?: string; total_mode?: TotalMode }): Promise<Page<AdminJob>> {
   const { data } = await api.get<Page<AdminJob>>('/api/admin/jobs', { params })
   return data
 }
@@ -122,8 +191,11 @@ export async function getJob(job_id: string): Promise<AdminJob> {
   return data
 }
 
-export async function listAssets(kind: 'fonts' | 'soundeffects' | 'userassets', params?: { prefix?: string }): Promise<AssetItem[]> {
-  const { data } = await api.get<AssetItem[]>(`/api/admin/assets/${kind}`, { params })
+export async function listAssets(
+  kind: 'fonts' | 'soundeffects' | 'userassets',
+  params?: { prefix?: string; limit?: number; cursor?: string; delimiter?: string },
+): Promise<AssetPage> {
+  const { data } = await api.get<AssetPage>(`/api/admin/assets/${kind}`, { params })
   return data
 }
 
@@ -136,3 +208,58 @@ export async function uploadAsset(kind: 'fonts' | 'soundeffects' | 'userassets',
   })
   return data
 }
+
+export type PresignUploadResponse = {
+  key: string
+  expires_in: number
+  url?: string | null
+  headers: Record<string, string>
+  upload_id?: string | null
+  part_size?: number | null
+  parts: { part_number: number; url: string }[]
+}
+
+// Upload straight to S3 with presigned URLs (multipart for large files);
+// falls back to the proxied upload when the kind has no bucket (local mode).
+// Multipart needs the bucket's CORS rule to expose the ETag header.
+export async function uploadAssetDirect(kind: 'fonts' | 'soundeffects' | 'userassets', key: string, file: File): Promise<AssetItem> {
+  let presign: PresignUploadResponse
+  try {
+    const res = await api.post<PresignUploadResponse>(`/api/admin/assets/${kind}/presign-upload`, {
+      key,
+      content_type: file.type || undefined,
+      size: file.size,
+    })
+    presign = res.data
+  } catch (e) {
+    // only an explicit "no bucket" answer; other 400s (bad key, size) are real errors
+    if (axios.isAxiosError(e) && e.response?.status === 400 && e.response.headers['x-asset-storage'] === 'local') {
+      return uploadAsset(kind, key, file)
+    }
+    throw e
+  }
+
+  if (presign.url) {
+    const res = await fetch(presign.url, { method: 'PUT', body: file, headers: presign.headers })
+    if (!res.ok) throw new Error(`upload failed: ${res.status}`)
+    const { data } = await api.post<AssetItem>(`/api/admin/assets/${kind}/presign-upload/complete`, { key: presign.key })
+    return data
+  }
+
+  const size = presign.part_size ?? file.size
+  const parts: { part_number: number; etag: string }[] = []
+  for (const p of presign.parts) {
+    const start = (p.part_number - 1) * size
+    const res = await fetch(p.url, { method: 'PUT', body: file.slice(start, start + size) })
+    if (!res.ok) throw new Error(`part ${p.part_number} failed: ${res.status}`)
+    const etag = res.headers.get('ETag')
+    if (!etag) throw new Error('S3 did not expose the ETag header: add ExposeHeaders ["ETag"] to the bucket CORS rule')
+    parts.push({ part_number: p.part_number, etag })
+  }
+  const { data } = await api.post<AssetItem>(`/api/admin/assets/${kind}/presign-upload/complete`, {
+    key: presign.key,
+    upload_id: presign.upload_id,
+    parts,
+  })
+  return data
+}
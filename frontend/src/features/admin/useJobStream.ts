@@ -0,0 +1,62 @@
+import { useEffect, useRef, useState } from 'react'
+import { api } from '../../lib/api'
+import type { AdminJob } from './adminApi'
+
+// Subscribes to /api/admin/jobs/stream (SSE over fetch so the bearer header
+// can be sent). Returns whether the stream is currently connected so callers
+// can fall back to polling when it is not.
+export function useJobStream(onJobs: (jobs: AdminJob[]) => void): boolean {
+  const [connected, setConnected] = useState(false)
+  const handler = useRef(onJobs)
+  handler.current = onJobs
+
+  useEffect(() => {
+    const ctrl = new AbortController()
+    let retry: ReturnType<typeof setTimeout> | undefined
+
+    const connect = async () => {
+      try {
+        const token = localStorage.getItem('access_token')
+        const res = await fetch(`${api.defaults.baseURL}/api/admin/jobs/stream`, {
+          headers: token ? { Authorization: `Bearer ${token}` } : {},
+          signal: ctrl.signal,
+        })
+        if (!res.ok || !res.body) throw new Error(`stream ${res.status}`)
+        setConnected(true)
+
+        const reader = res.body.getReader()
+        const decoder = new TextDecoder()
+        let buf = ''
+        for (;;) {
+          const { value, done } = await reader.read()
+          if (done) break
+          buf += decoder.decode(value, { stream: true })
+          let idx: number
+          while ((idx = buf.indexOf('\n\n')) >= 0) {
+            const frame = buf.slice(0, idx)
+            buf = buf.slice(idx + 2)
+            let event = 'message'
+            let data = ''
+            for (const line of frame.split('\n')) {
+              if (line.startsWith('event:')) event = line.slice(6).trim()
+              else if (line.startsWith('data:')) data += line.slice(5).trim()
+            }
+            if (event === 'jobs' && data) handler.current(JSON.parse(data) as AdminJob[])
+          }
+        }
+      } catch {
+        // aborted or network error: fall through to reconnect
+      }
+      setConnected(false)
+      if (!ctrl.signal.aborted) retry = setTimeout(connect, 3000)
+    }
+
+    connect()
+    return () => {
+      ctrl.abort()
+      if (retry) clearTimeout(retry)
+    }
+  }, [])
+
+  return connected
+}
@@ -17,8 +17,8 @@ import {
   TextField,
   Typography,
 } from '@mui/material'
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
-import { listAssets, uploadAsset, type AssetItem } from '../features/admin/adminApi'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { listAssets, uploadAssetDirect, type AssetItem } from '../features/admin/adminApi'
 
 type AssetKind = 'fonts' | 'soundeffects' | 'userassets'
 
@@ -39,13 +39,15 @@ export default function ConfigPage() {
   const [uploadFile, setUploadFile] = useState<File | null>(null)
 
   const queryKey = useMemo(() => ['admin.assets', kind, prefix], [kind, prefix])
-  const assets = useQuery({
+  const assets = useInfiniteQuery({
     queryKey,
-    queryFn: () => listAssets(kind, { prefix: prefix.trim() || undefined }),
+    initialPageParam: undefined as string | undefined,
+    queryFn: ({ pageParam }) => listAssets(kind, { prefix: prefix.trim() || undefined, limit: 200, cursor: pageParam }),
+    getNextPageParam: (last) => last.next_cursor ?? undefined,
   })
 
   const uploadMut = useMutation({
-    mutationFn: (vars: { kind: AssetKind; key: string; file: File }) => uploadAsset(vars.kind, vars.key, vars.file),
+    mutationFn: (vars: { kind: AssetKind; key: string; file: File }) => uploadAssetDirect(vars.kind, vars.key, vars.file),
     onSuccess: async () => {
       await qc.invalidateQueries({ queryKey: ['admin.assets'] })
       setUploadKey('')
@@ -53,7 +55,8 @@ export default function ConfigPage() {
     },
   })
 
-  const items: AssetItem[] = assets.data ?? []
+  const items: AssetItem[] = assets.data?.pages.flatMap((p) => p.items) ?? []
+  const firstPage = assets.data?.pages[0]
 
   return (
     <Stack spacing={2}>
@@ -83,6 +86,11 @@ export default function ConfigPage() {
               sx={{ width: { xs: '100%', md: 360 } }}
             />
             <Box sx={{ flex: 1 }} />
+            {firstPage?.source === 'cache' && firstPage.stale_sec != null && (
+              <Typography variant="caption" color="text.secondary">
+                캐시 목록 ({Math.round(firstPage.stale_sec)}초 전 기준)
+              </Typography>
+            )}
             <Button size="small" variant="outlined" onClick={() => assets.refetch()} disabled={assets.isFetching}>
               {assets.isFetching ? '갱신 중...' : '새로고침'}
             </Button>
@@ -113,6 +121,11 @@ export default function ConfigPage() {
               )}
             </TableBody>
           </Table>
+          {assets.hasNextPage && (
+            <Button size="small" sx={{ mt: 1 }} onClick={() => assets.fetchNextPage()} disabled={assets.isFetchingNextPage}>
+              {assets.isFetchingNextPage ? '불러오는 중...' : '더 보기'}
+            </Button>
+          )}
 
           <Divider sx={{ my: 2 }} />
 
@@ -1,6 +1,7 @@
 import { Box, Card, CardContent, Chip, LinearProgress, Stack, Typography } from '@mui/material'
-import { useQuery } from '@tanstack/react-query'
-import { getOverviewMetrics, listJobs, type AdminJob } from '../features/admin/adminApi'
+import { useQuery, useQueryClient } from '@tanstack/react-query'
+import { getOverviewMetrics, listJobs, type AdminJob, type Page } from '../features/admin/adminApi'
+import { useJobStream } from '../features/admin/useJobStream'
 import { useAuthStore } from '../stores/auth'
 
 function fmtDate(s?: string) {
@@ -12,7 +13,7 @@ function fmtDate(s?: string) {
 
 function pickProgress(job: AdminJob): number | null {
   const r: any = job.result
-  const candidates = [r?.progress, r?.percent, r?.pct]
+  const candidates = [job.progress, r?.progress, r?.percent, r?.pct]
   for (const c of candidates) {
     if (typeof c === 'number' && Number.isFinite(c)) {
       if (c <= 1) return Math.max(0, Math.min(1, c)) * 100
@@ -25,10 +26,26 @@ function pickProgress(job: AdminJob): number | null {
 export default function DashboardPage() {
   const user = useAuthStore((s) => s.user)
 
+  const queryClient = useQueryClient()
+  const streaming = useJobStream((jobs) => {
+    const page = queryClient.getQueryData<Page<AdminJob>>(['admin.jobs.recent'])
+    if (!page) return
+    const known = new Set(page.items.map((j) => j.job_id))
+    if (jobs.some((j) => !known.has(j.job_id))) {
+      queryClient.invalidateQueries({ queryKey: ['admin.jobs.recent'] })
+      return
+    }
+    const byId = new Map(jobs.map((j) => [j.job_id, j]))
+    queryClient.setQueryData<Page<AdminJob>>(['admin.jobs.recent'], {
+      ...page,
+      items: page.items.map((j) => ({ ...j, ...byId.get(j.job_id) })),
+    })
+  })
+
   const recentJobs = useQuery({
     queryKey: ['admin.jobs.recent'],
-    queryFn: () => listJobs({ limit: 8, offset: 0 }),
-    refetchInterval: 3000,
+    queryFn: () => listJobs({ limit: 8, offset: 0, view: 'summary', total_mode: 'cached' }),
+    refetchInterval: streaming ? 30000 : 3000,
   })
 
   const metrics = useQuery({
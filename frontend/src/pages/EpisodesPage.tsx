@@ -5,7 +5,12 @@ import {
   Button,
   Card,
   CardContent,
+  Checkbox,
   Chip,
+  Dialog,
+  DialogContent,
+  DialogTitle,
+  FormControlLabel,
   Stack,
   Table,
   TableBody,
@@ -16,7 +21,7 @@ import {
   Typography,
 } from '@mui/material'
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
-import { deleteEpisode, listEpisodes } from '../features/admin/adminApi'
+import { deleteEpisode, getMediaLink, listEpisodes } from '../features/admin/adminApi'
 
 function fmtDate(s?: string) {
   if (!s) return '-'
@@ -27,10 +32,22 @@ function fmtDate(s?: string) {
 
 export default function EpisodesPage() {
   const [q, setQ] = useState('')
+  // starts-with search on the indexed id columns: fast on large tables
+  const [prefix, setPrefix] = useState(false)
   const [userId, setUserId] = useState('')
   const [offset, setOffset] = useState(0)
   const limit = 50
 
+  // media_id being played, e.g. `preview:{episode_id}`
+  const [playing, setPlaying] = useState<string | null>(null)
+  const mediaLink = useQuery({
+    queryKey: ['admin.mediaLink', playing],
+    queryFn: () => getMediaLink(playing!),
+    enabled: !!playing,
+    // links live MEDIA_TOKEN_TTL_SEC (1h by default)
+    staleTime: 10 * 60_000,
+  })
+
   const qc = useQueryClient()
   const del = useMutation({
     mutationFn: (episode_id: string) => deleteEpisode(episode_id, { delete_objects: true }),
@@ -39,11 +56,12 @@ export default function EpisodesPage() {
     },
   })
 
-  const queryKey = useMemo(() => ['admin.episodes', { q, userId, limit, offset }], [q, userId, limit, offset])
+  const queryKey = useMemo(() => ['admin.episodes', { q, prefix, userId, limit, offset }], [q, prefix, userId, limit, offset])
   const { data, isLoading, error } = useQuery({
     queryKey,
     queryFn: () => listEpisodes({
       q: q.trim() || undefined,
+      search: prefix ? 'prefix' : undefined,
       user_id: userId.trim() || undefined,
       limit,
       offset,
@@ -68,6 +86,10 @@ export default function EpisodesPage() {
               onChange={(e) => { setOffset(0); setQ(e.target.value) }}
               sx={{ width: { xs: '100%', md: 420 } }}
             />
+            <FormControlLabel
+              control={<Checkbox size="small" checked={prefix} onChange={(e) => { setOffset(0); setPrefix(e.target.checked) }} />}
+              label="episode_id/user_id 앞부분 일치"
+            />
             <TextField
               size="small"
               label="user_id 필터"
@@ -111,12 +133,12 @@ export default function EpisodesPage() {
                   <TableCell>
                     <Stack direction="row" spacing={1}>
                       {e.preview_video_url && (
-                        <Button size="small" component="a" href={e.preview_video_url} target="_blank" rel="noreferrer">
+                        <Button size="small" onClick={() => setPlaying(`preview:${e.episode_id}`)}>
                           preview
                         </Button>
                       )}
                       {e.video_url && (
-                        <Button size="small" component="a" href={e.video_url} target="_blank" rel="noreferrer">
+                        <Button size="small" onClick={() => setPlaying(`video:${e.episode_id}`)}>
                           video
                         </Button>
                       )}
@@ -175,6 +197,20 @@ export default function EpisodesPage() {
         </CardContent>
       </Card>
 
+      <Dialog open={!!playing} onClose={() => setPlaying(null)} maxWidth="md" fullWidth>
+        <DialogTitle sx={{ fontFamily: 'monospace' }}>{playing}</DialogTitle>
+        <DialogContent>
+          {mediaLink.isLoading ? (
+            <Typography>로딩...</Typography>
+          ) : mediaLink.error ? (
+            <Alert severity="error">{(mediaLink.error as any)?.response?.data?.detail ?? '재생 링크 조회 실패'}</Alert>
+          ) : mediaLink.data ? (
+            // served by /api/media with Range support, so seeking works
+            <video src={mediaLink.data.url} controls autoPlay style={{ width: '100%', maxHeight: '70vh' }} />
+          ) : null}
+        </DialogContent>
+      </Dialog>
+
       <Alert severity="info">
         에피소드 삭제 버튼은 DB 레코드 + video_url/preview_video_url에 있는 S3 오브젝트까지 삭제를 시도해.
         (S3 권한 없으면 오브젝트 삭제만 실패로 남고 DB는 삭제됨)
@@ -19,8 +19,9 @@ import {
   TextField,
   Typography,
 } from '@mui/material'
-import { useQuery } from '@tanstack/react-query'
-import { getJob, listJobs, type AdminJob } from '../features/admin/adminApi'
+import { useQuery, useQueryClient } from '@tanstack/react-query'
+import { getJob, listJobs, type AdminJob, type Page } from '../features/admin/adminApi'
+import { useJobStream } from '../features/admin/useJobStream'
 
 function fmtDate(s?: string) {
   if (!s) return '-'
@@ -31,7 +32,7 @@ function fmtDate(s?: string) {
 
 function pickProgress(job: AdminJob): number | null {
   const r: any = job.result
-  const candidates = [r?.progress, r?.percent, r?.pct, r?.step_progress]
+  const candidates = [job.progress, r?.progress, r?.percent, r?.pct, r?.step_progress]
   for (const c of candidates) {
     if (typeof c === 'number' && Number.isFinite(c)) {
       if (c <= 1) return Math.max(0, Math.min(1, c)) * 100
@@ -47,22 +48,45 @@ export default function JobsPage() {
   const limit = 50
 
   const queryKey = useMemo(() => ['admin.jobs', { status, limit, offset }], [status, limit, offset])
+  const [detailJobId, setDetailJobId] = useState<string | null>(null)
+
+  // Pushed job changes patch the cached page in place; polling is only a fallback.
+  const queryClient = useQueryClient()
+  const streaming = useJobStream((jobs) => {
+    const statuses = status.split(',').map((s) => s.trim()).filter(Boolean)
+    const page = queryClient.getQueryData<Page<AdminJob>>(queryKey)
+    if (page) {
+      const byId = new Map(jobs.map((j) => [j.job_id, j]))
+      queryClient.setQueryData<Page<AdminJob>>(queryKey, {
+        ...page,
+        items: page.items.map((j) => ({ ...j, ...byId.get(j.job_id) })),
+      })
+      const known = new Set(page.items.map((j) => j.job_id))
+      const arrived = jobs.some((j) => !known.has(j.job_id) && (!statuses.length || statuses.includes(j.status)))
+      if (arrived && offset === 0) queryClient.invalidateQueries({ queryKey })
+    }
+    // pushed rows are summaries (no result blob): refetch the open detail instead
+    if (detailJobId && jobs.some((j) => j.job_id === detailJobId)) {
+      queryClient.invalidateQueries({ queryKey: ['admin.job', detailJobId] })
+    }
+  })
+
   const { data, isLoading, error, refetch, isFetching } = useQuery({
     queryKey,
-    queryFn: () => listJobs({ status: status.trim() || undefined, limit, offset }),
-    refetchInterval: 2000,
+    queryFn: () => listJobs({ status: status.trim() || undefined, limit, offset, view: 'summary', total_mode: 'cached' }),
+    refetchInterval: streaming ? 30000 : 2000,
   })
 
-  const [detailJobId, setDetailJobId] = useState<string | null>(null)
   const detail = useQuery({
     queryKey: ['admin.job', detailJobId],
     queryFn: () => getJob(detailJobId as string),
     enabled: !!detailJobId,
-    refetchInterval: detailJobId ? 1500 : false,
+    refetchInterval: detailJobId && !streaming ? 1500 : false,
   })
 
   const items = data?.items ?? []
   const total = data?.total ?? 0
+  const totalLabel = data?.total_exact === false ? `약 ${total}` : `${total}`
 
   return (
     <Stack spacing={2}>
@@ -84,7 +108,7 @@ export default function JobsPage() {
               {isFetching ? '갱신 중...' : '새로고침'}
             </Button>
             <Typography variant="body2" color="text.secondary">
-              {isLoading ? '로딩...' : `총 ${total}개`}
+              {isLoading ? '로딩...' : `총 ${totalLabel}개`}
             </Typography>
           </Stack>
         </CardContent>
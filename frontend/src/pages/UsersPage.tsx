@@ -5,11 +5,13 @@ import {
   Button,
   Card,
   CardContent,
+  Checkbox,
   Chip,
   Dialog,
   DialogActions,
   DialogContent,
   DialogTitle,
+  FormControlLabel,
   Stack,
   Table,
   TableBody,
@@ -33,13 +35,15 @@ export default function UsersPage() {
   const qc = useQueryClient()
 
   const [q, setQ] = useState('')
+  // starts-with search on the indexed id/email columns: fast on large tables
+  const [prefix, setPrefix] = useState(false)
   const [offset, setOffset] = useState(0)
   const limit = 50
 
-  const queryKey = useMemo(() => ['admin.users', { q, limit, offset }], [q, limit, offset])
+  const queryKey = useMemo(() => ['admin.users', { q, prefix, limit, offset }], [q, prefix, limit, offset])
   const { data, isLoading, error } = useQuery({
     queryKey,
-    queryFn: () => listUsers({ q: q.trim() || undefined, limit, offset }),
+    queryFn: () => listUsers({ q: q.trim() || undefined, search: prefix ? 'prefix' : undefined, limit, offset }),
   })
 
   const [creditDialogOpen, setCreditDialogOpen] = useState(false)
@@ -88,6 +92,10 @@ export default function UsersPage() {
               onChange={(e) => { setOffset(0); setQ(e.target.value) }}
               sx={{ width: { xs: '100%', md: 420 } }}
             />
+            <FormControlLabel
+              control={<Checkbox size="small" checked={prefix} onChange={(e) => { setOffset(0); setPrefix(e.target.checked) }} />}
+              label="user_id/email 앞부분 일치"
+            />
             <Box sx={{ flex: 1 }} />
             <Typography variant="body2" color="text.secondary">
               {isLoading ? '로딩...' : `총 ${total}명`}